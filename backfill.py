@@ -0,0 +1,366 @@
+# backfill.py
+#
+# Historical backfill of activities, activity gear and activity weather, for
+# onboarding years of history the daily extractors don't cover (they only
+# fetch the current period, from EXTRACTOR_START_DATE on):
+#
+#   python backfill.py --start 2016-01-01                 # up to the day before EXTRACTOR_START_DATE
+#   python backfill.py --start 2016-01-01 --end 2020-12-31 --shard-days 30 --workers 8
+#
+# - The date range is split into shards of --shard-days; --workers shards are
+#   fetched in parallel (activity list, then gear and weather per activity)
+# - All workers share one request budget (--requests-per-second), so more
+#   workers never means more load on Garmin than the budget allows
+# - Each shard's bronze rows are written in one transaction, and the shard is
+#   recorded in backfill_shard_state in the same transaction; a rerun after a
+#   failure skips completed shards (--refetch fetches them again)
+# - Rows are flattened exactly like the daily extractors do, and every response
+#   is archived, so `--replay` rebuilds a backfill without API calls
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from garminconnect import Garmin
+from raw_archive import ArchivingApi, ReplayApi, replay_requested
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+STATE_TABLE = 'backfill_shard_state'
+
+# First day fetched by extract_activities.py and friends; they keep the rows before it
+EXTRACTOR_START_DATE = date(2025, 1, 1)
+
+DEFAULT_SHARD_DAYS = 90
+DEFAULT_WORKERS = 4
+
+# Requests per second across all workers; stays clear of Garmin's rate limits
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+
+
+def init_api():
+    """Initialize Garmin API using environment variables or stored tokens"""
+    if replay_requested():
+        # Rebuild bronze tables from the raw response archive, no API calls
+        return ReplayApi()
+
+    email = os.getenv('GARMIN_EMAIL')
+    password = os.getenv('GARMIN_PASSWORD')
+
+    if email and password:
+        # Use email/password authentication (for GitHub Actions)
+        api = Garmin(email=email, password=password)
+        api.login()
+    else:
+        # Use stored tokens (for local development)
+        tokenstore = os.path.expanduser("~/.garminconnect")
+        api = Garmin()
+        api.login(tokenstore)
+
+    # Archive every raw response so bronze tables can be rebuilt without the API
+    return ArchivingApi(api)
+
+
+# ========================================
+# Global request budget
+# ========================================
+
+class RateLimiter:
+    """Hands out request slots at most requests_per_second apart, shared by all threads"""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1 / requests_per_second if requests_per_second else 0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        time.sleep(slot - now)
+
+
+class RateLimitedApi:
+    """Wraps the API client so every `get_*` call waits for a slot from the shared RateLimiter"""
+
+    def __init__(self, api, limiter):
+        self._api = api
+        self._limiter = limiter
+
+    def __getattr__(self, name):
+        attr = getattr(self._api, name)
+        if not name.startswith('get_') or not callable(attr):
+            return attr
+
+        def limited_call(*args, **kwargs):
+            self._limiter.wait()
+            return attr(*args, **kwargs)
+
+        return limited_call
+
+
+# ========================================
+# Shards
+# ========================================
+
+def make_shards(start, end, shard_days):
+    """Consecutive (first day, last day) ranges covering start..end"""
+    shards = []
+    shard_start = start
+    while shard_start <= end:
+        shard_end = min(shard_start + timedelta(days=shard_days - 1), end)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end + timedelta(days=1)
+    return shards
+
+
+def load_completed_shards(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            shard_start TEXT,
+            shard_end TEXT,
+            activities INTEGER,
+            completed_at TEXT,
+            PRIMARY KEY (shard_start, shard_end)
+        )
+    """)
+    return {
+        (date.fromisoformat(shard_start), date.fromisoformat(shard_end))
+        for shard_start, shard_end in conn.execute(f"SELECT shard_start, shard_end FROM {STATE_TABLE}")
+    }
+
+
+# ========================================
+# Fetching (runs in the worker threads)
+# ========================================
+
+def fetch_details(fetch, activity_id):
+    """Gear or weather rows for one activity, tagged with its activityId"""
+    try:
+        result = fetch(activity_id)
+    except Exception:
+        return []  # Activity has no gear / no weather (indoor or no GPS)
+
+    if isinstance(result, dict):
+        result = [result]
+    rows = []
+    for row in result or []:
+        row['activityId'] = activity_id
+        rows.append(row)
+    return rows
+
+
+def fetch_shard(api, shard):
+    """
+    Fetch one shard: the activity list for its date range, then gear and weather per activity.
+
+    Returns:
+        dict: {'activities': [...], 'gear': [...], 'weather': [...], 'requests': int, 'seconds': float}
+    """
+    started = time.perf_counter()
+    shard_start, shard_end = shard
+
+    activities = api.get_activities_by_date(shard_start.isoformat(), shard_end.isoformat()) or []
+    gear = []
+    weather = []
+    for activity in activities:
+        gear.extend(fetch_details(api.get_activity_gear, activity['activityId']))
+        weather.extend(fetch_details(api.get_activity_weather, activity['activityId']))
+
+    return {
+        'activities': activities,
+        'gear': gear,
+        'weather': weather,
+        'requests': 1 + 2 * len(activities),
+        'seconds': time.perf_counter() - started,
+    }
+
+
+# ========================================
+# Loading (main thread, one transaction per shard)
+# ========================================
+
+def to_bronze_frame(rows):
+    """Flatten rows like the daily extractors: nested keys into plain columns, complex fields to JSON"""
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+
+    if 'activityType' in df.columns:
+        df['activityTypeKey'] = df['activityType'].apply(
+            lambda x: x.get('typeKey') if isinstance(x, dict) else None
+        )
+    if 'weatherTypeDTO' in df.columns:
+        df['weatherTypeDesc'] = df['weatherTypeDTO'].apply(
+            lambda x: x.get('desc') if isinstance(x, dict) else None
+        )
+
+    for col in df.columns:
+        if df[col].apply(lambda x: isinstance(x, (dict, list))).any():
+            df[col] = df[col].apply(
+                lambda x: json.dumps(x) if isinstance(x, (dict, list)) else x
+            )
+    return df
+
+
+def insert_rows(conn, table, df):
+    """Insert a frame into a bronze table, creating the table or adding missing columns first"""
+    if df.empty:
+        return
+
+    existing = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+    if not existing:
+        conn.execute(pd.io.sql.get_schema(df, table))
+    else:
+        for column in df.columns:
+            if column not in existing:
+                conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}"')
+
+    columns = ', '.join(f'"{column}"' for column in df.columns)
+    placeholders = ', '.join('?' * len(df.columns))
+    values = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    conn.executemany(f'INSERT INTO "{table}" ({columns}) VALUES ({placeholders})', values)
+
+
+def table_exists(conn, table):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+
+def write_shard(conn, shard, result):
+    """Replace the shard's date range in the bronze tables and mark it complete, all in one transaction"""
+    shard_start, shard_end = shard
+    # startTimeLocal is 'YYYY-MM-DD HH:MM:SS'; the range covers the whole last day
+    range_params = (shard_start.isoformat(), (shard_end + timedelta(days=1)).isoformat())
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if table_exists(conn, 'bronze_activities'):
+            for table in ('bronze_activity_gear', 'bronze_activity_weather'):
+                if table_exists(conn, table):
+                    conn.execute(f"""
+                        DELETE FROM {table} WHERE activityId IN (
+                            SELECT activityId FROM bronze_activities
+                            WHERE startTimeLocal >= ? AND startTimeLocal < ?
+                        )
+                    """, range_params)
+            conn.execute(
+                "DELETE FROM bronze_activities WHERE startTimeLocal >= ? AND startTimeLocal < ?",
+                range_params
+            )
+
+        insert_rows(conn, 'bronze_activities', to_bronze_frame(result['activities']))
+        insert_rows(conn, 'bronze_activity_gear', to_bronze_frame(result['gear']))
+        insert_rows(conn, 'bronze_activity_weather', to_bronze_frame(result['weather']))
+
+        conn.execute(
+            f"INSERT OR REPLACE INTO {STATE_TABLE} (shard_start, shard_end, activities, completed_at) VALUES (?, ?, ?, ?)",
+            (shard_start.isoformat(), shard_end.isoformat(), len(result['activities']),
+             datetime.now().isoformat(timespec='seconds'))
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m" if hours else f"{minutes}m{seconds:02d}s"
+
+
+# ========================================
+# Backfill
+# ========================================
+
+def backfill(start, end, shard_days, workers, requests_per_second, refetch):
+    print(f"🔄 Starting backfill of {start} → {end} at {datetime.now()}")
+
+    api = init_api()
+    replaying = getattr(api, 'replaying', False)
+    if not replaying:
+        api = RateLimitedApi(api, RateLimiter(requests_per_second))
+
+    # Autocommit mode: write_shard manages its own transactions
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    try:
+        completed = load_completed_shards(conn)
+        if refetch:
+            completed = set()
+        all_shards = make_shards(start, end, shard_days)
+        shards = [shard for shard in all_shards if shard not in completed]
+        skipped = len(all_shards) - len(shards)
+        print(f"  {len(shards)} shards of up to {shard_days} days to fetch"
+              + (f" ({skipped} already complete)" if skipped else ""))
+
+        started = time.perf_counter()
+        done = 0
+        failed = []
+        # Replayed responses come from local files; no point in threads there
+        with ThreadPoolExecutor(max_workers=1 if replaying else workers) as pool:
+            futures = {pool.submit(fetch_shard, api, shard): shard for shard in shards}
+            for future in as_completed(futures):
+                shard = futures[future]
+                label = f"{shard[0]} → {shard[1]}"
+                try:
+                    result = future.result()
+                    write_shard(conn, shard, result)
+                except Exception as e:
+                    failed.append(shard)
+                    print(f"  ❌ {label}: {e}")
+                    continue
+
+                done += 1
+                elapsed = time.perf_counter() - started
+                remaining = len(shards) - done - len(failed)
+                eta = elapsed / done * remaining
+                print(
+                    f"  ✅ {label}: {len(result['activities'])} activities, {result['requests']} requests "
+                    f"in {result['seconds']:.0f}s | {done + len(failed)}/{len(shards)} shards, "
+                    f"ETA {format_duration(eta)}"
+                )
+    finally:
+        conn.close()
+
+    if failed:
+        print(f"⚠️  {len(failed)} shard(s) failed; run the same command again to retry them")
+        return False
+
+    print(f"✅ Backfill complete at {datetime.now()}")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sharded parallel backfill of historical activities")
+    parser.add_argument('--start', type=date.fromisoformat, required=True, help="first day (YYYY-MM-DD)")
+    parser.add_argument('--end', type=date.fromisoformat, default=EXTRACTOR_START_DATE - timedelta(days=1),
+                        help=f"last day (default {EXTRACTOR_START_DATE - timedelta(days=1)}, "
+                             "the day before the daily extractors' period)")
+    parser.add_argument('--shard-days', type=int, default=DEFAULT_SHARD_DAYS,
+                        help=f"days per shard (default {DEFAULT_SHARD_DAYS})")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"shards fetched in parallel (default {DEFAULT_WORKERS})")
+    parser.add_argument('--requests-per-second', type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                        help=f"request budget shared by all workers, 0 = unlimited (default {DEFAULT_REQUESTS_PER_SECOND})")
+    parser.add_argument('--refetch', action='store_true', help="fetch shards that already completed again")
+    parser.add_argument('--replay', action='store_true', help="rebuild from the raw response archive")
+    args = parser.parse_args()
+
+    if args.start > args.end:
+        sys.exit(f"❌ --start {args.start} is after --end {args.end}")
+
+    try:
+        ok = backfill(args.start, args.end, args.shard_days, args.workers, args.requests_per_second, args.refetch)
+    except Exception as e:
+        print(f"❌ Error during backfill: {e}")
+        sys.exit(1)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,67 @@
+# build_spatial_index.py
+#
+# Maintains an SQLite R*Tree over activity start locations so the dashboard can
+# answer "activities near here" without scanning every activity.
+# Run after `dbt run` (reads stg_activities); only new or removed activities are touched.
+
+import os
+import sqlite3
+from datetime import datetime
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+INDEX_TABLE = 'activity_locations_rtree'
+
+
+def create_spatial_index(conn):
+    """Create the R*Tree if it doesn't exist yet (points stored as zero-size boxes)"""
+    # Auxiliary (+) columns keep the exact coordinates next to the 32-bit box bounds
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {INDEX_TABLE} USING rtree(
+            activity_id,
+            min_lat, max_lat,
+            min_lon, max_lon,
+            +latitude REAL,
+            +longitude REAL,
+            +start_date TEXT
+        )
+    """)
+
+
+def update_spatial_index(conn):
+    """Insert new activities with a start location and drop ones that no longer exist"""
+    create_spatial_index(conn)
+
+    inserted = conn.execute(f"""
+        INSERT INTO {INDEX_TABLE}
+            (activity_id, min_lat, max_lat, min_lon, max_lon, latitude, longitude, start_date)
+        SELECT
+            activity_id,
+            start_latitude, start_latitude,
+            start_longitude, start_longitude,
+            start_latitude, start_longitude, start_date
+        FROM stg_activities
+        WHERE start_latitude IS NOT NULL
+          AND start_longitude IS NOT NULL
+          AND activity_id NOT IN (SELECT activity_id FROM {INDEX_TABLE})
+    """).rowcount
+
+    removed = conn.execute(f"""
+        DELETE FROM {INDEX_TABLE}
+        WHERE activity_id NOT IN (
+            SELECT activity_id FROM stg_activities WHERE start_latitude IS NOT NULL
+        )
+    """).rowcount
+
+    conn.commit()
+    return inserted, removed
+
+
+if __name__ == "__main__":
+    print(f"🔄 Updating spatial index at {datetime.now()}")
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        inserted, removed = update_spatial_index(conn)
+        total = conn.execute(f"SELECT COUNT(*) FROM {INDEX_TABLE}").fetchone()[0]
+    finally:
+        conn.close()
+    print(f"✅ Spatial index: {inserted} added, {removed} removed, {total} located activities")
@@ -0,0 +1,186 @@
+# compute_training_load.py
+#
+# Training load engine: daily TRIMP load and its exponentially weighted
+# acute (ATL, 7 days) and chronic (CTL, 42 days) averages, plus form (TSB).
+#
+# The training_load_daily table is both the output mart and the engine state:
+# each run re-reads only the last LOOKBACK_DAYS of activities, restarts the
+# series from the first day whose load changed, and advances it to today.
+# Run after `dbt run` (reads stg_activities).
+
+import os
+import sqlite3
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+OUTPUT_TABLE = 'training_load_daily'
+
+ATL_DAYS = 7
+CTL_DAYS = 42
+
+# Late-synced activities within this window are picked up on the next run
+LOOKBACK_DAYS = 28
+
+# Edwards TRIMP: minutes in each HR zone weighted by the zone number
+ZONE_WEIGHTS = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+
+# Longest stretch computed in one closed-form pass; keeps decay**-k far from overflowing
+CHUNK_DAYS = 512
+
+
+def ewma(values, initial, time_constant):
+    """
+    Exponentially weighted moving average of a daily series, fully vectorised.
+
+    Solves y[t] = decay * y[t-1] + (1 - decay) * x[t] in closed form:
+    y[t] = decay**(t+1) * (y0 + (1 - decay) * sum(x[k] * decay**-(k+1) for k <= t))
+    """
+    decay = np.exp(-1.0 / time_constant)
+    alpha = 1.0 - decay
+    result = np.empty(len(values))
+
+    for start in range(0, len(values), CHUNK_DAYS):
+        chunk = values[start:start + CHUNK_DAYS]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        result[start:start + len(chunk)] = powers * (initial + alpha * np.cumsum(chunk / powers))
+        initial = result[start + len(chunk) - 1]
+
+    return result
+
+
+def load_daily_training_load(conn, since=None):
+    """Daily TRIMP load per date from stg_activities, optionally from a date on"""
+    query = """
+        SELECT
+            start_date,
+            COALESCE(hr_zone_1_seconds, 0) / 60.0 as zone_1_minutes,
+            COALESCE(hr_zone_2_seconds, 0) / 60.0 as zone_2_minutes,
+            COALESCE(hr_zone_3_seconds, 0) / 60.0 as zone_3_minutes,
+            COALESCE(hr_zone_4_seconds, 0) / 60.0 as zone_4_minutes,
+            COALESCE(hr_zone_5_seconds, 0) / 60.0 as zone_5_minutes,
+            COALESCE(duration_minutes, 0) as duration_minutes
+        FROM stg_activities
+    """
+    params = []
+    if since is not None:
+        query += " WHERE start_date >= ?"
+        params.append(since.isoformat())
+
+    df = pd.read_sql_query(query, conn, params=params)
+
+    zone_minutes = df[[f'zone_{i}_minutes' for i in range(1, 6)]].to_numpy()
+    trimp = zone_minutes @ ZONE_WEIGHTS
+    # Activities without HR zone data count as zone 1 for their whole duration
+    has_zones = zone_minutes.sum(axis=1) > 0
+    df['daily_load'] = np.where(has_zones, trimp, df['duration_minutes'].to_numpy() * ZONE_WEIGHTS[0])
+    df['activity_count'] = 1
+
+    return df.groupby('start_date')[['daily_load', 'activity_count']].sum()
+
+
+def create_output_table(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {OUTPUT_TABLE} (
+            load_date TEXT PRIMARY KEY,
+            year INTEGER,
+            daily_load REAL,
+            activity_count INTEGER,
+            atl REAL,
+            ctl REAL,
+            tsb REAL,
+            computed_at TEXT
+        )
+    """)
+    # The dashboard reads one year at a time, in date order
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{OUTPUT_TABLE}_year ON {OUTPUT_TABLE} (year, load_date)")
+
+
+def load_existing_series(conn):
+    """The previously computed series (empty on first run)"""
+    try:
+        return pd.read_sql_query(
+            f"SELECT load_date, daily_load, atl, ctl FROM {OUTPUT_TABLE} ORDER BY load_date",
+            conn,
+            index_col='load_date'
+        )
+    except Exception:
+        return pd.DataFrame(columns=['daily_load', 'atl', 'ctl'])
+
+
+def find_restart_date(existing, daily_loads, window_start):
+    """First day from which the stored series must be recomputed"""
+    if existing.empty:
+        return None
+
+    last_date = date.fromisoformat(existing.index[-1])
+    stored = existing.loc[existing.index >= window_start.isoformat(), 'daily_load']
+    fresh = daily_loads['daily_load'].reindex(stored.index, fill_value=0.0)
+
+    changed = stored.index[~np.isclose(stored.to_numpy(dtype=float), fresh.to_numpy(dtype=float))]
+    if len(changed) > 0:
+        return min(date.fromisoformat(changed[0]), last_date + timedelta(days=1))
+    return last_date + timedelta(days=1)
+
+
+def update_training_load(conn, today=None):
+    """Advance the training load series to today; returns the number of days (re)computed"""
+    today = today or date.today()
+    create_output_table(conn)
+    existing = load_existing_series(conn)
+
+    window_start = today - timedelta(days=LOOKBACK_DAYS)
+    if existing.empty:
+        daily_loads = load_daily_training_load(conn)
+        if daily_loads.empty:
+            return 0
+        restart = date.fromisoformat(daily_loads.index[0])
+        atl0 = ctl0 = 0.0
+    else:
+        window_start = min(window_start, date.fromisoformat(existing.index[-1]) + timedelta(days=1))
+        daily_loads = load_daily_training_load(conn, since=window_start)
+        restart = max(find_restart_date(existing, daily_loads, window_start), date.fromisoformat(existing.index[0]))
+        # Seed the EWMAs with the stored values of the day before the restart
+        previous = existing.loc[existing.index < restart.isoformat()]
+        atl0, ctl0 = (previous['atl'].iloc[-1], previous['ctl'].iloc[-1]) if not previous.empty else (0.0, 0.0)
+
+    if restart > today:
+        return 0
+
+    days = pd.date_range(restart, today, freq='D').strftime('%Y-%m-%d')
+    daily = daily_loads.reindex(days, fill_value=0)
+    loads = daily['daily_load'].to_numpy(dtype=float)
+
+    atl = ewma(loads, atl0, ATL_DAYS)
+    ctl = ewma(loads, ctl0, CTL_DAYS)
+    # Form on a given day = yesterday's fitness minus yesterday's fatigue
+    tsb = np.concatenate([[ctl0 - atl0], (ctl - atl)[:-1]])
+
+    df_series = pd.DataFrame({
+        'load_date': days,
+        'year': [int(d[:4]) for d in days],
+        'daily_load': loads,
+        'activity_count': daily['activity_count'].to_numpy(dtype=int),
+        'atl': atl,
+        'ctl': ctl,
+        'tsb': tsb,
+        'computed_at': datetime.now().isoformat(timespec='seconds'),
+    })
+
+    conn.execute(f"DELETE FROM {OUTPUT_TABLE} WHERE load_date >= ?", (restart.isoformat(),))
+    df_series.to_sql(OUTPUT_TABLE, conn, if_exists='append', index=False)
+    conn.commit()
+
+    return len(df_series)
+
+
+if __name__ == "__main__":
+    print(f"🔄 Updating training load at {datetime.now()}")
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        computed_days = update_training_load(conn)
+    finally:
+        conn.close()
+    print(f"✅ Training load: {computed_days} days computed")
@@ -0,0 +1,329 @@
+# check_query_plans.py
+#
+# Query-plan regression check for the dashboard and the marts. Fails (exit 1)
+# when a query starts to scan a whole table or sort through a temporary B-tree
+# where it didn't before:
+#
+#   1. Copies the built database and multiplies its rows (--scale) into a
+#      generated large database
+#   2. Runs every dashboard page with Streamlit's AppTest against it, cycling
+#      through each selectbox option, search and paging control, and records
+#      every SQL statement the load_* functions issue
+#   3. Runs EXPLAIN QUERY PLAN on those statements and on the compiled SQL of
+#      every mart (`dbt compile` first)
+#
+# Dashboard queries that read a HOT_TABLES table must not scan it without an
+# index or use a temporary B-tree; mart queries may only scan and sort where
+# they already did. Reviewed exceptions live in query_plan_baseline.json.
+#
+# Run from the repository root after `dbt run` and `dbt compile`:
+#   python dashboard/check_query_plans.py            # check
+#   python dashboard/check_query_plans.py --update   # accept the current plans
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from collections import Counter
+from datetime import datetime
+
+DASHBOARD_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+COMPILED_MARTS_DIR = os.path.join(
+    os.getenv('DBT_TARGET_PATH', 'garmin_analytics/target'), 'compiled', 'garmin_analytics', 'models', 'marts'
+)
+BASELINE_PATH = os.path.join(DASHBOARD_DIR, 'query_plan_baseline.json')
+
+# Tables that grow with every activity or day of history; dashboard reads of
+# these are the hot paths that have to stay index lookups
+HOT_TABLES = (
+    'activity_details',
+    'activity_daily_summary',
+    'activity_intensity_distribution',
+    'activity_locations_rtree',
+    'activity_progress_cumulative',
+    'personal_records_history',
+    'training_load_daily',
+    'wellness_daily',
+)
+
+# Generated database: every table without a unique key gets this many copies of its rows
+DEFAULT_SCALE = 20
+
+# Search term used on the search page
+SEARCH_TEXT = 'run'
+
+
+# ========================================
+# Generated database
+# ========================================
+
+def generate_large_database(source_path, target_path, scale):
+    """Copy the database and multiply the rows of every plain table by scale"""
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(target_path)
+    try:
+        source.backup(target)
+    finally:
+        source.close()
+
+    try:
+        tables = [
+            name for schema, name, table_type, *_ in target.execute("PRAGMA table_list")
+            if schema == 'main' and table_type == 'table' and not name.startswith('sqlite_')
+        ]
+        for table in tables:
+            # Duplicating rows would violate primary keys / unique indexes; those tables keep their size
+            has_unique_key = (
+                any(pk for *_, pk in target.execute(f'PRAGMA table_info("{table}")'))
+                or any(unique for _, _, unique, *_ in target.execute(f'PRAGMA index_list("{table}")'))
+            )
+            if has_unique_key:
+                continue
+            target.execute(f"""
+                INSERT INTO "{table}"
+                WITH RECURSIVE copies(n) AS (SELECT 2 UNION ALL SELECT n + 1 FROM copies WHERE n < ?)
+                SELECT "{table}".* FROM "{table}", copies
+            """, (scale,))
+        target.commit()
+        # No ANALYZE: the published database has no sqlite_stat1 either, so plans match production
+        return {table: target.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
+    finally:
+        target.close()
+
+
+# ========================================
+# Capturing dashboard queries
+# ========================================
+
+def dashboard_pages():
+    pages_dir = os.path.join(DASHBOARD_DIR, 'pages')
+    return ['app.py'] + [
+        os.path.join('pages', name) for name in sorted(os.listdir(pages_dir)) if name.endswith('.py')
+    ]
+
+
+def exercise_page(AppTest, page):
+    """Run a page, then every option of each selectbox and its search, paging and slider controls"""
+    app = AppTest.from_file(os.path.join(DASHBOARD_DIR, page), default_timeout=120).run()
+    if app.exception:
+        raise RuntimeError(f"{page} raised: {app.exception[0].value}")
+
+    for index in range(len(app.selectbox)):
+        for option in app.selectbox[index].options:
+            app.selectbox[index].select(option).run()
+        app.selectbox[index].select(app.selectbox[index].options[0]).run()
+
+    for text_input in app.text_input:
+        text_input.input(SEARCH_TEXT).run()
+
+    for slider in app.slider:
+        slider.set_value(slider.max).run()
+
+    # Paging: number inputs to their last value, then every enabled button once
+    for number_input in app.number_input:
+        if number_input.max is not None:
+            number_input.set_value(number_input.max).run()
+
+    for index in range(len(app.button)):
+        if not app.button[index].disabled:
+            app.button[index].click().run()
+
+    if app.exception:
+        raise RuntimeError(f"{page} raised: {app.exception[0].value}")
+
+
+def capture_dashboard_queries(db_path):
+    """
+    Run every dashboard page against db_path and record the SELECT statements it issues.
+
+    Returns:
+        dict: {SQL with bound values expanded: page that issued it}
+    """
+    from streamlit.testing.v1 import AppTest
+
+    os.environ['GARMIN_DASHBOARD_DB'] = db_path
+    # Every query has to reach SQLite, not the shared result cache
+    os.environ['GARMIN_RESULT_CACHE_MB'] = '0'
+    sys.path.insert(0, DASHBOARD_DIR)
+
+    statements = {}
+    current_page = None
+    connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(lambda sql: statements.setdefault(sql, current_page))
+        return conn
+
+    sqlite3.connect = tracing_connect
+    try:
+        for current_page in dashboard_pages():
+            print(f"  → {current_page}")
+            exercise_page(AppTest, current_page)
+    finally:
+        sqlite3.connect = connect
+
+    return {
+        sql: page for sql, page in statements.items()
+        if sql.lstrip().upper().startswith(('SELECT', 'WITH'))
+    }
+
+
+def normalize_sql(sql):
+    """Query shape without literal values, so one baseline entry covers every parameter value"""
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])', '?', sql)
+    sql = re.sub(r'\?(?:\s*,\s*\?)+', '?, ...', sql)
+    return ' '.join(sql.split())
+
+
+# ========================================
+# Plans
+# ========================================
+
+def query_plan(conn, sql):
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+def plan_tables(plan):
+    """Tables a plan reads"""
+    return {match.group(1) for line in plan for match in [re.match(r'(?:SCAN|SEARCH) (?:main\.)?(\w+)', line)] if match}
+
+
+def plan_problems(plan, tables=None):
+    """
+    Full table scans and temporary B-trees in a plan.
+
+    Scans that walk an index (ordered reads) or a virtual table's own index
+    don't count. With tables given, only scans of those tables count.
+    """
+    problems = []
+    for line in plan:
+        if 'USE TEMP B-TREE' in line:
+            problems.append(line)
+            continue
+        match = re.match(r'SCAN (?:main\.)?(\w+)', line)
+        if not match or 'USING' in line or 'VIRTUAL TABLE' in line or 'CONSTANT ROW' in line:
+            continue
+        if tables is None or match.group(1) in tables:
+            problems.append(line)
+    return problems
+
+
+def dashboard_plans(conn, statements, shadow_tables):
+    """{normalized SQL: (page, plan, problems)} for the dashboard queries that read a hot table"""
+    plans = {}
+    for sql, page in statements.items():
+        if any(re.search(rf"\b{table}\b", sql) for table in shadow_tables):
+            continue  # R*Tree / FTS5 reading their own storage
+        plan = query_plan(conn, sql)
+        if not plan_tables(plan) & set(HOT_TABLES):
+            continue  # only small tables (monthly marts, current records, ...)
+        plans.setdefault(normalize_sql(sql), (page, plan, plan_problems(plan, HOT_TABLES)))
+    return plans
+
+
+def mart_plans(conn, compiled_dir):
+    """{model: ('marts', plan, problems)} for the compiled SQL of every mart"""
+    if not os.path.isdir(compiled_dir):
+        sys.exit(f"❌ {compiled_dir} not found; run `dbt compile` in garmin_analytics first")
+
+    plans = {}
+    for name in sorted(os.listdir(compiled_dir)):
+        if not name.endswith('.sql'):
+            continue
+        with open(os.path.join(compiled_dir, name), encoding='utf-8') as f:
+            sql = f.read()
+        plan = query_plan(conn, sql)
+        plans[name[:-len('.sql')]] = ('marts', plan, plan_problems(plan))
+    return plans
+
+
+def find_regressions(plans, accepted):
+    """Problems a query has now that its baseline entry doesn't accept"""
+    regressions = {}
+    for key, (source, plan, problems) in plans.items():
+        new_problems = Counter(problems) - Counter(accepted.get(key, []))
+        if new_problems:
+            regressions[key] = (source, plan, list(new_problems.elements()))
+    return regressions
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {'dashboard': {}, 'marts': {}}
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_baseline(dashboard, marts):
+    baseline = {
+        section: {key: problems for key, (_, _, problems) in sorted(plans.items()) if problems}
+        for section, plans in (('dashboard', dashboard), ('marts', marts))
+    }
+    with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query-plan regression check for the dashboard and marts")
+    parser.add_argument('--scale', type=int, default=DEFAULT_SCALE,
+                        help=f"copies of each table's rows in the generated database (default {DEFAULT_SCALE})")
+    parser.add_argument('--update', action='store_true',
+                        help="accept the current plans as the new baseline")
+    args = parser.parse_args()
+
+    print(f"🔄 Checking query plans at {datetime.now()}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        large_db_path = os.path.join(tmp_dir, 'garmin_large.db')
+        row_counts = generate_large_database(DB_PATH, large_db_path, args.scale)
+        print(f"  Generated database: {sum(row_counts.values()):,} rows ({args.scale}x {DB_PATH})")
+
+        statements = capture_dashboard_queries(large_db_path)
+        print(f"  Captured {len(statements)} dashboard statements")
+
+        conn = sqlite3.connect(large_db_path)
+        try:
+            shadow_tables = [
+                name for schema, name, table_type, *_ in conn.execute("PRAGMA table_list")
+                if schema == 'main' and table_type == 'shadow'
+            ]
+            dashboard = dashboard_plans(conn, statements, shadow_tables)
+            marts = mart_plans(conn, COMPILED_MARTS_DIR)
+        finally:
+            conn.close()
+
+    if args.update:
+        write_baseline(dashboard, marts)
+        print(f"✅ Baseline written to {BASELINE_PATH} ({len(dashboard)} dashboard queries, {len(marts)} marts)")
+        return 0
+
+    baseline = load_baseline()
+    regressions = {
+        **find_regressions(dashboard, baseline.get('dashboard', {})),
+        **find_regressions(marts, baseline.get('marts', {})),
+    }
+
+    for key, (source, plan, new_problems) in regressions.items():
+        print(f"\n❌ {source}: {key}")
+        for line in new_problems:
+            print(f"     new: {line}")
+        print("   plan:")
+        for line in plan:
+            print(f"     {line}")
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} query plan(s) regressed; add an index, or review and run with --update")
+        return 1
+
+    print(f"✅ {len(dashboard)} dashboard queries and {len(marts)} marts keep their plans")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Shared database access for the dashboard pages
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import streamlit as st
+
+DB_PATH = os.getenv('GARMIN_DASHBOARD_DB', 'C:/Users/Svitlana/OneDrive/Garmin/data/garmin.db')
+
+
+def database_generation():
+    """
+    Identifies the database file currently in place.
+
+    The pipeline builds into a separate file and renames it over DB_PATH
+    (swap_database.py), so the file identity and modification time change
+    exactly when a new generation is published.
+
+    Returns:
+        tuple: (inode / file index, modification time in ns)
+    """
+    stat = os.stat(DB_PATH)
+    return stat.st_ino, stat.st_mtime_ns
+
+
+@st.cache_resource(max_entries=1)
+def open_database_connection(generation):
+    """
+    Opens a read-only connection to one generation of the database.
+
+    Why @st.cache_resource?
+    - This decorator tells Streamlit to create the connection ONCE and reuse it
+    - Without caching, a new connection would be created every time the page refreshes
+    - Database connections are "resources" that should be shared, not recreated
+    - This improves performance and prevents connection leaks
+
+    The generation is part of the cache key: when the pipeline swaps in a new
+    database, the next call opens a connection to it and (max_entries=1) drops
+    the one to the previous file. A connection never sees a file that is still
+    being written, so queries don't wait on locks or read half-built tables.
+
+    Parameters:
+        generation (tuple): Value of database_generation() for the file to open
+
+    Returns:
+        sqlite3.Connection: Database connection object
+    """
+    uri = Path(DB_PATH).resolve().as_uri() + '?mode=ro'
+    return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+
+def get_database_connection():
+    """
+    Returns the connection to the current database generation.
+
+    Living in its own module lets every page share the same cached connection.
+
+    Returns:
+        sqlite3.Connection: Database connection object
+    """
+    return open_database_connection(database_generation())
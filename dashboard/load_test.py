@@ -0,0 +1,294 @@
+# load_test.py
+#
+# Headless load test of the Overview page (app.py) with many concurrent users.
+#
+# For every session count a real `streamlit run` server is started against a
+# generated large database (see check_query_plans.py), so all sessions share
+# its st.cache_data entries and the one cached sqlite3 connection from
+# get_database_connection(), exactly as in production. Each simulated session
+# is a WebSocket client speaking Streamlit's own protocol, like a browser tab:
+# it opens the page, then changes the year, month and activity-type filters in
+# a random (seeded) sequence.
+#
+# Reported per session count: p50/p95/p99 rerun latency (filter change sent ->
+# script finished), reruns per second and the server's peak RSS. A fresh
+# server per level gives clean caches and an unmixed peak RSS.
+#
+# Run from the repository root after `dbt run` (needs the `websockets` package):
+#   python dashboard/load_test.py --sessions 1 10 50
+#   python dashboard/load_test.py --sessions 50 --max-p95-ms 2000   # exit 1 above the budget
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime
+
+DASHBOARD_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+PAGE = os.path.join(DASHBOARD_DIR, 'app.py')
+
+DEFAULT_SESSIONS = [1, 10, 50]
+DEFAULT_SCALE = 20
+
+# Filter changes per session after the first page load
+DEFAULT_STEPS = 20
+
+# Average pause between filter changes (s); 0 = as fast as possible
+DEFAULT_THINK_TIME = 0.0
+
+FILTER_LABELS = ("Select Year", "Select Month", "Select Activity Type")
+
+SERVER_START_TIMEOUT = 60
+RERUN_TIMEOUT = 300
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb(pid):
+    """Peak resident set size of a running process in MB (None where it can't be read)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+        # Windows reports the peak working set
+        return psutil.Process(pid).memory_info().peak_wset / 1024 / 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+# ========================================
+# Streamlit server
+# ========================================
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(db_path, port, cache_dir):
+    server = subprocess.Popen(
+        [
+            sys.executable, '-m', 'streamlit', 'run', PAGE,
+            '--server.headless', 'true',
+            '--server.port', str(port),
+            '--server.address', '127.0.0.1',
+            '--server.fileWatcherType', 'none',
+            '--browser.gatherUsageStats', 'false',
+        ],
+        env=dict(os.environ, GARMIN_DASHBOARD_DB=db_path, GARMIN_RESULT_CACHE_DIR=cache_dir),
+        cwd=DASHBOARD_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Streamlit server exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.2)
+
+    server.terminate()
+    raise RuntimeError("Streamlit server did not start in time")
+
+
+# ========================================
+# Simulated sessions
+# ========================================
+
+class Session:
+    """One browser tab: a WebSocket connection that reruns the page with widget states"""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.selectboxes = {}  # label -> (widget id, options)
+        self.widget_values = {}  # widget id -> selected option
+
+    async def rerun(self):
+        """Rerun the page with the current widget values; returns (seconds, exception messages)"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        message = BackMsg()
+        message.rerun_script.query_string = ''
+        for widget_id, value in self.widget_values.items():
+            widget = message.rerun_script.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.string_value = value
+
+        started = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+
+        exceptions = []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.websocket.recv(), RERUN_TIMEOUT))
+            kind = forward.WhichOneof('type')
+
+            if kind == 'delta' and forward.delta.WhichOneof('type') == 'new_element':
+                element = forward.delta.new_element
+                if element.WhichOneof('type') == 'selectbox':
+                    selectbox = element.selectbox
+                    self.selectboxes[selectbox.label] = (selectbox.id, list(selectbox.options))
+                    self.widget_values.setdefault(selectbox.id, selectbox.options[selectbox.default])
+                elif element.WhichOneof('type') == 'exception':
+                    exceptions.append(element.exception.message)
+
+            elif kind == 'script_finished' and forward.script_finished in (
+                ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_WITH_COMPILE_ERROR
+            ):
+                return time.perf_counter() - started, exceptions
+
+    def choose_filter(self, rng):
+        """Set a random filter to a random option"""
+        widget_id, options = self.selectboxes[rng.choice(FILTER_LABELS)]
+        self.widget_values[widget_id] = rng.choice(options)
+
+
+async def run_session(url, seed, steps, think_time, latencies, errors):
+    """One user: open the page, then change a random filter steps times"""
+    import websockets
+
+    rng = random.Random(seed)
+    try:
+        async with websockets.connect(url, subprotocols=['streamlit'], max_size=None) as websocket:
+            session = Session(websocket)
+            for step in range(steps + 1):
+                if step and think_time:
+                    await asyncio.sleep(rng.uniform(0, 2 * think_time))
+                if step:
+                    session.choose_filter(rng)
+
+                seconds, exceptions = await session.rerun()
+                latencies.append(seconds)
+                if exceptions:
+                    errors.extend(exceptions)
+                    return
+    except Exception as e:
+        errors.append(repr(e))
+
+
+async def run_sessions(url, sessions, steps, think_time, seed):
+    latencies = []
+    errors = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_session(url, seed + index, steps, think_time, latencies, errors)
+        for index in range(sessions)
+    ))
+    return latencies, errors, time.perf_counter() - started
+
+
+def run_level(db_path, sessions, args):
+    """Start a fresh server, run `sessions` concurrent sessions against it and measure"""
+    port = free_port()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        server = start_server(db_path, port, cache_dir)
+        try:
+            latencies, errors, elapsed = asyncio.run(run_sessions(
+                f'ws://127.0.0.1:{port}/_stcore/stream', sessions, args.steps, args.think_time, args.seed
+            ))
+            peak_rss = peak_rss_mb(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'p50_ms': percentile(latencies, 50) * 1000 if latencies else None,
+        'p95_ms': percentile(latencies, 95) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 99) * 1000 if latencies else None,
+        'reruns_per_second': len(latencies) / elapsed,
+        'peak_rss_mb': peak_rss,
+    }
+
+
+def print_report(results):
+    def number(value, digits=0):
+        return 'n/a' if value is None else f"{value:.{digits}f}"
+
+    print(f"\n{'sessions':>8} {'reruns':>7} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'reruns/s':>9} {'peak RSS MB':>12}")
+    for r in results:
+        print(
+            f"{r['sessions']:>8} {r['reruns']:>7} {r['errors']:>6} "
+            f"{number(r['p50_ms']):>8} {number(r['p95_ms']):>8} {number(r['p99_ms']):>8} "
+            f"{number(r['reruns_per_second'], 1):>9} {number(r['peak_rss_mb']):>12}"
+        )
+    for r in results:
+        if r['first_error']:
+            print(f"\n⚠️  {r['sessions']} sessions, first error: {r['first_error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test of the dashboard Overview page")
+    parser.add_argument('--sessions', type=int, nargs='+', default=DEFAULT_SESSIONS,
+                        help=f"concurrent session counts to test (default {' '.join(map(str, DEFAULT_SESSIONS))})")
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS,
+                        help=f"filter changes per session (default {DEFAULT_STEPS})")
+    parser.add_argument('--think-time', type=float, default=DEFAULT_THINK_TIME,
+                        help="average pause between filter changes in seconds (default 0)")
+    parser.add_argument('--scale', type=int, default=DEFAULT_SCALE,
+                        help=f"copies of each table's rows in the generated database (default {DEFAULT_SCALE})")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the filter sequences")
+    parser.add_argument('--max-p95-ms', type=float,
+                        help="exit with an error when any level's p95 latency exceeds this")
+    parser.add_argument('--json', metavar='PATH', help="also write the results as JSON")
+    args = parser.parse_args()
+
+    from check_query_plans import generate_large_database
+
+    print(f"🔄 Load testing the dashboard at {datetime.now()}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'garmin_large.db')
+        row_counts = generate_large_database(DB_PATH, db_path, args.scale)
+        print(f"  Generated database: {sum(row_counts.values()):,} rows ({args.scale}x {DB_PATH})")
+
+        results = []
+        for sessions in args.sessions:
+            print(f"  → {sessions} concurrent sessions x {args.steps} filter changes")
+            results.append(run_level(db_path, sessions, args))
+
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    failed = any(r['errors'] for r in results)
+    if args.max_p95_ms is not None:
+        failed = failed or any(r['p95_ms'] is None or r['p95_ms'] > args.max_p95_ms for r in results)
+    if failed:
+        print("\n❌ Load test failed (errors or p95 over budget)")
+        return 1
+
+    print("\n✅ Load test complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
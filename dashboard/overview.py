@@ -0,0 +1,367 @@
+"""
+Overview page building blocks: KPI queries and chart figures
+
+Kept free of Streamlit so the same numbers and figures serve both the live
+Overview page (app.py) and the static snapshot (render_snapshot.py).
+"""
+
+from datetime import date
+
+from theme import CATEGORY_COLORS
+
+# Columns the monthly charts use, as compact dtypes: st.cache_data keeps a copy
+# of every frame per parameter combination, so object strings and float64
+# everywhere add up with a longer history
+MONTHLY_KPI_DTYPES = {
+    'year': 'int16',
+    'month': 'int16',
+    'year_month': 'category',
+    'activity_category': 'category',
+    'activity_count': 'int32',
+    'total_duration_hours': 'float32',
+}
+
+# Columns the calendar heatmap uses; activity_date is parsed to a datetime on read
+DAILY_SUMMARY_DTYPES = {
+    'total_duration_minutes': 'float32',
+    'total_duration_formatted': 'category',
+    'total_distance_km': 'float32',
+}
+
+
+def query_filter_options(conn):
+    """
+    Values offered by the year, month and category filters.
+
+    Returns:
+        tuple: (years most recent first, months 1-12 with data, sorted categories)
+    """
+    years = [row[0] for row in conn.execute(
+        "SELECT DISTINCT year FROM activity_kpis_monthly ORDER BY year DESC"
+    )]
+    months = [row[0] for row in conn.execute(
+        "SELECT DISTINCT month FROM activity_kpis_monthly ORDER BY month"
+    )]
+    categories = [row[0] for row in conn.execute(
+        "SELECT DISTINCT activity_category FROM activity_kpis_monthly ORDER BY activity_category"
+    )]
+    return years, months, categories
+
+
+def query_kpi_totals(conn, year=None, month=None, activity_category=None):
+    """
+    KPI card metrics for the selected filters, summed in SQL.
+
+    Returns:
+        tuple: (activity count, distance km, duration hours, calories)
+    """
+    query = """
+        SELECT
+            COALESCE(SUM(activity_count), 0),
+            COALESCE(SUM(total_distance_km), 0),
+            COALESCE(SUM(total_duration_hours), 0),
+            COALESCE(SUM(total_calories), 0)
+        FROM activity_kpis_monthly
+        WHERE 1=1
+    """
+    params = []
+
+    if year:
+        query += " AND year = ?"
+        params.append(year)
+
+    if month:
+        query += " AND month = ?"
+        params.append(month)
+
+    if activity_category:
+        query += " AND activity_category = ?"
+        params.append(activity_category)
+
+    return conn.execute(query, params).fetchone()
+
+
+def query_avg_hours_per_week(conn, year=None, month=None):
+    """
+    Average training hours per week (Monday-based weeks with any activity),
+    from the daily summary mart.
+
+    Returns:
+        float: Average hours per week (0 if no activities)
+    """
+    query = """
+        SELECT AVG(week_minutes) / 60.0 FROM (
+            SELECT SUM(total_duration_minutes) as week_minutes
+            FROM activity_daily_summary
+            WHERE 1=1
+    """
+    params = []
+
+    if year:
+        query += " AND year = ?"
+        params.append(year)
+
+    if month:
+        query += " AND month = ?"
+        params.append(month)
+
+    query += " GROUP BY year, strftime('%W', activity_date))"
+
+    return conn.execute(query, params).fetchone()[0] or 0
+
+
+def query_monthly_kpis(conn, year=None):
+    """
+    Rows of the activity_kpis_monthly mart, most recent month first.
+
+    Returns:
+        pd.DataFrame: MONTHLY_KPI_DTYPES columns per month and activity category
+    """
+    from result_cache import cached_query
+
+    query = f"SELECT {', '.join(MONTHLY_KPI_DTYPES)} FROM activity_kpis_monthly"
+    params = []
+
+    if year:
+        query += " WHERE year = ?"
+        params.append(year)
+
+    query += " ORDER BY year DESC, month DESC"
+
+    return cached_query(conn, query, params, dtype=MONTHLY_KPI_DTYPES)
+
+
+def query_daily_summary(conn, year=None):
+    """
+    Rows of the activity_daily_summary mart, most recent day first.
+
+    Returns:
+        pd.DataFrame: activity_date (datetime) and the DAILY_SUMMARY_DTYPES columns
+    """
+    from result_cache import cached_query
+
+    query = f"SELECT activity_date, {', '.join(DAILY_SUMMARY_DTYPES)} FROM activity_daily_summary"
+    params = []
+
+    if year:
+        query += " WHERE year = ?"
+        params.append(year)
+
+    query += " ORDER BY activity_date DESC"
+
+    return cached_query(conn, query, params, parse_dates=['activity_date'], dtype=DAILY_SUMMARY_DTYPES)
+
+
+def format_duration(hours):
+    """Format hours as XXh XXm (e.g. 123.5 → 123h 30m)"""
+    whole_hours = int(hours)
+    minutes = int((hours - whole_hours) * 60)
+    return f"{whole_hours}h {minutes}m"
+
+
+def build_calendar_heatmap(df_daily, heatmap_year):
+    """
+    Builds the training calendar heatmap for one year.
+
+    Parameters:
+        df_daily (pd.DataFrame): activity_daily_summary rows for the year
+        heatmap_year (int): Year to draw (days without activities are shown empty)
+
+    Returns:
+        go.Figure: Heatmap with one cell per day (weeks × weekdays)
+    """
+    import pandas as pd
+    import plotly.graph_objects as go
+
+    # Create a calendar heatmap using Plotly
+    # We'll create a grid where each cell represents a day
+
+    # Create all dates for the year to show empty days too
+    start_date = date(heatmap_year, 1, 1)
+    end_date = date(heatmap_year, 12, 31)
+    all_dates = pd.date_range(start_date, end_date, freq='D')
+
+    # Create a complete dataframe with all dates
+    df_calendar = pd.DataFrame({'activity_date': all_dates})
+    df_calendar = df_calendar.merge(df_daily, on='activity_date', how='left')
+
+    # Fill NaN values with 0 for days without activities
+    df_calendar['total_duration_minutes'] = df_calendar['total_duration_minutes'].fillna(0)
+    df_calendar['total_duration_formatted'] = (
+        df_calendar['total_duration_formatted'].cat.add_categories('0h 00m').fillna('0h 00m')
+    )
+
+    # Add week number and day of week for positioning
+    df_calendar['week'] = df_calendar['activity_date'].dt.isocalendar().week
+    df_calendar['day_of_week'] = df_calendar['activity_date'].dt.dayofweek  # Monday=0, Sunday=6
+    df_calendar['day_name'] = df_calendar['activity_date'].dt.strftime('%a')
+    df_calendar['date_str'] = df_calendar['activity_date'].dt.strftime('%b %d')
+    df_calendar['month'] = df_calendar['activity_date'].dt.month
+    df_calendar['month_name'] = df_calendar['activity_date'].dt.strftime('%B')
+
+    # Create custom hover text
+    df_calendar['hover_text'] = df_calendar.apply(
+        lambda row: f"{row['date_str']}<br>Duration: {row['total_duration_formatted']}<br>Distance: {row['total_distance_km']:.1f} km"
+        if row['total_duration_minutes'] > 0
+        else f"{row['date_str']}<br>No activity",
+        axis=1
+    )
+
+    # Create the heatmap
+    fig = go.Figure(data=go.Heatmap(
+        x=df_calendar['week'],
+        y=df_calendar['day_of_week'],
+        z=df_calendar['total_duration_minutes'],
+        text=df_calendar['hover_text'],
+        hovertemplate='%{text}<extra></extra>',
+        colorscale=[
+            [0, '#171821'],      # No activity - background color
+            [0.01, '#4d3e50'],   # Very light activity - deep purple
+            [0.3, '#7b6e7f'],    # Light activity - dark purple
+            [0.6, '#9c526d'],    # Moderate activity - magenta
+            [1.0, '#a887ce']     # High activity - primary purple
+        ],
+        showscale=True,
+        colorbar=dict(
+            title=dict(
+                text="Duration<br>(minutes)",
+                side="right",
+                font=dict(color='#ffffff')
+            ),
+            tickmode="linear",
+            tick0=0,
+            dtick=30,
+            tickfont=dict(color='#ffffff')
+        ),
+        xgap=2,  # Add horizontal gap between cells (border effect)
+        ygap=2   # Add vertical gap between cells (border effect)
+    ))
+
+    # Add month labels at the top
+    # Get first week of each month
+    month_labels = df_calendar.groupby('month').agg({
+        'week': 'first',
+        'month_name': 'first'
+    }).reset_index()
+
+    # Add month annotations at the top
+    for _, row in month_labels.iterrows():
+        fig.add_annotation(
+            x=row['week'],
+            y=-1,  # Position above the heatmap (negative y value puts it at top due to reversed axis)
+            text=row['month_name'],
+            showarrow=False,
+            font=dict(color='#ffffff', size=12),  # White color for month labels
+            xanchor='left'
+        )
+
+    # Update layout
+    fig.update_layout(
+        title=dict(
+            text='Training Calendar',
+            font=dict(color='#a887ce', size=20),
+            x=0,  # Left align
+            xanchor='left'
+        ),
+        xaxis=dict(
+            title='',  # Remove axis title
+            showticklabels=False,  # Hide tick labels
+            showgrid=False,  # Hide grid
+            zeroline=False,  # Hide zero line
+            showline=False,  # Hide axis line
+            visible=False  # Hide entire x-axis including ticks
+        ),
+        yaxis=dict(
+            title=dict(
+                text="Day of Week",
+                font=dict(color='#ffffff')
+            ),
+            tickfont=dict(color='#ffffff'),
+            tickmode='array',
+            tickvals=[0, 1, 2, 3, 4, 5, 6],
+            ticktext=['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+            gridcolor='#292631',
+            ticks='',  # Hide tick marks
+            showline=False,  # Hide axis line
+            autorange='reversed'  # Reverse y-axis to have Monday at top
+        ),
+        plot_bgcolor='#171821',
+        paper_bgcolor='#171821',
+        height=400,
+        margin=dict(l=100, r=100, t=40, b=80)  # Reduced top margin from 80 to 40
+    )
+
+    return fig
+
+
+def build_monthly_bar_chart(filtered_df, value_column, y_title, hovertemplate):
+    """
+    Builds a stacked bar chart of a monthly KPI per activity category.
+
+    Parameters:
+        filtered_df (pd.DataFrame): activity_kpis_monthly rows to plot
+        value_column (str): KPI column to stack (e.g. 'total_duration_hours')
+        y_title (str): Y-axis title
+        hovertemplate (str): Plotly hover template for each bar
+
+    Returns:
+        go.Figure: Stacked bar chart with months on the x-axis
+    """
+    import plotly.graph_objects as go
+
+    # Pivot data to get categories as columns
+    pivot = filtered_df.pivot_table(
+        index='year_month',
+        columns='activity_category',
+        values=value_column,
+        aggfunc='sum',
+        fill_value=0,
+        observed=True  # only categories left after filtering
+    ).reset_index()
+
+    # Create stacked bar chart
+    fig = go.Figure()
+
+    # Add a bar for each category
+    for category in pivot.columns[1:]:  # Skip year_month
+        if category in CATEGORY_COLORS:
+            fig.add_trace(go.Bar(
+                name=category,
+                x=pivot['year_month'],
+                y=pivot[category],
+                marker_color=CATEGORY_COLORS[category],
+                hovertemplate=hovertemplate
+            ))
+
+    fig.update_layout(
+        barmode='stack',
+        xaxis=dict(
+            title=dict(text='Month', font=dict(color='#ffffff')),
+            tickfont=dict(color='#ffffff'),
+            gridcolor='#292631',
+            showgrid=False,
+            type='category'
+        ),
+        yaxis=dict(
+            title=dict(text=y_title, font=dict(color='#ffffff')),
+            tickfont=dict(color='#ffffff'),
+            gridcolor='#292631',
+            showgrid=False
+        ),
+        plot_bgcolor='#171821',
+        paper_bgcolor='#171821',
+        legend=dict(
+            font=dict(color='#ffffff'),
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        margin=dict(l=60, r=20, t=20, b=60),
+        height=400,
+        hoverlabel=dict(
+            bgcolor='#ffffff',
+            font_size=12,
+            font_family="sans-serif",
+            font_color='#7b6e7f'
+        )
+    )
+
+    return fig
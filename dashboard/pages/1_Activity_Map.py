@@ -0,0 +1,148 @@
+"""
+Activity Map
+Where activities started, clustered server-side so the map stays responsive
+"""
+
+import sqlite3
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme
+from spatial import activities_within_radius, clustered_locations, location_extent
+
+st.set_page_config(page_title="Activity Map", page_icon="🗺️", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300)
+def load_location_extent():
+    """Bounding box of all indexed activity start locations (None if not indexed yet)"""
+    try:
+        return location_extent(conn)
+    except sqlite3.OperationalError:
+        # build_spatial_index.py hasn't created the index yet
+        return None
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_clusters(min_lat, min_lon, max_lat, max_lon, grid_size):
+    """
+    Loads clustered activity locations for a bounding box.
+
+    Clustering runs inside SQLite on the R*Tree, so at most grid_size² points
+    reach the browser regardless of how many activities there are.
+    """
+    return clustered_locations(conn, min_lat, min_lon, max_lat, max_lon, grid_size)
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_nearby_activities(lat, lon, radius_km):
+    """
+    Loads activities that started within radius_km of a point, with their details.
+
+    Parameters:
+        lat (float): Latitude of the search center
+        lon (float): Longitude of the search center
+        radius_km (float): Search radius in kilometers
+
+    Returns:
+        pd.DataFrame: Matching activities, nearest first
+    """
+    nearby = activities_within_radius(conn, lat, lon, radius_km)
+    if nearby.empty:
+        return nearby
+
+    placeholders = ','.join('?' * len(nearby))
+    details = cached_query(
+        conn,
+        f"""
+        SELECT activity_id, activity_name, activity_category, start_date, distance_km, duration_formatted
+        FROM activity_details
+        WHERE activity_id IN ({placeholders})
+        """,
+        [int(activity_id) for activity_id in nearby['activity_id']]
+    )
+    return nearby[['activity_id', 'distance_from_point_km']].merge(details, on='activity_id')
+
+# ============================================================================
+# MAP
+# ============================================================================
+
+st.title("Activity Map")
+
+extent = load_location_extent()
+if extent is None:
+    st.info("No activity locations indexed yet. Run build_spatial_index.py after dbt run.")
+    st.stop()
+
+min_lat, min_lon, max_lat, max_lon = extent
+
+grid_size = st.sidebar.slider("Cluster grid resolution", min_value=8, max_value=256, value=64, step=8)
+df_clusters = load_clusters(min_lat, min_lon, max_lat, max_lon, grid_size)
+
+fig = go.Figure(go.Scattermap(
+    lat=df_clusters['latitude'],
+    lon=df_clusters['longitude'],
+    mode='markers',
+    marker=dict(
+        # Marker area grows with the number of activities in the cluster
+        size=(df_clusters['activity_count'] ** 0.5 * 6).clip(lower=6, upper=40),
+        color='#a887ce',
+        opacity=0.8
+    ),
+    text=df_clusters.apply(
+        lambda row: f"{int(row['activity_count'])} activities<br>{row['first_date']} – {row['last_date']}",
+        axis=1
+    ),
+    hovertemplate='%{text}<extra></extra>'
+))
+
+fig.update_layout(
+    map=dict(
+        style='open-street-map',
+        center=dict(lat=(min_lat + max_lat) / 2, lon=(min_lon + max_lon) / 2),
+        zoom=2
+    ),
+    paper_bgcolor='#171821',
+    margin=dict(l=0, r=0, t=0, b=0),
+    height=550
+)
+
+st.plotly_chart(fig, use_container_width=True)
+
+# ============================================================================
+# ACTIVITIES NEAR A LOCATION
+# ============================================================================
+
+st.markdown("---")
+st.subheader("Activities Near a Location")
+
+# Default the search to the busiest cluster
+busiest = df_clusters.loc[df_clusters['activity_count'].idxmax()]
+
+col_lat, col_lon, col_radius = st.columns(3)
+with col_lat:
+    search_lat = st.number_input("Latitude", value=float(round(busiest['latitude'], 4)), format="%.4f")
+with col_lon:
+    search_lon = st.number_input("Longitude", value=float(round(busiest['longitude'], 4)), format="%.4f")
+with col_radius:
+    radius_km = st.slider("Radius (km)", min_value=1, max_value=100, value=10)
+
+df_nearby = load_nearby_activities(search_lat, search_lon, radius_km)
+
+if df_nearby.empty:
+    st.info("No activities started within this radius.")
+else:
+    st.dataframe(
+        df_nearby.rename(columns={'distance_from_point_km': 'km_from_point'}).round({'km_from_point': 2}),
+        use_container_width=True,
+        hide_index=True
+    )
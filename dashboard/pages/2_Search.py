@@ -0,0 +1,99 @@
+"""
+Activity Search
+Ranked full-text search over activity names, locations, types and gear
+"""
+
+import math
+
+import streamlit as st
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme
+
+st.set_page_config(page_title="Activity Search", page_icon="🔎", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+PAGE_SIZE = 25
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+def to_match_expression(search_text):
+    """
+    Turns free text into an FTS5 query: every word must match, as a prefix.
+
+    Words are quoted so characters like '-' or ':' are searched literally
+    instead of being parsed as FTS5 operators.
+    """
+    terms = [term.replace('"', '""') for term in search_text.split()]
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def count_matches(match_expression):
+    """Number of activities matching an FTS5 query"""
+    query = "SELECT COUNT(*) FROM activity_search WHERE activity_search MATCH ?"
+    return conn.execute(query, (match_expression,)).fetchone()[0]
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def search_activities(match_expression, page):
+    """
+    Loads one page of search results straight from the activity_search FTS5 index.
+
+    Results are ranked by BM25 with matches in the activity name weighted highest,
+    then location, gear and activity type.
+
+    Parameters:
+        match_expression (str): FTS5 query built by to_match_expression()
+        page (int): 1-based page number
+
+    Returns:
+        pd.DataFrame: At most PAGE_SIZE matching activities, best match first
+    """
+    query = """
+        SELECT
+            activity_id,
+            start_date,
+            activity_name,
+            activity_category,
+            location_name,
+            gear_name,
+            distance_km,
+            duration_formatted
+        FROM activity_search
+        WHERE activity_search MATCH ?
+        -- Column weights: activity_name, location_name, activity_type_key, gear_name
+        ORDER BY bm25(activity_search, 10.0, 5.0, 1.0, 2.0)
+        LIMIT ? OFFSET ?
+    """
+    return cached_query(conn, query, (match_expression, PAGE_SIZE, (page - 1) * PAGE_SIZE))
+
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+st.title("Activity Search")
+
+search_text = st.text_input("Search activities", placeholder="e.g. Jönköping, intervals, trail, Megablast")
+
+if search_text.strip():
+    match_expression = to_match_expression(search_text)
+    total_matches = count_matches(match_expression)
+
+    if total_matches == 0:
+        st.info("No activities match your search.")
+    else:
+        page_count = math.ceil(total_matches / PAGE_SIZE)
+        page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+
+        st.caption(f"{total_matches:,} matching activities")
+        st.dataframe(
+            search_activities(match_expression, int(page)),
+            use_container_width=True,
+            hide_index=True
+        )
@@ -0,0 +1,182 @@
+"""
+Activity Explorer
+Paginated activity table: filtering, sorting and paging all happen in SQLite
+"""
+
+import streamlit as st
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme
+
+st.set_page_config(page_title="Activity Explorer", page_icon="📋", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+PAGE_SIZE = 50
+
+# Sort key expression and direction; each expression (plus activity_id as a
+# tie-breaker) has a matching index created by the activity_details post-hooks
+SORT_OPTIONS = {
+    'Newest first': ('start_date', 'DESC'),
+    'Oldest first': ('start_date', 'ASC'),
+    'Longest distance': ('IFNULL(distance_km, 0)', 'DESC'),
+    'Longest duration': ('IFNULL(duration_minutes, 0)', 'DESC'),
+}
+
+# Columns the explorer may project; anything else is rejected
+AVAILABLE_COLUMNS = [
+    'start_date', 'activity_name', 'activity_category', 'activity_type_key', 'location_name',
+    'distance_km', 'duration_formatted', 'avg_pace_formatted', 'avg_speed_kmh', 'elevation_gain_m',
+    'avg_heart_rate', 'max_heart_rate', 'total_calories', 'aerobic_training_effect',
+    'anaerobic_training_effect', 'temperature_c', 'weather_condition', 'gear_name',
+]
+DEFAULT_COLUMNS = ['start_date', 'activity_name', 'activity_category', 'distance_km', 'duration_formatted', 'avg_pace_formatted']
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300)
+def load_filter_options():
+    """Years and categories for the filter dropdowns, from the small monthly KPI mart"""
+    return cached_query(conn, "SELECT DISTINCT year, activity_category FROM activity_kpis_monthly")
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_activity_page(columns, sort, cursor=None, year=None, month=None, activity_category=None):
+    """
+    Loads one page of activities from the activity_details mart using keyset pagination.
+
+    Instead of OFFSET (which re-reads every skipped row), each page continues
+    strictly after the sort key of the previous page's last row, so every page
+    is a short index range scan no matter how deep into history it is.
+
+    Parameters:
+        columns (tuple): Columns to return (projection), from AVAILABLE_COLUMNS
+        sort (str): Key of SORT_OPTIONS
+        cursor (tuple, optional): (sort_key, activity_id) of the previous page's last row
+        year (int, optional): Filter activities for a specific year
+        month (int, optional): Filter activities for a specific month
+        activity_category (str, optional): Filter activities by category
+
+    Returns:
+        pd.DataFrame: Up to PAGE_SIZE + 1 rows; the extra row only signals a next page.
+                      Includes _sort_key and activity_id for building the next cursor.
+    """
+    sort_expression, direction = SORT_OPTIONS[sort]
+    comparison = '<' if direction == 'DESC' else '>'
+    projection = ', '.join(
+        [column for column in columns if column in AVAILABLE_COLUMNS]
+        + ['activity_id', f'{sort_expression} AS _sort_key']
+    )
+
+    query = f"SELECT {projection} FROM activity_details WHERE 1=1"
+    params = []
+
+    if year:
+        query += " AND year = ?"
+        params.append(year)
+
+    if month:
+        query += " AND month = ?"
+        params.append(month)
+
+    if activity_category:
+        query += " AND activity_category = ?"
+        params.append(activity_category)
+
+    if cursor is not None:
+        # The single-column bound lets SQLite seek into the index; the row-value
+        # comparison then breaks ties on activity_id
+        query += f" AND {sort_expression} {comparison}= ? AND ({sort_expression}, activity_id) {comparison} (?, ?)"
+        params.extend([cursor[0], cursor[0], cursor[1]])
+
+    query += f" ORDER BY {sort_expression} {direction}, activity_id {direction} LIMIT ?"
+    params.append(PAGE_SIZE + 1)
+
+    return cached_query(conn, query, params)
+
+# ============================================================================
+# FILTERS
+# ============================================================================
+
+st.title("Activity Explorer")
+
+df_options = load_filter_options()
+
+col_filter1, col_filter2, col_filter3, col_sort = st.columns(4)
+
+with col_filter1:
+    year_options = ['All'] + sorted(df_options['year'].unique().tolist(), reverse=True)
+    selected_year = st.selectbox("Select Year", year_options, index=0)
+
+with col_filter2:
+    month_names = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                   'August', 'September', 'October', 'November', 'December']
+    selected_month_name = st.selectbox("Select Month", ['All'] + month_names, index=0)
+
+with col_filter3:
+    category_options = ['All'] + sorted(df_options['activity_category'].unique().tolist())
+    selected_category = st.selectbox("Select Activity Type", category_options, index=0)
+
+with col_sort:
+    selected_sort = st.selectbox("Sort by", list(SORT_OPTIONS), index=0)
+
+selected_columns = st.multiselect("Columns", AVAILABLE_COLUMNS, default=DEFAULT_COLUMNS)
+
+filters = dict(
+    year=int(selected_year) if selected_year != 'All' else None,
+    month=month_names.index(selected_month_name) + 1 if selected_month_name != 'All' else None,
+    activity_category=selected_category if selected_category != 'All' else None,
+)
+
+# ============================================================================
+# PAGINATION STATE
+# ============================================================================
+
+# Cursors of the pages visited so far; page N starts after cursors[N].
+# Changing filters or sort starts again from the first page.
+query_state = (tuple(sorted(filters.items())), selected_sort)
+if st.session_state.get('activity_query') != query_state:
+    st.session_state['activity_query'] = query_state
+    st.session_state['activity_cursors'] = [None]
+
+cursors = st.session_state['activity_cursors']
+
+df_page = load_activity_page(tuple(selected_columns), selected_sort, cursors[-1], **filters)
+has_next_page = len(df_page) > PAGE_SIZE
+df_page = df_page.head(PAGE_SIZE)
+
+# ============================================================================
+# TABLE
+# ============================================================================
+
+if df_page.empty:
+    st.info("No activities match the selected filters.")
+else:
+    st.dataframe(
+        df_page[[column for column in selected_columns if column in df_page.columns]],
+        use_container_width=True,
+        hide_index=True
+    )
+
+col_prev, col_page, col_next = st.columns([1, 2, 1])
+
+with col_prev:
+    if st.button("← Previous", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+
+with col_page:
+    st.caption(f"Page {len(cursors)}")
+
+with col_next:
+    if st.button("Next →", disabled=not has_next_page):
+        last_row = df_page.iloc[-1]
+        # .item() turns NumPy scalars into plain Python values sqlite3 can bind
+        sort_key = last_row['_sort_key']
+        sort_key = sort_key.item() if hasattr(sort_key, 'item') else sort_key
+        cursors.append((sort_key, int(last_row['activity_id'])))
+        st.rerun()
@@ -0,0 +1,113 @@
+"""
+Training Load
+Fitness (CTL), fatigue (ATL) and form (TSB) curves from the training_load_daily mart
+"""
+
+import sqlite3
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme
+
+st.set_page_config(page_title="Training Load", page_icon="📈", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_training_load(year=None):
+    """
+    Loads the daily training load series computed by compute_training_load.py.
+
+    Parameters:
+        year (int, optional): Only return days of this year
+
+    Returns:
+        pd.DataFrame: load_date, daily_load, atl, ctl, tsb
+    """
+    query = "SELECT load_date, daily_load, atl, ctl, tsb FROM training_load_daily"
+    params = []
+
+    if year:
+        query += " WHERE year = ?"
+        params.append(year)
+
+    query += " ORDER BY load_date"
+
+    return cached_query(
+        conn, query, params, parse_dates=['load_date'],
+        dtype={'daily_load': 'float32', 'atl': 'float32', 'ctl': 'float32', 'tsb': 'float32'}
+    )
+
+
+@st.cache_data(ttl=300)
+def load_training_load_years():
+    """Years covered by the training load series, most recent first (empty if not computed yet)"""
+    try:
+        return [row[0] for row in conn.execute(
+            "SELECT DISTINCT year FROM training_load_daily ORDER BY year DESC"
+        )]
+    except sqlite3.OperationalError:
+        # compute_training_load.py hasn't created the table yet
+        return []
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+st.title("Training Load")
+
+years = load_training_load_years()
+if not years:
+    st.info("No training load computed yet. Run compute_training_load.py after dbt run.")
+    st.stop()
+
+selected_year = st.selectbox("Select Year", years, index=0)
+df_load = load_training_load(int(selected_year))
+
+latest = df_load.iloc[-1]
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric(label="Fitness (CTL)", value=f"{latest['ctl']:.0f}")
+with col2:
+    st.metric(label="Fatigue (ATL)", value=f"{latest['atl']:.0f}")
+with col3:
+    st.metric(label="Form (TSB)", value=f"{latest['tsb']:+.0f}")
+
+fig = go.Figure()
+fig.add_trace(go.Bar(
+    name='Daily load', x=df_load['load_date'], y=df_load['daily_load'],
+    marker_color='#4d3e50', hovertemplate='Load: %{y:.0f}<extra></extra>'
+))
+fig.add_trace(go.Scatter(
+    name='Fitness (CTL)', x=df_load['load_date'], y=df_load['ctl'],
+    line=dict(color='#a887ce', width=3), hovertemplate='CTL: %{y:.1f}<extra></extra>'
+))
+fig.add_trace(go.Scatter(
+    name='Fatigue (ATL)', x=df_load['load_date'], y=df_load['atl'],
+    line=dict(color='#9c526d', width=2), hovertemplate='ATL: %{y:.1f}<extra></extra>'
+))
+fig.add_trace(go.Scatter(
+    name='Form (TSB)', x=df_load['load_date'], y=df_load['tsb'],
+    line=dict(color='#ffffff', width=1, dash='dot'), hovertemplate='TSB: %{y:.1f}<extra></extra>'
+))
+
+fig.update_layout(
+    xaxis=dict(tickfont=dict(color='#ffffff'), showgrid=False),
+    yaxis=dict(title=dict(text='Load', font=dict(color='#ffffff')), tickfont=dict(color='#ffffff'), showgrid=False),
+    plot_bgcolor='#171821',
+    paper_bgcolor='#171821',
+    legend=dict(font=dict(color='#ffffff'), bgcolor='rgba(0,0,0,0)', orientation='h'),
+    hovermode='x unified',
+    margin=dict(l=60, r=20, t=20, b=60),
+    height=450
+)
+
+st.plotly_chart(fig, use_container_width=True)
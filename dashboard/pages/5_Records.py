@@ -0,0 +1,112 @@
+"""
+Personal Records
+Current bests per sport and distance bucket, and when each was set
+"""
+
+import streamlit as st
+import pandas as pd
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme
+
+st.set_page_config(page_title="Personal Records", page_icon="🏆", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+RECORD_TYPE_NAMES = {
+    'fastest_speed': 'Fastest',
+    'longest_distance': 'Longest',
+    'biggest_elevation_day': 'Biggest elevation day',
+}
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300)
+def load_personal_records():
+    """
+    Loads current personal records maintained by update_personal_records.py.
+
+    Returns:
+        pd.DataFrame: One row per record (type, category, distance bucket)
+    """
+    query = """
+        SELECT record_key, record_type, activity_category, distance_category,
+               value, unit, activity_name, record_date, previous_value
+        FROM personal_records
+        ORDER BY activity_category, record_type, distance_category
+    """
+    try:
+        return cached_query(conn, query)
+    except pd.errors.DatabaseError:
+        # update_personal_records.py hasn't created the table yet
+        return pd.DataFrame()
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_record_history(record_key):
+    """
+    Loads every time a given record was set, most recent first.
+
+    Parameters:
+        record_key (str): Key of the record, e.g. 'longest_distance|Running'
+    """
+    query = """
+        SELECT record_date, value, unit, activity_name
+        FROM personal_records_history
+        WHERE record_key = ?
+        ORDER BY record_date DESC
+    """
+    return cached_query(conn, query, (record_key,))
+
+
+def format_record_value(row):
+    """Running and swimming speeds read better as pace"""
+    if row['record_type'] == 'fastest_speed' and row['activity_category'] == 'Running':
+        seconds = round(3600 / row['value'])
+        return f"{seconds // 60}:{seconds % 60:02d} /km"
+    if row['record_type'] == 'fastest_speed' and row['activity_category'] == 'Swimming':
+        seconds = round(360 / row['value'])
+        return f"{seconds // 60}:{seconds % 60:02d} /100m"
+    return f"{row['value']:,.1f} {row['unit']}"
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+st.title("Personal Records")
+
+df_records = load_personal_records()
+if df_records.empty:
+    st.info("No personal records yet. Run update_personal_records.py after dbt run.")
+    st.stop()
+
+df_records['record'] = df_records.apply(
+    lambda row: RECORD_TYPE_NAMES.get(row['record_type'], row['record_type'])
+    + (f" {row['distance_category']}" if row['distance_category'] else ''),
+    axis=1
+)
+df_records['best'] = df_records.apply(format_record_value, axis=1)
+
+for category, df_category in df_records.groupby('activity_category', sort=False):
+    st.subheader(category)
+    st.dataframe(
+        df_category[['record', 'best', 'record_date', 'activity_name']],
+        use_container_width=True,
+        hide_index=True
+    )
+
+# ============================================================================
+# RECORD HISTORY
+# ============================================================================
+
+st.markdown("---")
+st.subheader("Record History")
+
+labels = dict(zip(df_records['activity_category'] + ' – ' + df_records['record'], df_records['record_key']))
+selected_record = st.selectbox("Select Record", list(labels))
+
+st.dataframe(load_record_history(labels[selected_record]), use_container_width=True, hide_index=True)
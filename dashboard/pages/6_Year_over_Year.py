@@ -0,0 +1,157 @@
+"""
+Year over Year
+Cumulative distance, time and calories by day of year, one line per year,
+from the activity_progress_cumulative mart
+"""
+
+import sqlite3
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme, CATEGORY_COLORS, DARK_PURPLE, DEEP_PURPLE, MAGENTA, PRIMARY_PURPLE
+
+st.set_page_config(page_title="Year over Year", page_icon="📅", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+# Column and label per selectable metric
+METRICS = {
+    'Distance (km)': 'cumulative_distance_km',
+    'Time (hours)': 'cumulative_duration_hours',
+    'Calories': 'cumulative_calories',
+    'Activities': 'cumulative_activities',
+}
+
+# Most recent year first; older years fade out
+YEAR_COLORS = ['#ffffff', PRIMARY_PURPLE, MAGENTA, DARK_PURPLE, DEEP_PURPLE]
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_progress(activity_category):
+    """
+    Loads the cumulative series of every year for one activity category.
+
+    Parameters:
+        activity_category (str): Category from the activity_types seed, or 'All'
+
+    Returns:
+        pd.DataFrame: year, progress_date, day_of_year and the cumulative metrics
+    """
+    query = """
+        SELECT
+            year,
+            progress_date,
+            day_of_year,
+            cumulative_activities,
+            cumulative_distance_km,
+            cumulative_duration_hours,
+            cumulative_calories
+        FROM activity_progress_cumulative
+        WHERE activity_category = ?
+        ORDER BY year, day_of_year
+    """
+    return cached_query(conn, query, [activity_category], dtype={
+        'year': 'int16',
+        'day_of_year': 'int16',
+        'cumulative_activities': 'int32',
+        'cumulative_distance_km': 'float32',
+        'cumulative_duration_hours': 'float32',
+        'cumulative_calories': 'float32',
+    })
+
+
+@st.cache_data(ttl=300)
+def load_progress_categories():
+    """Categories with a cumulative series, 'All' first (empty if the mart isn't built yet)"""
+    try:
+        categories = [row[0] for row in conn.execute(
+            "SELECT DISTINCT activity_category FROM activity_progress_cumulative ORDER BY activity_category"
+        )]
+    except sqlite3.OperationalError:
+        # dbt run hasn't created the mart yet
+        return []
+    return sorted(categories, key=lambda category: category != 'All')
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+st.title("Year over Year")
+
+categories = load_progress_categories()
+if not categories:
+    st.info("No cumulative progress yet. Run dbt run to build activity_progress_cumulative.")
+    st.stop()
+
+col1, col2 = st.columns(2)
+with col1:
+    selected_category = st.selectbox("Select Activity Type", categories, index=0)
+with col2:
+    selected_metric = st.selectbox("Select Metric", list(METRICS), index=0)
+
+metric = METRICS[selected_metric]
+df_progress = load_progress(selected_category)
+# Most recent year first
+years = sorted(df_progress['year'].unique(), reverse=True)
+
+# This year against the previous one at the same day of year
+latest_year = df_progress[df_progress['year'] == years[0]]
+latest_day = latest_year.iloc[-1]
+columns = st.columns(min(len(years), 2))
+with columns[0]:
+    st.metric(
+        label=f"{years[0]} through day {latest_day['day_of_year']}",
+        value=f"{latest_day[metric]:,.0f}"
+    )
+if len(years) > 1:
+    previous_year = df_progress[
+        (df_progress['year'] == years[1]) & (df_progress['day_of_year'] <= latest_day['day_of_year'])
+    ]
+    previous_value = previous_year.iloc[-1][metric] if not previous_year.empty else 0
+    with columns[1]:
+        st.metric(
+            label=f"{years[1]} through day {latest_day['day_of_year']}",
+            value=f"{previous_value:,.0f}",
+            delta=f"{latest_day[metric] - previous_value:+,.0f} in {years[0]}",
+            delta_color='off'
+        )
+
+fig = go.Figure()
+for index, year in enumerate(years):
+    df_year = df_progress[df_progress['year'] == year]
+    color = YEAR_COLORS[min(index, len(YEAR_COLORS) - 1)]
+    if selected_category != 'All' and index == 0:
+        color = CATEGORY_COLORS.get(selected_category, color)
+    fig.add_trace(go.Scatter(
+        name=str(year),
+        x=df_year['day_of_year'],
+        y=df_year[metric],
+        customdata=df_year['progress_date'],
+        line=dict(color=color, width=3 if index == 0 else 2),
+        hovertemplate=f'{year}: %{{y:,.1f}} (%{{customdata}})<extra></extra>'
+    ))
+
+fig.update_layout(
+    xaxis=dict(
+        title=dict(text='Day of year', font=dict(color='#ffffff')),
+        tickfont=dict(color='#ffffff'),
+        range=[1, 366],
+        showgrid=False
+    ),
+    yaxis=dict(title=dict(text=selected_metric, font=dict(color='#ffffff')), tickfont=dict(color='#ffffff'), showgrid=False),
+    plot_bgcolor='#171821',
+    paper_bgcolor='#171821',
+    legend=dict(font=dict(color='#ffffff'), bgcolor='rgba(0,0,0,0)', orientation='h'),
+    hovermode='x unified',
+    margin=dict(l=60, r=20, t=20, b=60),
+    height=450
+)
+
+st.plotly_chart(fig, use_container_width=True)
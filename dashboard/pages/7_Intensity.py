@@ -0,0 +1,146 @@
+"""
+Intensity
+Weekly or monthly time in low, moderate and high heart rate zones, from the
+activity_intensity_distribution mart
+"""
+
+import sqlite3
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme, DARK_PURPLE, MAGENTA, PRIMARY_PURPLE
+
+st.set_page_config(page_title="Intensity", page_icon="❤️", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+GRAINS = {'Weekly': 'week', 'Monthly': 'month'}
+
+# Column, label and color per intensity, easiest first
+INTENSITIES = [
+    ('low_intensity_minutes', 'Low (zones 1-2)', PRIMARY_PURPLE),
+    ('moderate_intensity_minutes', 'Moderate (zone 3)', DARK_PURPLE),
+    ('high_intensity_minutes', 'High (zones 4-5)', MAGENTA),
+]
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_intensity(period_grain, activity_category, year):
+    """
+    Loads the zone-time rollups of one grain, category and year.
+
+    Parameters:
+        period_grain (str): 'week' or 'month'
+        activity_category (str): Category from the activity_types seed, or 'All'
+        year (int): Year of the period start
+
+    Returns:
+        pd.DataFrame: period_start, activity_count and minutes per intensity
+    """
+    query = """
+        SELECT
+            period_start,
+            activity_count,
+            low_intensity_minutes,
+            moderate_intensity_minutes,
+            high_intensity_minutes
+        FROM activity_intensity_distribution
+        WHERE period_grain = ? AND activity_category = ? AND year = ?
+        ORDER BY period_start
+    """
+    return cached_query(conn, query, [period_grain, activity_category, year], dtype={
+        'activity_count': 'int16',
+        'low_intensity_minutes': 'float32',
+        'moderate_intensity_minutes': 'float32',
+        'high_intensity_minutes': 'float32',
+    })
+
+
+@st.cache_data(ttl=300)
+def load_intensity_filters():
+    """Years (most recent first) and categories ('All' first); empty if the mart isn't built yet"""
+    # Both grains cover the same activities, and 'All' every year, so the
+    # monthly rows are enough and the lookups stay on the index
+    try:
+        years = [row[0] for row in conn.execute(
+            "SELECT DISTINCT year FROM activity_intensity_distribution"
+            " WHERE period_grain = 'month' AND activity_category = 'All' ORDER BY year DESC"
+        )]
+        categories = [row[0] for row in conn.execute(
+            "SELECT DISTINCT activity_category FROM activity_intensity_distribution"
+            " WHERE period_grain = 'month' ORDER BY activity_category"
+        )]
+    except sqlite3.OperationalError:
+        # dbt run hasn't created the mart yet
+        return [], []
+    return years, sorted(categories, key=lambda category: category != 'All')
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+st.title("Intensity Distribution")
+
+years, categories = load_intensity_filters()
+if not years:
+    st.info("No heart rate zone data yet. Run dbt run to build activity_intensity_distribution.")
+    st.stop()
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    selected_year = st.selectbox("Select Year", years, index=0)
+with col2:
+    selected_grain = st.selectbox("Select Period", list(GRAINS), index=0)
+with col3:
+    selected_category = st.selectbox("Select Activity Type", categories, index=0)
+
+df_intensity = load_intensity(GRAINS[selected_grain], selected_category, int(selected_year))
+
+if df_intensity.empty:
+    st.info("No heart rate zone data for the selected filters.")
+    st.stop()
+
+# Share of the year's zone time per intensity
+totals = {column: float(df_intensity[column].sum()) for column, _, _ in INTENSITIES}
+zone_minutes = sum(totals.values())
+metric_columns = st.columns(len(INTENSITIES))
+for metric_column, (column, label, _) in zip(metric_columns, INTENSITIES):
+    with metric_column:
+        share = 100 * totals[column] / zone_minutes if zone_minutes else 0
+        st.metric(label=label, value=f"{share:.0f}%", delta=f"{totals[column] / 60:.1f} h", delta_color='off')
+
+fig = go.Figure()
+for column, label, color in INTENSITIES:
+    fig.add_trace(go.Bar(
+        name=label,
+        x=df_intensity['period_start'],
+        y=df_intensity[column] / 60,
+        marker_color=color,
+        hovertemplate=f'{label}: %{{y:.1f}} h<extra></extra>'
+    ))
+
+fig.update_layout(
+    barmode='stack',
+    xaxis=dict(
+        title=dict(text='Week starting' if GRAINS[selected_grain] == 'week' else 'Month', font=dict(color='#ffffff')),
+        tickfont=dict(color='#ffffff'),
+        showgrid=False,
+        type='category'
+    ),
+    yaxis=dict(title=dict(text='Hours', font=dict(color='#ffffff')), tickfont=dict(color='#ffffff'), showgrid=False),
+    plot_bgcolor='#171821',
+    paper_bgcolor='#171821',
+    legend=dict(font=dict(color='#ffffff'), bgcolor='rgba(0,0,0,0)', orientation='h'),
+    hovermode='x unified',
+    margin=dict(l=60, r=20, t=20, b=60),
+    height=450
+)
+
+st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,132 @@
+"""
+Gear
+Active gear with wear and projected replacement dates, and retired gear,
+from the gear_wear_forecast mart (one row per item)
+"""
+
+import sqlite3
+
+import streamlit as st
+
+from database import get_database_connection
+from result_cache import cached_query
+from theme import apply_theme
+
+st.set_page_config(page_title="Gear", page_icon="⚙️", layout="wide")
+apply_theme()
+
+conn = get_database_connection()
+
+# ============================================================================
+# DATA LOADING FUNCTIONS
+# ============================================================================
+
+@st.cache_data(ttl=300)
+def load_gear_forecast():
+    """
+    Loads every gear item with its usage, rolling mileage and wear forecast.
+
+    Returns:
+        pd.DataFrame: One row per gear item, active gear first, closest replacement first
+    """
+    query = """
+        SELECT
+            gear_name,
+            gear_type,
+            status,
+            start_date,
+            last_used_date,
+            total_distance_km,
+            max_distance_km,
+            pct_of_max_distance_used,
+            remaining_distance_km,
+            last_4_weeks_km,
+            avg_weekly_km,
+            forecast_status,
+            weeks_remaining,
+            projected_replacement_date
+        FROM gear_wear_forecast
+        ORDER BY status, projected_replacement_date IS NULL, projected_replacement_date, total_distance_km DESC
+    """
+    try:
+        return cached_query(conn, query, dtype={
+            'total_distance_km': 'float32',
+            'max_distance_km': 'float32',
+            'pct_of_max_distance_used': 'float32',
+            'remaining_distance_km': 'float32',
+            'last_4_weeks_km': 'float32',
+            'avg_weekly_km': 'float32',
+            'weeks_remaining': 'float32',
+        })
+    except sqlite3.OperationalError:
+        # dbt run hasn't created the mart yet
+        return None
+
+
+def forecast_text(gear):
+    """One line describing when an active item needs replacing"""
+    if gear['forecast_status'] == 'due':
+        return "Maximum distance reached, due for replacement"
+    if gear['forecast_status'] == 'idle':
+        return "Not used in the last 12 weeks, no projection"
+    if gear['forecast_status'] == 'no_limit':
+        return "No maximum distance set"
+    return (
+        f"Replace around {gear['projected_replacement_date']} "
+        f"(~{gear['weeks_remaining']:.0f} weeks at {gear['avg_weekly_km']:.1f} km/week)"
+    )
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+st.title("Gear Tracker")
+
+df_gear = load_gear_forecast()
+if df_gear is None or df_gear.empty:
+    st.info("No gear yet. Run the gear extractors and dbt run to build gear_wear_forecast.")
+    st.stop()
+
+df_active = df_gear[df_gear['status'] == 'active']
+df_retired = df_gear[df_gear['status'] != 'active']
+
+st.subheader("Active Gear")
+if df_active.empty:
+    st.info("No active gear.")
+
+for _, gear in df_active.iterrows():
+    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+    with col1:
+        st.markdown(f"**{gear['gear_name']}** · {gear['gear_type']}")
+        if gear['forecast_status'] != 'no_limit':
+            st.progress(
+                min(max(float(gear['pct_of_max_distance_used']), 0.0), 100.0) / 100,
+                text=f"{gear['total_distance_km']:,.0f} of {gear['max_distance_km']:,.0f} km"
+                     f" ({gear['pct_of_max_distance_used']:.0f}%)"
+            )
+        st.caption(forecast_text(gear))
+    with col2:
+        st.metric(label="Distance", value=f"{gear['total_distance_km']:,.0f} km")
+    with col3:
+        remaining = gear['remaining_distance_km']
+        st.metric(label="Remaining", value='–' if gear['forecast_status'] == 'no_limit' else f"{remaining:,.0f} km")
+    with col4:
+        st.metric(label="Last 4 weeks", value=f"{gear['last_4_weeks_km']:,.0f} km")
+
+st.subheader("Retired Gear")
+if df_retired.empty:
+    st.info("No retired gear.")
+else:
+    st.dataframe(
+        df_retired[['gear_name', 'gear_type', 'start_date', 'last_used_date', 'total_distance_km', 'max_distance_km']],
+        column_config={
+            'gear_name': 'Gear',
+            'gear_type': 'Type',
+            'start_date': 'First used',
+            'last_used_date': 'Last used',
+            'total_distance_km': st.column_config.NumberColumn('Distance (km)', format='%.0f'),
+            'max_distance_km': st.column_config.NumberColumn('Max distance (km)', format='%.0f'),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
@@ -0,0 +1,164 @@
+# render_snapshot.py
+#
+# Pre-renders the default Overview view ("All" years, months and categories)
+# into static files that any static host can serve without a Streamlit session:
+#
+#   site/index.html     KPI cards, training calendar and monthly charts
+#   site/overview.json  the same KPIs and Plotly figures as JSON
+#
+# Run from the repository root after `dbt run`:
+#   python dashboard/render_snapshot.py
+# The live app stays available for drill-down into other filter combinations.
+
+import html
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+
+from overview import (
+    build_calendar_heatmap,
+    build_monthly_bar_chart,
+    format_duration,
+    query_avg_hours_per_week,
+    query_daily_summary,
+    query_filter_options,
+    query_kpi_totals,
+    query_monthly_kpis,
+)
+from theme import CHARCOAL, DARK_PURPLE, NEAR_BLACK, PRIMARY_PURPLE
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+OUTPUT_DIR = 'site'
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>My Training Hub</title>
+<script src="https://cdn.plot.ly/plotly-{plotly_js_version}.min.js" charset="utf-8"></script>
+<style>
+    body {{ background-color: {near_black}; color: #ffffff; font-family: sans-serif; margin: 2rem; }}
+    h1 {{ color: #ffffff; }}
+    h3 {{ color: {primary_purple}; font-size: 20px; margin: 0.5rem 0; }}
+    hr {{ border: none; border-top: 1px solid {charcoal}; margin: 1.5rem 0; }}
+    .kpis {{ display: grid; grid-template-columns: repeat(5, 1fr); gap: 1rem; }}
+    .kpi {{ background-color: {dark_purple}; border-radius: 10px; padding: 1.5rem; text-align: center; }}
+    .kpi-label {{ font-size: 0.9rem; }}
+    .kpi-value {{ font-size: 2rem; font-weight: bold; }}
+    .charts {{ display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; }}
+    footer {{ color: {dark_purple}; font-size: 0.8rem; margin-top: 2rem; }}
+</style>
+</head>
+<body>
+<h1>Activity Dashboard</h1>
+<hr>
+<div class="kpis">
+{kpi_cards}
+</div>
+<hr>
+{heatmap}
+<div class="charts">
+    <div><h3>Time per Month by Activity</h3>{duration_chart}</div>
+    <div><h3>Activity Count by Category</h3>{count_chart}</div>
+</div>
+<footer>Snapshot of all years, months and activity types &middot; generated {generated_at}</footer>
+</body>
+</html>
+"""
+
+
+def build_snapshot(conn):
+    """KPI values and figures of the default (unfiltered) Overview view"""
+    available_years = query_filter_options(conn)[0]
+    total_activities, total_distance, total_duration_hours, total_calories = query_kpi_totals(conn)
+
+    kpis = [
+        ("Total Activities", f"{int(total_activities):,}"),
+        ("Total Distance", f"{total_distance:,.1f} km"),
+        ("Training Time", format_duration(total_duration_hours)),
+        ("Calories Burned", f"{int(total_calories):,}"),
+        ("Avg Hours/Week", f"{query_avg_hours_per_week(conn):.1f}h"),
+    ]
+
+    figures = {}
+    if available_years:
+        # Same as the app with "All" selected: the calendar shows the most recent year
+        heatmap_year = available_years[0]
+        figures['heatmap'] = build_calendar_heatmap(query_daily_summary(conn, year=heatmap_year), heatmap_year)
+
+    df_monthly = query_monthly_kpis(conn)
+    if not df_monthly.empty:
+        figures['duration_chart'] = build_monthly_bar_chart(
+            df_monthly, 'total_duration_hours', 'Hours',
+            '%{fullData.name}: %{y:.1f} hours<extra></extra>'
+        )
+        figures['count_chart'] = build_monthly_bar_chart(
+            df_monthly, 'activity_count', 'Activity Count',
+            '%{fullData.name}: %{y} activities<extra></extra>'
+        )
+
+    return kpis, figures
+
+
+def write_snapshot(kpis, figures, output_dir=OUTPUT_DIR):
+    """Write index.html and overview.json; returns the paths written"""
+    os.makedirs(output_dir, exist_ok=True)
+    generated_at = datetime.now().isoformat(timespec='seconds')
+
+    def figure_html(name):
+        if name not in figures:
+            return "<p>No data available.</p>"
+        # plotly.js is loaded once from the CDN in the page head
+        return pio.to_html(figures[name], full_html=False, include_plotlyjs=False,
+                           config={'displaylogo': False}, default_width='100%')
+
+    kpi_cards = '\n'.join(
+        f'    <div class="kpi"><div class="kpi-label">{html.escape(label)}</div>'
+        f'<div class="kpi-value">{html.escape(value)}</div></div>'
+        for label, value in kpis
+    )
+
+    page = PAGE_TEMPLATE.format(
+        plotly_js_version=get_plotlyjs_version(),
+        near_black=NEAR_BLACK,
+        charcoal=CHARCOAL,
+        dark_purple=DARK_PURPLE,
+        primary_purple=PRIMARY_PURPLE,
+        kpi_cards=kpi_cards,
+        heatmap=figure_html('heatmap'),
+        duration_chart=figure_html('duration_chart'),
+        count_chart=figure_html('count_chart'),
+        generated_at=generated_at,
+    )
+
+    html_path = os.path.join(output_dir, 'index.html')
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(page)
+
+    json_path = os.path.join(output_dir, 'overview.json')
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generated_at': generated_at,
+            'filters': {'year': 'All', 'month': 'All', 'activity_category': 'All'},
+            'kpis': [{'label': label, 'value': value} for label, value in kpis],
+            # Plotly figure JSON, renderable with Plotly.newPlot(el, fig.data, fig.layout)
+            'figures': {name: json.loads(pio.to_json(fig)) for name, fig in figures.items()},
+        }, f)
+
+    return html_path, json_path
+
+
+if __name__ == "__main__":
+    print(f"🔄 Rendering dashboard snapshot at {datetime.now()}")
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        kpis, figures = build_snapshot(conn)
+    finally:
+        conn.close()
+    html_path, json_path = write_snapshot(kpis, figures)
+    print(f"✅ Snapshot written to {html_path} and {json_path}")
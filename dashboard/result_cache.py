@@ -0,0 +1,139 @@
+"""
+Shared on-disk cache of query results
+
+st.cache_data lives inside one Streamlit process, so every dashboard replica
+would query and cache the same frames on its own. Results read through
+cached_query() are also written as Arrow IPC files to a directory all replicas
+share, so a fresh replica starts warm:
+
+- Key: normalised SQL + parameters + database generation, so a newly swapped-in
+  database (see swap_database.py) never serves results of the previous one
+- Files are memory-mapped on read and evicted least-recently-used first once
+  the directory grows past GARMIN_RESULT_CACHE_MB
+
+Without pyarrow (or with GARMIN_RESULT_CACHE_MB=0) queries go straight to SQLite.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+CACHE_DIR = os.getenv('GARMIN_RESULT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'garmin_dashboard_cache'))
+MAX_CACHE_BYTES = int(float(os.getenv('GARMIN_RESULT_CACHE_MB', '256')) * 1024 * 1024)
+
+
+def database_generation(conn):
+    """
+    Generation of the database a connection reads.
+
+    Read through the connection itself (generation stamp and schema version),
+    plus the identity of the file, so results are never shared across a
+    database swap or an in-place pipeline run.
+    """
+    user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+    schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    stat = os.stat(path) if path else None
+    return (
+        user_version,
+        schema_version,
+        stat.st_ino if stat else None,
+        stat.st_mtime_ns if stat else None,
+    )
+
+
+def _cache_key(query, params, read_kwargs, generation):
+    normalised_query = re.sub(r'\s+', ' ', query).strip()
+    key = repr((normalised_query, tuple(params or ()), sorted(read_kwargs.items()), generation))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _read_entry(path):
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    # Reading marks the entry as recently used for LRU eviction
+    os.utime(path)
+    return table.to_pandas()
+
+
+def _write_entry(path, df):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Write under a unique temporary name and rename, so neither other replicas nor
+    # other sessions (threads) of this one ever read or replace a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def evict(max_bytes=MAX_CACHE_BYTES):
+    """Delete least recently used entries until the cache fits in max_bytes"""
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.arrow'):
+            try:
+                stat = os.stat(os.path.join(CACHE_DIR, name))
+            except FileNotFoundError:
+                continue  # evicted by another replica
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except OSError:
+            continue  # already gone, or still open in another process (Windows)
+        total -= size
+
+
+def cached_query(conn, query, params=None, **read_kwargs):
+    """
+    pd.read_sql_query with a result cache shared by all dashboard processes.
+
+    Parameters:
+        conn (sqlite3.Connection): Connection to read from on a cache miss
+        query (str): SQL query
+        params (sequence, optional): Query parameters
+        **read_kwargs: Passed on to pd.read_sql_query (e.g. parse_dates)
+
+    Returns:
+        pd.DataFrame: Query result
+    """
+    if pa is None or MAX_CACHE_BYTES <= 0:
+        return pd.read_sql_query(query, conn, params=params, **read_kwargs)
+
+    key = _cache_key(query, params, read_kwargs, database_generation(conn))
+    path = os.path.join(CACHE_DIR, f"{key}.arrow")
+
+    try:
+        return _read_entry(path)
+    except (FileNotFoundError, pa.ArrowInvalid):
+        pass  # not cached yet (or evicted / being replaced by another replica)
+
+    df = pd.read_sql_query(query, conn, params=params, **read_kwargs)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write_entry(path, df)
+        evict()
+    except (OSError, pa.ArrowException):
+        pass  # columns Arrow can't represent, or an unwritable cache dir: just don't cache
+
+    return df
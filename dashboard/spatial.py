@@ -0,0 +1,107 @@
+"""
+Spatial queries over activity start locations
+
+All lookups go through the activity_locations_rtree R*Tree maintained by
+build_spatial_index.py, so only activities inside the requested box are read.
+"""
+
+import math
+
+import numpy as np
+
+from result_cache import cached_query
+
+INDEX_TABLE = 'activity_locations_rtree'
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.32
+
+
+def location_extent(conn):
+    """
+    Returns the bounding box of all indexed activities.
+
+    Returns:
+        tuple: (min_lat, min_lon, max_lat, max_lon), or None if nothing is indexed
+    """
+    row = conn.execute(f"""
+        SELECT MIN(latitude), MIN(longitude), MAX(latitude), MAX(longitude)
+        FROM {INDEX_TABLE}
+    """).fetchone()
+    return None if row[0] is None else row
+
+
+def activities_in_bbox(conn, min_lat, min_lon, max_lat, max_lon):
+    """
+    Loads activities whose start location falls inside a bounding box.
+
+    Returns:
+        pd.DataFrame: activity_id, latitude, longitude, start_date
+    """
+    query = f"""
+        SELECT activity_id, latitude, longitude, start_date
+        FROM {INDEX_TABLE}
+        WHERE max_lat >= ? AND min_lat <= ?
+          AND max_lon >= ? AND min_lon <= ?
+    """
+    return cached_query(conn, query, (min_lat, max_lat, min_lon, max_lon))
+
+
+def activities_within_radius(conn, lat, lon, radius_km):
+    """
+    Loads activities that started within radius_km of a point, nearest first.
+
+    The R*Tree narrows candidates to the enclosing bounding box; the exact
+    great-circle (haversine) distance is then computed for those candidates only.
+
+    Returns:
+        pd.DataFrame: activity_id, latitude, longitude, start_date, distance_from_point_km
+    """
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    # Longitude degrees shrink towards the poles; near them, search all longitudes
+    cos_lat = math.cos(math.radians(lat))
+    lon_delta = 180.0 if cos_lat < 1e-6 else min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+
+    candidates = activities_in_bbox(
+        conn,
+        max(lat - lat_delta, -90.0), lon - lon_delta,
+        min(lat + lat_delta, 90.0), lon + lon_delta
+    )
+
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    lat2, lon2 = np.radians(candidates['latitude']), np.radians(candidates['longitude'])
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    candidates['distance_from_point_km'] = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+    nearby = candidates[candidates['distance_from_point_km'] <= radius_km]
+    return nearby.sort_values('distance_from_point_km').reset_index(drop=True)
+
+
+def clustered_locations(conn, min_lat, min_lon, max_lat, max_lon, grid_size=64):
+    """
+    Clusters activities inside a bounding box on a grid_size x grid_size grid.
+
+    Clustering happens in SQLite, so the dashboard receives at most
+    grid_size² points no matter how many activities are in the box.
+
+    Returns:
+        pd.DataFrame: latitude, longitude (cluster centroid), activity_count,
+                      first_date, last_date
+    """
+    cell_size = max(max_lat - min_lat, max_lon - min_lon, 1e-6) / grid_size
+
+    query = f"""
+        SELECT
+            AVG(latitude) as latitude,
+            AVG(longitude) as longitude,
+            COUNT(*) as activity_count,
+            MIN(start_date) as first_date,
+            MAX(start_date) as last_date
+        FROM {INDEX_TABLE}
+        WHERE max_lat >= ? AND min_lat <= ?
+          AND max_lon >= ? AND min_lon <= ?
+        GROUP BY
+            CAST((latitude - ?) / ? AS INTEGER),
+            CAST((longitude - ?) / ? AS INTEGER)
+    """
+    params = (min_lat, max_lat, min_lon, max_lon, min_lat, cell_size, min_lon, cell_size)
+    return cached_query(conn, query, params)
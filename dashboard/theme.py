@@ -0,0 +1,37 @@
+"""
+Dashboard theme: static stylesheet and shared chart colors
+
+Streamlit is imported only by apply_theme(), so the colors can also be used
+outside the app (e.g. by render_snapshot.py).
+"""
+
+# Octet Design palette (see static/theme.css)
+NEAR_BLACK = '#171821'
+CHARCOAL = '#292631'
+DEEP_PURPLE = '#4d3e50'
+DARK_PURPLE = '#7b6e7f'
+MAGENTA = '#9c526d'
+PRIMARY_PURPLE = '#a887ce'
+
+# Color per activity category, shared by all charts
+CATEGORY_COLORS = {
+    'Running': '#a887ce',
+    'Cycling': '#9c526d',
+    'Swimming': '#7b6e7f',
+    'Strength': '#4d3e50',
+    'Multi-Sport': '#9c7da8',
+    'Other': '#6e5a6e'
+}
+
+
+def apply_theme():
+    """
+    Links the static theme stylesheet.
+
+    The base colors come from .streamlit/config.toml, so pages render dark
+    immediately; the stylesheet (static/theme.css, served by Streamlit's static
+    file serving and cached by the browser) only adds the finer styling.
+    """
+    import streamlit as st
+
+    st.markdown('<link rel="stylesheet" href="app/static/theme.css">', unsafe_allow_html=True)
@@ -0,0 +1,101 @@
+# detect_source_changes.py
+#
+# Prints a dbt selector for the bronze tables (and dbt seeds) whose contents
+# changed since the last successful dbt build, so the workflow only rebuilds
+# their downstream models. Run after `dbt seed`:
+#
+#   python detect_source_changes.py           # -> "source:main.bronze_gear_stats+ activity_types+ ..."
+#   python detect_source_changes.py --commit  # record current checksums after dbt succeeds
+
+import hashlib
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+STATE_TABLE = 'pipeline_source_state'
+
+# Seed tables loaded by `dbt seed` (garmin_analytics/seeds)
+SEED_TABLES = ('activity_types',)
+
+
+def fingerprint_table(conn, table):
+    """Row count and content checksum (schema + every row) for one bronze table"""
+    digest = hashlib.sha256()
+    cursor = conn.execute(f'SELECT * FROM "{table}" ORDER BY rowid')
+    digest.update(repr([col[0] for col in cursor.description]).encode())
+
+    row_count = 0
+    for row in cursor:
+        digest.update(repr(row).encode())
+        row_count += 1
+
+    return row_count, digest.hexdigest()
+
+
+def current_fingerprints(conn):
+    placeholders = ','.join('?' * len(SEED_TABLES))
+    tables = [row[0] for row in conn.execute(
+        f"SELECT name FROM sqlite_master WHERE type = 'table' AND (name LIKE 'bronze_%' OR name IN ({placeholders})) ORDER BY name",
+        SEED_TABLES
+    )]
+    return {table: fingerprint_table(conn, table) for table in tables}
+
+
+def table_selector(table):
+    """dbt selector for a changed table and everything downstream of it"""
+    return f"{table}+" if table in SEED_TABLES else f"source:main.{table}+"
+
+
+def recorded_fingerprints(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            source_name TEXT PRIMARY KEY,
+            row_count INTEGER,
+            checksum TEXT,
+            built_at TEXT
+        )
+    """)
+    return {
+        name: (row_count, checksum)
+        for name, row_count, checksum in conn.execute(
+            f"SELECT source_name, row_count, checksum FROM {STATE_TABLE}"
+        )
+    }
+
+
+def changed_sources(conn):
+    """Bronze and seed tables that are new or differ from the last successful build"""
+    recorded = recorded_fingerprints(conn)
+    changed = []
+    for table, fingerprint in current_fingerprints(conn).items():
+        if recorded.get(table) != fingerprint:
+            previous_rows = recorded[table][0] if table in recorded else 0
+            print(f"  → {table} changed ({previous_rows} → {fingerprint[0]} rows)", file=sys.stderr)
+            changed.append(table)
+    return changed
+
+
+def commit_fingerprints(conn):
+    """Remember the bronze and seed contents the marts were just built from"""
+    recorded_fingerprints(conn)  # make sure the state table exists
+    built_at = datetime.now().isoformat(timespec='seconds')
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {STATE_TABLE} (source_name, row_count, checksum, built_at) VALUES (?, ?, ?, ?)",
+        [(table, rows, checksum, built_at) for table, (rows, checksum) in current_fingerprints(conn).items()]
+    )
+    conn.commit()
+
+
+if __name__ == "__main__":
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        if '--commit' in sys.argv:
+            commit_fingerprints(conn)
+            print("✅ Recorded bronze and seed table checksums", file=sys.stderr)
+        else:
+            # stdout carries only the selector so the workflow can capture it
+            print(' '.join(table_selector(table) for table in changed_sources(conn)))
+    finally:
+        conn.close()
@@ -2,10 +2,15 @@ import sqlite3
 import os
 import pandas as pd
 from garminconnect import Garmin
+from raw_archive import ArchivingApi, ReplayApi, replay_requested
 import json
 
 def init_api():
     """Initialize Garmin API using environment variables or stored tokens"""
+    if replay_requested():
+        # Rebuild bronze tables from the raw response archive, no API calls
+        return ReplayApi()
+
     email = os.getenv('GARMIN_EMAIL')
     password = os.getenv('GARMIN_PASSWORD')
 
@@ -19,7 +24,8 @@ def init_api():
         api = Garmin()
         api.login(tokenstore)
 
-    return api
+    # Archive every raw response so bronze tables can be rebuilt without the API
+    return ArchivingApi(api)
 
 def extract_and_load_activities():
     """Extract 2025 activities and load to database"""
@@ -33,6 +39,11 @@ def extract_and_load_activities():
     df = pd.DataFrame(activities)
     df['year'] = pd.to_datetime(df['startTimeLocal']).dt.year
     df_2025 = df[df['year'] == 2025].drop('year', axis=1)
+
+    # Flatten nested keys the models need into plain columns, so they aren't parsed from JSON on every read
+    df_2025['activityTypeKey'] = df_2025['activityType'].apply(
+        lambda x: x.get('typeKey') if isinstance(x, dict) else None
+    )
     
     # Convert complex fields to JSON
     for col in df_2025.columns:
@@ -41,9 +52,16 @@ def extract_and_load_activities():
                 lambda x: json.dumps(x) if isinstance(x, (dict, list)) else x
             )
     
-    # Save
-    conn = sqlite3.connect('data/garmin.db')
-    df_2025.to_sql('bronze_activities', conn, if_exists='replace', index=False)
+    # Save, keeping older history loaded by backfill.py
+    conn = sqlite3.connect(os.getenv('GARMIN_DB_PATH', 'data/garmin.db'))
+    try:
+        df_history = pd.read_sql_query(
+            "SELECT * FROM bronze_activities WHERE startTimeLocal < '2025-01-01'", conn
+        )
+    except Exception:
+        df_history = pd.DataFrame()
+    df_all = pd.concat([df_history, df_2025], ignore_index=True)
+    df_all.to_sql('bronze_activities', conn, if_exists='replace', index=False)
     conn.close()
     
     print(f"✅ Loaded {len(df_2025)} activities")
@@ -4,11 +4,16 @@ import sqlite3
 import os
 import pandas as pd
 from garminconnect import Garmin
+from raw_archive import ArchivingApi, ReplayApi, replay_requested
 import json
 import time
 
 def init_api():
     """Initialize Garmin API using environment variables or stored tokens"""
+    if replay_requested():
+        # Rebuild bronze tables from the raw response archive, no API calls
+        return ReplayApi()
+
     email = os.getenv('GARMIN_EMAIL')
     password = os.getenv('GARMIN_PASSWORD')
 
@@ -22,7 +27,8 @@ def init_api():
         api = Garmin()
         api.login(tokenstore)
 
-    return api
+    # Archive every raw response so bronze tables can be rebuilt without the API
+    return ArchivingApi(api)
 
 def extract_and_load_activity_weather():
     """Extract activity weather data and load to database"""
@@ -55,11 +61,18 @@ def extract_and_load_activity_weather():
         except:
             pass  # Activity has no weather (indoor or no GPS)
 
-        time.sleep(0.1)
+        if not getattr(api, 'replaying', False):
+            time.sleep(0.1)
 
     # Convert to DataFrame
     df_weather = pd.DataFrame(weather_results)
 
+    # Flatten the weather description into a plain column (no JSON parsing downstream)
+    if 'weatherTypeDTO' in df_weather.columns:
+        df_weather['weatherTypeDesc'] = df_weather['weatherTypeDTO'].apply(
+            lambda x: x.get('desc') if isinstance(x, dict) else None
+        )
+
     # Convert complex fields to JSON
     for col in df_weather.columns:
         if df_weather[col].apply(lambda x: isinstance(x, (dict, list))).any():
@@ -67,9 +80,18 @@ def extract_and_load_activity_weather():
                 lambda x: json.dumps(x) if isinstance(x, (dict, list)) else x
             )
 
-    # Save
-    conn = sqlite3.connect('data/garmin.db')
-    df_weather.to_sql('bronze_activity_weather', conn, if_exists='replace', index=False)
+    # Save, keeping the rows of older activities loaded by backfill.py
+    conn = sqlite3.connect(os.getenv('GARMIN_DB_PATH', 'data/garmin.db'))
+    try:
+        df_history = pd.read_sql_query("""
+            SELECT * FROM bronze_activity_weather WHERE activityId IN (
+                SELECT activityId FROM bronze_activities WHERE startTimeLocal < '2025-01-01'
+            )
+        """, conn)
+    except Exception:
+        df_history = pd.DataFrame()
+    df_all = pd.concat([df_history, df_weather], ignore_index=True)
+    df_all.to_sql('bronze_activity_weather', conn, if_exists='replace', index=False)
     conn.close()
 
     print(f"Loaded {len(df_weather)} activity-weather records")
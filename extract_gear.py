@@ -3,13 +3,19 @@
 import sqlite3
 import pandas as pd
 from garminconnect import Garmin
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 import sys
 from getpass import getpass
+from raw_archive import ArchivingApi, ReplayApi, replay_requested
 
 def init_api():
     """Initialize Garmin API using environment variables or stored tokens"""
+    if replay_requested():
+        # Rebuild bronze tables from the raw response archive, no API calls
+        print("  → Replaying archived API responses...")
+        return ReplayApi()
+
     email = os.getenv('GARMIN_EMAIL')
     password = os.getenv('GARMIN_PASSWORD')
 
@@ -19,7 +25,7 @@ def init_api():
         api = Garmin(email=email, password=password)
         api.login()
         print("  ✅ Logged in using environment credentials")
-        return api
+        return ArchivingApi(api)
     else:
         # Use stored tokens (for local development)
         tokenstore = os.path.expanduser("~/.garminconnect")
@@ -29,11 +35,11 @@ def init_api():
             api = Garmin()
             api.login(tokenstore)
             print("  ✅ Logged in using stored tokens")
-            return api
+            return ArchivingApi(api)
         except Exception as e:
             print(f"  ⚠️  Token login failed: {e}")
             print("  → Requesting fresh login credentials...")
-            return fresh_login(tokenstore)
+            return ArchivingApi(fresh_login(tokenstore))
 
 def fresh_login(tokenstore):
     """Perform fresh login with credentials"""
@@ -54,6 +60,13 @@ def fresh_login(tokenstore):
     print(f"  ✅ Tokens saved to: {tokenstore}")
     return api
 
+def load_existing_gear_stats(conn):
+    """Return the current bronze_gear_stats table, or an empty frame on first run"""
+    try:
+        return pd.read_sql_query("SELECT * FROM bronze_gear_stats", conn)
+    except Exception:
+        return pd.DataFrame(columns=['uuid'])
+
 def extract_and_load_gear():
     """
     Extract ALL gear-related data
@@ -77,31 +90,45 @@ def extract_and_load_gear():
         print(f"  ✅ Found {len(df_gear)} gear items")
         
         # ========================================
-        # TABLE 2: Gear Stats
+        # TABLE 2: Gear Stats (reconciliation only)
         # ========================================
-        print("  → Extracting gear stats...")
+        # Mileage is derived locally from activity-gear links (see the
+        # gear_activity_usage model). Garmin's per-item stats are only fetched
+        # for new gear, or for every item when reconciling with --reconcile.
+        db_path = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+        conn = sqlite3.connect(db_path)
+
+        df_existing_stats = load_existing_gear_stats(conn)
+        reconcile = '--reconcile' in sys.argv or 'reconciledAt' not in df_existing_stats.columns
+        known_uuids = set() if reconcile else set(df_existing_stats['uuid'])
+
+        gear_to_fetch = [g for g in gear_list if g['uuid'] not in known_uuids]
+        print(f"  → Extracting gear stats for {len(gear_to_fetch)} of {len(gear_list)} items...")
         gear_stats_list = []
-        for gear_item in gear_list:
+        for gear_item in gear_to_fetch:
             gear_uuid = gear_item['uuid']
             try:
                 stats = api.get_gear_stats(gear_uuid)
+                # Local usage after this moment is added on top of the remote totals;
+                # UTC, to compare with activity start times in GMT
+                stats['reconciledAt'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
                 gear_stats_list.append(stats)
             except Exception as e:
                 print(f"    ⚠️  Warning: Could not get stats for {gear_uuid}: {e}")
-        
+
         df_gear_stats = pd.DataFrame(gear_stats_list)
+        if not reconcile:
+            df_gear_stats = pd.concat([df_existing_stats, df_gear_stats], ignore_index=True)
         print(f"  ✅ Found stats for {len(df_gear_stats)} items")
-        
+
         # ========================================
         # Load to Database
         # ========================================
         print("  → Loading to database...")
-        db_path = 'data/garmin.db'
-        conn = sqlite3.connect(db_path)
-        
+
         df_gear.to_sql('bronze_gear_list', conn, if_exists='replace', index=False)
         df_gear_stats.to_sql('bronze_gear_stats', conn, if_exists='replace', index=False)
-        
+
         conn.close()
         print(f"  ✅ Both tables loaded to {db_path}")
         
@@ -0,0 +1,185 @@
+# extract_multisport_splits.py
+#
+# Child activities (swim, bike, run, transitions) of multisport events.
+#
+# A multisport activity is a parent whose legs are separate child activities
+# that the activity list doesn't return. For every multi_sport parent in
+# bronze_activities without children in bronze_multisport_children yet, the
+# parent's child ids and then each child's summary are fetched (a small thread
+# pool), so every event is fetched once; later runs only fetch new events.
+# Fetched parents are recorded in multisport_sync_state, so a parent that
+# came back without children isn't requested again either.
+# The multisport_splits mart allocates the legs to activity categories.
+
+import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+from garminconnect import Garmin
+from raw_archive import ArchivingApi, ReplayApi, replay_requested
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+TABLE = 'bronze_multisport_children'
+STATE_TABLE = 'multisport_sync_state'
+
+# Concurrent requests; small enough to stay clear of Garmin's rate limits
+MAX_WORKERS = 4
+
+
+def init_api():
+    """Initialize Garmin API using environment variables or stored tokens"""
+    if replay_requested():
+        # Rebuild bronze tables from the raw response archive, no API calls
+        return ReplayApi()
+
+    email = os.getenv('GARMIN_EMAIL')
+    password = os.getenv('GARMIN_PASSWORD')
+
+    if email and password:
+        # Use email/password authentication (for GitHub Actions)
+        api = Garmin(email=email, password=password)
+        api.login()
+    else:
+        # Use stored tokens (for local development)
+        tokenstore = os.path.expanduser("~/.garminconnect")
+        api = Garmin()
+        api.login(tokenstore)
+
+    # Archive every raw response so bronze tables can be rebuilt without the API
+    return ArchivingApi(api)
+
+
+def create_children_table(conn):
+    """Created up front, so the dbt source exists before the first multisport activity"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {TABLE} (
+            parentActivityId INTEGER,
+            activityId INTEGER,
+            activityName TEXT,
+            activityTypeKey TEXT,
+            startTimeLocal TEXT,
+            distance REAL,
+            duration REAL,
+            calories REAL
+        )
+    """)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            parentActivityId INTEGER PRIMARY KEY,
+            child_count INTEGER,
+            fetched_at TEXT
+        )
+    """)
+    conn.commit()
+
+
+def find_new_parents(conn):
+    """Multisport activities whose children haven't been fetched yet"""
+    return [row[0] for row in conn.execute(f"""
+        SELECT activityId FROM bronze_activities
+        WHERE activityTypeKey = 'multi_sport'
+          AND activityId NOT IN (SELECT parentActivityId FROM {TABLE})
+          AND activityId NOT IN (SELECT parentActivityId FROM {STATE_TABLE})
+    """)]
+
+
+def fetch_child_ids(api, parent_id):
+    """Ids of a multisport activity's legs, in order"""
+    activity = api.get_activity(parent_id) or {}
+    return (activity.get('metadataDTO') or {}).get('childIds') or activity.get('childIds') or []
+
+
+def fetch_child(api, parent_id, child_id):
+    """One leg as a flat row with only the fields the models use"""
+    activity = api.get_activity(child_id) or {}
+    summary = activity.get('summaryDTO') or {}
+    return {
+        'parentActivityId': parent_id,
+        'activityId': child_id,
+        'activityName': activity.get('activityName'),
+        'activityTypeKey': (activity.get('activityTypeDTO') or {}).get('typeKey'),
+        'startTimeLocal': (summary.get('startTimeLocal') or '').replace('T', ' ')[:19] or None,
+        'distance': summary.get('distance'),
+        'duration': summary.get('duration'),
+        'calories': summary.get('calories'),
+    }
+
+
+def fetch_children(api, parent_ids):
+    """
+    Fetch the legs of every parent concurrently.
+
+    Returns {parent id: legs}, with None for a parent where any request
+    failed: its legs are all skipped, so an event is never half allocated,
+    and it is retried on the next run.
+    """
+    def run(parent_id):
+        try:
+            child_ids = fetch_child_ids(api, parent_id)
+            return parent_id, [fetch_child(api, parent_id, child_id) for child_id in child_ids]
+        except Exception as e:
+            print(f"    ⚠️  Warning: children of {parent_id} failed: {e}")
+            return parent_id, None
+
+    # Replayed responses come from local files; no point in threads there
+    workers = 1 if getattr(api, 'replaying', False) else MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(run, parent_ids))
+
+
+def load_children(conn, rows):
+    """Append the legs of newly split events; earlier events keep their rows"""
+    pd.DataFrame(rows).to_sql(TABLE, conn, if_exists='append', index=False)
+
+
+def record_fetched_parents(conn, children):
+    """Remember every parent fetched without errors, including those without children"""
+    fetched_at = datetime.now().isoformat(timespec='seconds')
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {STATE_TABLE} (parentActivityId, child_count, fetched_at) VALUES (?, ?, ?)",
+        [(parent_id, len(legs), fetched_at) for parent_id, legs in children.items() if legs is not None]
+    )
+    conn.commit()
+
+
+def extract_and_load_multisport_children():
+    """Fetch the legs of multisport events that haven't been split yet"""
+    print(f"🔄 Starting multisport split extraction at {datetime.now()}")
+
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        create_children_table(conn)
+        parent_ids = find_new_parents(conn)
+        if not parent_ids:
+            print("✅ No new multisport activities")
+            return True
+
+        api = init_api()
+        print(f"  → {len(parent_ids)} new multisport activities")
+        children = fetch_children(api, parent_ids)
+
+        rows = [row for legs in children.values() if legs for row in legs]
+        if rows:
+            load_children(conn, rows)
+        record_fetched_parents(conn, children)
+
+        split = sum(1 for legs in children.values() if legs)
+        empty = sum(1 for legs in children.values() if legs == [])
+        print(f"✅ Loaded {len(rows)} legs of {split} multisport activities")
+        if empty:
+            print(f"  → {empty} multisport activities without children, not requested again")
+    finally:
+        conn.close()
+
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        extract_and_load_multisport_children()
+    except Exception as e:
+        print(f"❌ Error during multisport split extraction: {e}")
+        sys.exit(1)
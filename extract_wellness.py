@@ -0,0 +1,332 @@
+# extract_wellness.py
+#
+# Daily wellness metrics: steps, body battery, resting heart rate, stress,
+# sleep and HRV.
+#
+# Steps and body battery come from Garmin's date-range endpoints (one request
+# per window); the other metrics only exist per day and are fetched by a small
+# thread pool. Each bronze table has a high-water mark in wellness_sync_state,
+# so a run only fetches the days since the previous one (plus the last few
+# days, which Garmin keeps updating).
+
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from garminconnect import Garmin
+from raw_archive import ArchivingApi, ReplayApi, iter_archive, replay_requested
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+STATE_TABLE = 'wellness_sync_state'
+
+# Same period as the activity extractors
+START_DATE = date(2025, 1, 1)
+
+# Today and the days just before it are still filling up on Garmin's side
+REFETCH_DAYS = 3
+
+# Concurrent per-day requests; small enough to stay clear of Garmin's rate limits
+MAX_WORKERS = 4
+
+# Longest window per date-range request
+RANGE_CHUNK_DAYS = 28
+
+
+def init_api():
+    """Initialize Garmin API using environment variables or stored tokens"""
+    if replay_requested():
+        # Rebuild bronze tables from the raw response archive, no API calls
+        return ReplayApi()
+
+    email = os.getenv('GARMIN_EMAIL')
+    password = os.getenv('GARMIN_PASSWORD')
+
+    if email and password:
+        # Use email/password authentication (for GitHub Actions)
+        api = Garmin(email=email, password=password)
+        api.login()
+    else:
+        # Use stored tokens (for local development)
+        tokenstore = os.path.expanduser("~/.garminconnect")
+        api = Garmin()
+        api.login(tokenstore)
+
+    # Archive every raw response so bronze tables can be rebuilt without the API
+    return ArchivingApi(api)
+
+
+# ========================================
+# Fetchers: one flat row per calendar day, with only the fields the models use
+# (the full responses are kept in the raw archive)
+# ========================================
+
+def fetch_daily_steps(api, start, end):
+    """Steps per day for a date range"""
+    return [
+        {
+            'calendarDate': row.get('calendarDate'),
+            'totalSteps': row.get('totalSteps'),
+            'totalDistance': row.get('totalDistance'),
+            'stepGoal': row.get('stepGoal'),
+        }
+        for row in api.get_daily_steps(start.isoformat(), end.isoformat()) or []
+    ]
+
+
+def fetch_body_battery(api, start, end):
+    """Body battery per day for a date range (high/low derived from the intraday values)"""
+    rows = []
+    for day in api.get_body_battery(start.isoformat(), end.isoformat()) or []:
+        levels = [value[1] for value in day.get('bodyBatteryValuesArray') or [] if value[1] is not None]
+        rows.append({
+            'calendarDate': day.get('date'),
+            'charged': day.get('charged'),
+            'drained': day.get('drained'),
+            'bodyBatteryHigh': max(levels) if levels else None,
+            'bodyBatteryLow': min(levels) if levels else None,
+        })
+    return rows
+
+
+def fetch_daily_summary(api, day):
+    """Resting heart rate and stress for one day"""
+    summary = api.get_user_summary(day.isoformat()) or {}
+    return {
+        'calendarDate': day.isoformat(),
+        'restingHeartRate': summary.get('restingHeartRate'),
+        'minHeartRate': summary.get('minHeartRate'),
+        'maxHeartRate': summary.get('maxHeartRate'),
+        'averageStressLevel': summary.get('averageStressLevel'),
+        'maxStressLevel': summary.get('maxStressLevel'),
+        'restStressDuration': summary.get('restStressDuration'),
+        'lowStressDuration': summary.get('lowStressDuration'),
+        'mediumStressDuration': summary.get('mediumStressDuration'),
+        'highStressDuration': summary.get('highStressDuration'),
+    }
+
+
+def fetch_sleep(api, day):
+    """Sleep stages and score for the night ending on one day"""
+    # Days without data still get a row (all NULL), so the table always has every column
+    sleep = (api.get_sleep_data(day.isoformat()) or {}).get('dailySleepDTO') or {}
+    return {
+        'calendarDate': day.isoformat(),
+        'sleepTimeSeconds': sleep.get('sleepTimeSeconds'),
+        'deepSleepSeconds': sleep.get('deepSleepSeconds'),
+        'lightSleepSeconds': sleep.get('lightSleepSeconds'),
+        'remSleepSeconds': sleep.get('remSleepSeconds'),
+        'awakeSleepSeconds': sleep.get('awakeSleepSeconds'),
+        'sleepScore': ((sleep.get('sleepScores') or {}).get('overall') or {}).get('value'),
+        'avgSleepStress': sleep.get('avgSleepStress'),
+    }
+
+
+def fetch_hrv(api, day):
+    """Overnight heart rate variability summary for one day"""
+    hrv = (api.get_hrv_data(day.isoformat()) or {}).get('hrvSummary') or {}
+    return {
+        'calendarDate': day.isoformat(),
+        'lastNightAvg': hrv.get('lastNightAvg'),
+        'lastNight5MinHigh': hrv.get('lastNight5MinHigh'),
+        'weeklyAvg': hrv.get('weeklyAvg'),
+        'status': hrv.get('status'),
+    }
+
+
+RANGE_FETCHERS = {
+    'bronze_daily_steps': fetch_daily_steps,
+    'bronze_body_battery': fetch_body_battery,
+}
+
+DAILY_FETCHERS = {
+    'bronze_daily_health': fetch_daily_summary,
+    'bronze_sleep': fetch_sleep,
+    'bronze_hrv': fetch_hrv,
+}
+
+
+# ========================================
+# High-water marks
+# ========================================
+
+def load_high_water_marks(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            source_name TEXT PRIMARY KEY,
+            high_water_date TEXT,
+            synced_at TEXT
+        )
+    """)
+    return {
+        name: date.fromisoformat(high_water)
+        for name, high_water in conn.execute(f"SELECT source_name, high_water_date FROM {STATE_TABLE}")
+    }
+
+
+def fetch_window_start(high_water, today):
+    """First day to fetch: the day after the high-water mark, but never later than the refetch window"""
+    if high_water is None:
+        return START_DATE
+    return max(START_DATE, min(high_water + timedelta(days=1), today - timedelta(days=REFETCH_DAYS - 1)))
+
+
+def iter_days(start, end):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+# ========================================
+# Fetching
+# ========================================
+
+def fetch_range_table(api, fetch, start, end):
+    """
+    Fetch a date range in RANGE_CHUNK_DAYS windows.
+
+    Returns (rows, last day fetched without error).
+    """
+    rows = []
+    fetched_until = None
+    window_start = start
+    while window_start <= end:
+        window_end = min(window_start + timedelta(days=RANGE_CHUNK_DAYS - 1), end)
+        try:
+            rows.extend(fetch(api, window_start, window_end))
+        except Exception as e:
+            print(f"    ⚠️  Warning: {fetch.__name__} failed for {window_start}..{window_end}: {e}")
+            break
+        fetched_until = window_end
+        window_start = window_end + timedelta(days=1)
+    return rows, fetched_until
+
+
+def fetch_daily_tables(api, windows):
+    """
+    Fetch every (table, day) pair concurrently.
+
+    Returns {table: (rows, last day before the first failed day)}.
+    """
+    jobs = [(table, day) for table, (start, end) in windows.items() for day in iter_days(start, end)]
+
+    def run(job):
+        table, day = job
+        try:
+            return table, day, True, DAILY_FETCHERS[table](api, day)
+        except Exception as e:
+            print(f"    ⚠️  Warning: {table} failed for {day}: {e}")
+            return table, day, False, None
+
+    # Replayed responses come from local files; no point in threads there
+    workers = 1 if getattr(api, 'replaying', False) else MAX_WORKERS
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run, jobs))
+
+    fetched = {}
+    for table, (start, end) in windows.items():
+        table_results = sorted((day, ok, row) for t, day, ok, row in results if t == table)
+        failed_days = [day for day, ok, _ in table_results if not ok]
+        fetched_until = failed_days[0] - timedelta(days=1) if failed_days else end
+        rows = [row for _, ok, row in table_results if ok]
+        fetched[table] = (rows, fetched_until if fetched_until >= start else None)
+    return fetched
+
+
+# ========================================
+# Loading
+# ========================================
+
+def load_table(conn, table, rows, start, end):
+    """Replace the fetched days of a bronze table with the new rows, keeping older days"""
+    try:
+        df_existing = pd.read_sql_query(
+            f"SELECT * FROM {table} WHERE calendarDate < ? OR calendarDate > ?",
+            conn,
+            params=(start.isoformat(), end.isoformat())
+        )
+    except Exception:
+        df_existing = pd.DataFrame()
+
+    df_new = pd.DataFrame(rows)
+    df = pd.concat([df_existing, df_new], ignore_index=True)
+    if df.empty:
+        return 0
+
+    df = df.drop_duplicates('calendarDate', keep='last').sort_values('calendarDate')
+    df.to_sql(table, conn, if_exists='replace', index=False)
+    return len(df_new)
+
+
+def replay_today():
+    """
+    The day a replay treats as today: GARMIN_REPLAY_TODAY (YYYY-MM-DD) if set,
+    else the latest day in the archived per-day requests. The fetch windows
+    then end where the live runs' windows did, instead of at days that were
+    never archived.
+    """
+    override = os.getenv('GARMIN_REPLAY_TODAY')
+    if override:
+        return date.fromisoformat(override)
+
+    days = [json.loads(record['key'])['args'][0] for record in iter_archive('get_user_summary')]
+    return max(date.fromisoformat(day) for day in days) if days else date.today()
+
+
+def extract_and_load_wellness():
+    """Fetch new wellness days for every bronze table and advance the high-water marks"""
+    print(f"🔄 Starting wellness extraction at {datetime.now()}")
+
+    api = init_api()
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        today = replay_today() if getattr(api, 'replaying', False) else date.today()
+        high_water = load_high_water_marks(conn)
+        windows = {
+            table: (fetch_window_start(high_water.get(table), today), today)
+            for table in list(RANGE_FETCHERS) + list(DAILY_FETCHERS)
+        }
+
+        fetched = {}
+        for table, fetch in RANGE_FETCHERS.items():
+            start, end = windows[table]
+            print(f"  → {table}: {start} → {end} (date-range requests)")
+            fetched[table] = fetch_range_table(api, fetch, start, end)
+
+        daily_windows = {table: windows[table] for table in DAILY_FETCHERS}
+        day_count = sum((end - start).days + 1 for start, end in daily_windows.values())
+        print(f"  → {', '.join(DAILY_FETCHERS)}: {day_count} daily requests")
+        fetched.update(fetch_daily_tables(api, daily_windows))
+
+        synced_at = datetime.now().isoformat(timespec='seconds')
+        for table, (rows, fetched_until) in fetched.items():
+            if fetched_until is None:
+                print(f"  ⚠️  {table}: nothing fetched, high-water mark unchanged")
+                continue
+            start = windows[table][0]
+            loaded = load_table(conn, table, rows, start, fetched_until)
+            new_high_water = max(fetched_until, high_water.get(table, fetched_until))
+            conn.execute(
+                f"INSERT OR REPLACE INTO {STATE_TABLE} (source_name, high_water_date, synced_at) VALUES (?, ?, ?)",
+                (table, new_high_water.isoformat(), synced_at)
+            )
+            # Commit per table: pandas rolls back pending work when a read fails (e.g. a table's first run)
+            conn.commit()
+            print(f"  ✅ {table}: {loaded} days loaded, synced through {new_high_water}")
+    finally:
+        conn.close()
+
+    print(f"✅ Wellness extraction complete at {datetime.now()}")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        extract_and_load_wellness()
+    except Exception as e:
+        print(f"❌ Error during wellness extraction: {e}")
+        sys.exit(1)
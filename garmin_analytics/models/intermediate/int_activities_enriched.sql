@@ -1,4 +1,4 @@
--- Intermediate model: Enrich activities with weather and gear information
+-- Intermediate model: Enrich activities with category, weather and gear information
 -- Purpose: Create a reusable model that combines staging data for downstream marts
 
 WITH activities AS (
@@ -11,6 +11,10 @@ weather AS (
 
 gear AS (
     SELECT * FROM {{ ref('stg_activity_gear') }}
+),
+
+activity_types AS (
+    SELECT * FROM {{ ref('activity_types') }}
 )
 
 SELECT
@@ -21,6 +25,7 @@ SELECT
     a.sport_type_id,
     a.activity_name,
     a.activity_type_key,
+    COALESCE(t.activity_category, 'Other') as activity_category,  -- from the activity_types seed
     a.location_name,
 
     -- Timing
@@ -98,3 +103,4 @@ SELECT
 FROM activities a
 LEFT JOIN weather w ON a.activity_id = w.activity_id
 LEFT JOIN gear g ON a.activity_id = g.activity_id
+LEFT JOIN activity_types t ON a.activity_type_key = t.activity_type_key
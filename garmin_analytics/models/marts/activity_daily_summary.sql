@@ -1,6 +1,13 @@
 -- Marts model: Daily activity summary for calendar heatmap
 -- One row per date with simple aggregated metrics
 -- Includes ALL activity types (Running, Cycling, Swimming, Strength, etc.)
+-- Post-hook indexes the per-year reads of the dashboard calendar and KPIs
+
+{{ config(
+    post_hook=[
+        "CREATE INDEX IF NOT EXISTS idx_activity_daily_summary_year ON activity_daily_summary (year, activity_date)",
+    ]
+) }}
 
 WITH enriched_activities AS (
     SELECT * FROM {{ ref('int_activities_enriched') }}
@@ -1,6 +1,33 @@
 -- Marts model: Detailed activity view with categorization
 -- Purpose: Comprehensive activity details for filterable data tables and detailed exploration
 -- This mart provides all activity details with consistent categorization matching the KPI dashboard
+-- Post-hooks index the keyset pagination orders used by the dashboard activity explorer
+-- and the activity_id lookups of the activity map
+-- and rebuild the activity_search FTS5 index from this table on every build
+
+{{ config(
+    post_hook=[
+        "CREATE INDEX IF NOT EXISTS idx_activity_details_start_date ON activity_details (start_date, activity_id)",
+        "CREATE INDEX IF NOT EXISTS idx_activity_details_distance ON activity_details (IFNULL(distance_km, 0), activity_id)",
+        "CREATE INDEX IF NOT EXISTS idx_activity_details_duration ON activity_details (IFNULL(duration_minutes, 0), activity_id)",
+        "CREATE INDEX IF NOT EXISTS idx_activity_details_activity_id ON activity_details (activity_id)",
+        "DROP TABLE IF EXISTS activity_search",
+        "CREATE VIRTUAL TABLE activity_search USING fts5(
+            activity_name, location_name, activity_type_key, gear_name,
+            activity_id UNINDEXED, start_date UNINDEXED, activity_category UNINDEXED,
+            distance_km UNINDEXED, duration_formatted UNINDEXED,
+            tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+        )",
+        "INSERT INTO activity_search (
+            activity_name, location_name, activity_type_key, gear_name,
+            activity_id, start_date, activity_category, distance_km, duration_formatted
+        )
+        SELECT
+            activity_name, location_name, activity_type_key, gear_name,
+            activity_id, start_date, activity_category, distance_km, duration_formatted
+        FROM {{ this }}"
+    ]
+) }}
 
 WITH activities AS (
     SELECT * FROM {{ ref('int_activities_enriched') }}
@@ -11,16 +38,10 @@ SELECT
     activity_id,
     activity_name,
     activity_type_key,
+    location_name,
 
-    -- Activity categorization (same logic as KPI table)
-    CASE
-        WHEN activity_type_key IN ('running', 'trail_running') THEN 'Running'
-        WHEN activity_type_key IN ('cycling') THEN 'Cycling'
-        WHEN activity_type_key IN ('lap_swimming', 'open_water_swimming', 'swimming') THEN 'Swimming'
-        WHEN activity_type_key IN ('strength_training', 'indoor_cardio') THEN 'Strength'
-        WHEN activity_type_key IN ('multi_sport') THEN 'Multi-Sport'
-        ELSE 'Other'
-    END as activity_category,
+    -- Activity categorization (activity_types seed, same as KPI table)
+    activity_category,
 
     -- Time dimensions
     start_date,
@@ -0,0 +1,149 @@
+-- Marts model: Time in heart rate zones per week and per month, by activity category
+-- Purpose: Pre-aggregated intensity distribution (polarisation) for the dashboard
+-- One row per grain ('week' starting Monday, or 'month'), period and category (plus 'All')
+--
+-- Zones are grouped into three intensities: low (zones 1-2), moderate (zone 3)
+-- and high (zones 4-5). Only activities with heart rate zone data count.
+--
+-- Incremental: a run only rebuilds the years (of the period start) where any
+-- period's rollup changed; unique_key='year' replaces those years as a whole.
+-- Use --full-refresh after changing the model.
+
+{{ config(
+    materialized='incremental',
+    unique_key='year',
+    post_hook=[
+        "CREATE INDEX IF NOT EXISTS idx_activity_intensity_distribution ON activity_intensity_distribution (period_grain, activity_category, year, period_start)",
+    ]
+) }}
+
+WITH activities AS (
+    SELECT
+        DATE(start_date) as activity_date,
+        activity_category,
+        COALESCE(hr_zone_1_seconds, 0) as zone_1_seconds,
+        COALESCE(hr_zone_2_seconds, 0) as zone_2_seconds,
+        COALESCE(hr_zone_3_seconds, 0) as zone_3_seconds,
+        COALESCE(hr_zone_4_seconds, 0) as zone_4_seconds,
+        COALESCE(hr_zone_5_seconds, 0) as zone_5_seconds
+    FROM {{ ref('int_activities_enriched') }}
+    WHERE start_date IS NOT NULL
+      AND COALESCE(hr_zone_1_seconds, 0) + COALESCE(hr_zone_2_seconds, 0) + COALESCE(hr_zone_3_seconds, 0)
+        + COALESCE(hr_zone_4_seconds, 0) + COALESCE(hr_zone_5_seconds, 0) > 0
+),
+
+-- Every activity once per grain
+periods AS (
+    SELECT
+        'week' as period_grain,
+        DATE(activity_date, '-6 days', 'weekday 1') as period_start,  -- Monday on or before the activity
+        *
+    FROM activities
+    UNION ALL
+    SELECT
+        'month' as period_grain,
+        DATE(activity_date, 'start of month') as period_start,
+        *
+    FROM activities
+),
+
+category_rollups AS (
+    SELECT
+        period_grain,
+        period_start,
+        activity_category,
+        COUNT(*) as activity_count,
+        SUM(zone_1_seconds) as zone_1_seconds,
+        SUM(zone_2_seconds) as zone_2_seconds,
+        SUM(zone_3_seconds) as zone_3_seconds,
+        SUM(zone_4_seconds) as zone_4_seconds,
+        SUM(zone_5_seconds) as zone_5_seconds
+    FROM periods
+    GROUP BY period_grain, period_start, activity_category
+),
+
+rollups AS (
+    SELECT * FROM category_rollups
+    UNION ALL
+    SELECT
+        period_grain,
+        period_start,
+        'All' as activity_category,
+        SUM(activity_count),
+        SUM(zone_1_seconds),
+        SUM(zone_2_seconds),
+        SUM(zone_3_seconds),
+        SUM(zone_4_seconds),
+        SUM(zone_5_seconds)
+    FROM category_rollups
+    GROUP BY period_grain, period_start
+),
+
+distribution AS (
+    SELECT
+        -- Keys
+        period_grain || '|' || period_start || '|' || activity_category as period_key,
+        period_grain,
+        period_start,
+        CASE period_grain
+            WHEN 'week' THEN DATE(period_start, '+6 days')
+            ELSE DATE(period_start, '+1 month', '-1 day')
+        END as period_end,
+        CAST(STRFTIME('%Y', period_start) AS INTEGER) as year,
+        activity_category,
+
+        activity_count,
+
+        -- Minutes per zone
+        ROUND(zone_1_seconds / 60.0, 1) as zone_1_minutes,
+        ROUND(zone_2_seconds / 60.0, 1) as zone_2_minutes,
+        ROUND(zone_3_seconds / 60.0, 1) as zone_3_minutes,
+        ROUND(zone_4_seconds / 60.0, 1) as zone_4_minutes,
+        ROUND(zone_5_seconds / 60.0, 1) as zone_5_minutes,
+
+        -- Three-intensity model
+        ROUND((zone_1_seconds + zone_2_seconds) / 60.0, 1) as low_intensity_minutes,
+        ROUND(zone_3_seconds / 60.0, 1) as moderate_intensity_minutes,
+        ROUND((zone_4_seconds + zone_5_seconds) / 60.0, 1) as high_intensity_minutes,
+
+        -- Share of the zone time (0-100)
+        ROUND(100.0 * (zone_1_seconds + zone_2_seconds)
+            / (zone_1_seconds + zone_2_seconds + zone_3_seconds + zone_4_seconds + zone_5_seconds), 1) as low_intensity_pct,
+        ROUND(100.0 * zone_3_seconds
+            / (zone_1_seconds + zone_2_seconds + zone_3_seconds + zone_4_seconds + zone_5_seconds), 1) as moderate_intensity_pct,
+        ROUND(100.0 * (zone_4_seconds + zone_5_seconds)
+            / (zone_1_seconds + zone_2_seconds + zone_3_seconds + zone_4_seconds + zone_5_seconds), 1) as high_intensity_pct
+
+    FROM rollups
+){% if is_incremental() %},
+
+changed_years AS (
+    -- New or changed periods
+    SELECT d.year
+    FROM distribution d
+    LEFT JOIN {{ this }} s ON s.period_key = d.period_key
+    WHERE s.period_key IS NULL
+       OR s.activity_count != d.activity_count
+       OR s.zone_1_minutes != d.zone_1_minutes
+       OR s.zone_2_minutes != d.zone_2_minutes
+       OR s.zone_3_minutes != d.zone_3_minutes
+       OR s.zone_4_minutes != d.zone_4_minutes
+       OR s.zone_5_minutes != d.zone_5_minutes
+    UNION
+    -- Periods without zone data anymore
+    SELECT s.year
+    FROM {{ this }} s
+    LEFT JOIN distribution d ON d.period_key = s.period_key
+    WHERE d.period_key IS NULL
+){% endif %}
+
+SELECT
+    *,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM distribution
+{% if is_incremental() %}
+WHERE year IN (SELECT year FROM changed_years)
+{% endif %}
@@ -12,15 +12,8 @@ categorized_activities AS (
         CAST(STRFTIME('%Y', start_date) AS INTEGER) as year,
         CAST(STRFTIME('%m', start_date) AS INTEGER) as month,
 
-        -- Activity categorization
-        CASE
-            WHEN activity_type_key IN ('running', 'trail_running') THEN 'Running'
-            WHEN activity_type_key IN ('cycling') THEN 'Cycling'
-            WHEN activity_type_key IN ('lap_swimming', 'open_water_swimming', 'swimming') THEN 'Swimming'
-            WHEN activity_type_key IN ('strength_training', 'indoor_cardio') THEN 'Strength'
-            WHEN activity_type_key IN ('multi_sport') THEN 'Multi-Sport'
-            ELSE 'Other'
-        END as activity_category,
+        -- Activity categorization (activity_types seed)
+        activity_category,
 
         -- Metrics to aggregate
         distance_km,
@@ -30,36 +23,19 @@ categorized_activities AS (
     FROM activities
 ),
 
--- Manual adjustments for multisport activity splits
--- These are one-off entries to allocate multisport distances to individual sport categories
+-- Multisport legs allocated to their sport (multisport_splits), on top of the
+-- Multi-Sport parent; they add distance, time and calories but no activities
 multisport_adjustments AS (
-    -- Ironman 70.3 Jönköping (July 2025) - Activity ID: 19650257049
-    -- Swim split
-    SELECT '2025-07' as year_month, 2025 as year, 7 as month, 'Swimming' as activity_category,
-           0 as activity_count, 1.99 as distance_km, 45.58 as duration_minutes, 386 as total_calories
-    UNION ALL
-    -- Bike split
-    SELECT '2025-07' as year_month, 2025 as year, 7 as month, 'Cycling' as activity_category,
-           0 as activity_count, 89.80 as distance_km, 165.09 as duration_minutes, 982 as total_calories
-    UNION ALL
-    -- Run split
-    SELECT '2025-07' as year_month, 2025 as year, 7 as month, 'Running' as activity_category,
-           0 as activity_count, 20.64 as distance_km, 100.56 as duration_minutes, 1421 as total_calories
-
-    UNION ALL
-
-    -- Copenhagen Multisport (June 2025) - Activity ID: 19579526871
-    -- Swim split
-    SELECT '2025-06' as year_month, 2025 as year, 6 as month, 'Swimming' as activity_category,
-           0 as activity_count, 1.85 as distance_km, 48.72 as duration_minutes, 354 as total_calories
-    UNION ALL
-    -- Bike split
-    SELECT '2025-06' as year_month, 2025 as year, 6 as month, 'Cycling' as activity_category,
-           0 as activity_count, 53.98 as distance_km, 121.09 as duration_minutes, 840 as total_calories
-    UNION ALL
-    -- Run split
-    SELECT '2025-06' as year_month, 2025 as year, 6 as month, 'Running' as activity_category,
-           0 as activity_count, 5.27 as distance_km, 24.28 as duration_minutes, 353 as total_calories
+    SELECT
+        year_month,
+        year,
+        month,
+        activity_category,
+        0 as activity_count,
+        distance_km,
+        duration_minutes,
+        total_calories
+    FROM {{ ref('multisport_splits') }}
 ),
 
 aggregated_activities AS (
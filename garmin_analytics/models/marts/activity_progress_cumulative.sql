@@ -0,0 +1,182 @@
+-- Marts model: Cumulative year-to-date progress by day of year, per activity category
+-- Purpose: Pre-accumulated series for the year-over-year comparison chart
+-- One row per year, category (plus 'All') and calendar day, up to today for the current year
+--
+-- Incremental: a run only rebuilds the years whose totals changed (new, edited or
+-- recategorised activities) or that don't reach their last day yet (the current year
+-- grows by a day on every run); unique_key='year' replaces those years as a whole.
+-- Use --full-refresh after changing the model.
+
+{{ config(
+    materialized='incremental',
+    unique_key='year',
+    post_hook=[
+        "CREATE INDEX IF NOT EXISTS idx_activity_progress_cumulative ON activity_progress_cumulative (activity_category, year, day_of_year)",
+    ]
+) }}
+
+WITH activities AS (
+    SELECT * FROM {{ ref('int_activities_enriched') }}
+),
+
+category_daily AS (
+    SELECT
+        DATE(start_date) as activity_date,
+        CAST(strftime('%Y', start_date) AS INTEGER) as year,
+        activity_category,
+        COUNT(*) as activity_count,
+        SUM(COALESCE(distance_km, 0)) as distance_km,
+        SUM(COALESCE(duration_minutes, 0)) as duration_minutes,
+        SUM(COALESCE(total_calories, 0)) as calories
+    FROM activities
+    WHERE start_date IS NOT NULL
+    GROUP BY DATE(start_date), activity_category
+),
+
+-- Multisport legs count towards their sport's series (distance, time, calories,
+-- no activities), like in activity_kpis_monthly; 'All' counts each event once
+split_daily AS (
+    SELECT
+        start_date as activity_date,
+        year,
+        activity_category,
+        0 as activity_count,
+        SUM(COALESCE(distance_km, 0)) as distance_km,
+        SUM(COALESCE(duration_minutes, 0)) as duration_minutes,
+        SUM(COALESCE(total_calories, 0)) as calories
+    FROM {{ ref('multisport_splits') }}
+    GROUP BY start_date, activity_category
+),
+
+daily AS (
+    SELECT
+        activity_date,
+        year,
+        activity_category,
+        SUM(activity_count) as activity_count,
+        SUM(distance_km) as distance_km,
+        SUM(duration_minutes) as duration_minutes,
+        SUM(calories) as calories
+    FROM (
+        SELECT * FROM category_daily
+        UNION ALL
+        SELECT * FROM split_daily
+    )
+    GROUP BY activity_date, activity_category
+    UNION ALL
+    SELECT
+        activity_date,
+        year,
+        'All' as activity_category,
+        SUM(activity_count),
+        SUM(distance_km),
+        SUM(duration_minutes),
+        SUM(calories)
+    FROM category_daily
+    GROUP BY activity_date, year
+),
+
+-- Every year with activities x every category, so a year without e.g. swimming
+-- still has a (flat) swimming line to compare against
+all_series AS (
+    SELECT years.year, categories.activity_category
+    FROM (SELECT DISTINCT year FROM daily) as years
+    CROSS JOIN (SELECT DISTINCT activity_category FROM daily) as categories
+),
+
+{% if is_incremental() %}
+
+fresh_totals AS (
+    SELECT
+        s.year,
+        s.activity_category,
+        COALESCE(SUM(d.activity_count), 0) as activity_count,
+        ROUND(COALESCE(SUM(d.distance_km), 0), 2) as distance_km,
+        ROUND(COALESCE(SUM(d.duration_minutes), 0) / 60.0, 2) as duration_hours
+    FROM all_series s
+    LEFT JOIN daily d ON d.year = s.year AND d.activity_category = s.activity_category
+    GROUP BY s.year, s.activity_category
+),
+
+stored_totals AS (
+    SELECT
+        year,
+        activity_category,
+        MAX(cumulative_activities) as activity_count,
+        MAX(cumulative_distance_km) as distance_km,
+        MAX(cumulative_duration_hours) as duration_hours,
+        MAX(progress_date) as last_date
+    FROM {{ this }}
+    GROUP BY year, activity_category
+),
+
+changed_years AS (
+    -- New or changed totals
+    SELECT f.year
+    FROM fresh_totals f
+    LEFT JOIN stored_totals s ON s.year = f.year AND s.activity_category = f.activity_category
+    WHERE s.year IS NULL
+       OR f.activity_count != s.activity_count
+       OR f.distance_km != s.distance_km
+       OR f.duration_hours != s.duration_hours
+    UNION
+    -- Categories that disappeared from a year
+    SELECT s.year
+    FROM stored_totals s
+    LEFT JOIN fresh_totals f ON f.year = s.year AND f.activity_category = s.activity_category
+    WHERE f.year IS NULL
+    UNION
+    -- Years whose series doesn't reach the last day yet (current year, missed runs)
+    SELECT year
+    FROM stored_totals
+    WHERE last_date < MIN(DATE(year || '-12-31'), DATE('now'))
+),
+
+series AS (
+    SELECT * FROM all_series WHERE year IN (SELECT year FROM changed_years)
+),
+
+{% else %}
+
+series AS (
+    SELECT * FROM all_series
+),
+
+{% endif %}
+
+-- Every calendar day of each year being built, up to today for the current year
+calendar AS (
+    SELECT year, DATE(year || '-01-01') as progress_date
+    FROM (SELECT DISTINCT year FROM series)
+    UNION ALL
+    SELECT year, DATE(progress_date, '+1 day')
+    FROM calendar
+    WHERE progress_date < MIN(DATE(year || '-12-31'), DATE('now'))
+)
+
+SELECT
+    c.year,
+    s.activity_category,
+    c.progress_date,
+    CAST(strftime('%j', c.progress_date) AS INTEGER) as day_of_year,
+
+    -- Running totals since January 1st
+    SUM(COALESCE(d.activity_count, 0)) OVER year_to_date as cumulative_activities,
+    ROUND(SUM(COALESCE(d.distance_km, 0)) OVER year_to_date, 2) as cumulative_distance_km,
+    ROUND(SUM(COALESCE(d.duration_minutes, 0)) OVER year_to_date / 60.0, 2) as cumulative_duration_hours,
+    ROUND(SUM(COALESCE(d.calories, 0)) OVER year_to_date, 0) as cumulative_calories,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM calendar c
+JOIN series s ON s.year = c.year
+LEFT JOIN daily d
+    ON d.year = c.year
+   AND d.activity_category = s.activity_category
+   AND d.activity_date = c.progress_date
+WINDOW year_to_date AS (
+    PARTITION BY c.year, s.activity_category
+    ORDER BY c.progress_date
+    ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+)
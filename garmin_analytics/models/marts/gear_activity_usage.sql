@@ -0,0 +1,38 @@
+-- Marts model: Gear usage per activity, derived locally from activity-gear links
+-- One row per activity and gear item, maintained incrementally:
+-- each run only appends activities that are not in the table yet
+
+{{ config(materialized='incremental') }}
+
+WITH activity_gear AS (
+    SELECT DISTINCT activity_id, gear_id FROM {{ ref('stg_activity_gear') }}
+),
+
+activities AS (
+    SELECT * FROM {{ ref('stg_activities') }}
+)
+
+SELECT
+    ag.activity_id,
+    ag.gear_id,
+
+    -- Time dimensions (for per-period gear mileage)
+    a.start_date as activity_date,
+    CAST(STRFTIME('%Y', a.start_date) AS INTEGER) as year,
+    CAST(STRFTIME('%m', a.start_date) AS INTEGER) as month,
+    STRFTIME('%Y-%m', a.start_date) as year_month,
+
+    -- Usage metrics
+    COALESCE(a.distance_km, 0) as distance_km,
+    COALESCE(a.duration_minutes, 0) as duration_minutes,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM activity_gear ag
+INNER JOIN activities a ON ag.activity_id = a.activity_id
+
+{% if is_incremental() %}
+-- Only new activities; already counted ones keep their original row
+WHERE ag.activity_id NOT IN (SELECT activity_id FROM {{ this }})
+{% endif %}
@@ -0,0 +1,56 @@
+-- Marts model: Weekly gear mileage
+-- One row per gear item and week (starting Monday) it was used in
+-- Source for the rolling mileage in gear_wear_forecast
+--
+-- Incremental: a run only rebuilds the gear-weeks of activities appended to
+-- gear_activity_usage since the last run (unique_key replaces those weeks).
+-- Like gear_activity_usage, use --full-refresh after changing the model.
+
+{{ config(
+    materialized='incremental',
+    unique_key='gear_week_key',
+    post_hook=[
+        "CREATE INDEX IF NOT EXISTS idx_gear_mileage_weekly ON gear_mileage_weekly (gear_id, week_start)",
+    ]
+) }}
+
+WITH usage AS (
+    SELECT
+        activity_id,
+        gear_id,
+        DATE(activity_date, '-6 days', 'weekday 1') as week_start,  -- Monday on or before the activity
+        distance_km,
+        duration_minutes,
+        dbt_loaded_at
+    FROM {{ ref('gear_activity_usage') }}
+    WHERE activity_date IS NOT NULL
+){% if is_incremental() %},
+
+changed_weeks AS (
+    -- Weeks of the activities gear_activity_usage appended in this run
+    SELECT DISTINCT gear_id, week_start
+    FROM usage
+    WHERE dbt_loaded_at >= (SELECT MAX(dbt_loaded_at) FROM {{ this }})
+){% endif %}
+
+SELECT
+    -- Keys
+    gear_id || '|' || week_start as gear_week_key,
+    gear_id,
+    week_start,
+    DATE(week_start, '+6 days') as week_end,
+    CAST(STRFTIME('%Y', week_start) AS INTEGER) as year,
+
+    -- Usage metrics
+    COUNT(DISTINCT activity_id) as activity_count,
+    ROUND(SUM(distance_km), 2) as distance_km,
+    ROUND(SUM(duration_minutes) / 60.0, 1) as duration_hours,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM usage
+{% if is_incremental() %}
+WHERE (gear_id, week_start) IN (SELECT gear_id, week_start FROM changed_weeks)
+{% endif %}
+GROUP BY gear_id, week_start
@@ -1,5 +1,37 @@
 -- Marts model: Complete gear overview with usage statistics
 -- Business-ready table combining gear details with usage metrics
+-- Totals = last reconciled Garmin stats + locally derived usage since then,
+-- so the per-item stats call is only needed for reconciliation
+
+WITH usage_since_stats AS (
+    -- Activities recorded after the Garmin stats were last fetched
+    SELECT
+        usage.gear_id,
+        SUM(usage.distance_km) as distance_km,
+        COUNT(DISTINCT usage.activity_id) as activity_count
+    FROM {{ ref('gear_activity_usage') }} as usage
+    INNER JOIN {{ ref('stg_activities') }} as activities
+        ON usage.activity_id = activities.activity_id
+    LEFT JOIN {{ ref('stg_gear_stats') }} as stats
+        ON usage.gear_id = stats.gear_id
+    -- Compare UTC timestamps, so activities later on the reconciliation day count too,
+    -- whatever the athlete's time zone
+    WHERE stats.gear_id IS NULL
+       OR activities.start_time_gmt > stats.reconciled_at
+    GROUP BY usage.gear_id
+),
+
+gear_totals AS (
+    SELECT
+        list.gear_id,
+        ROUND(COALESCE(stats.total_distance_km, 0) + COALESCE(recent.distance_km, 0), 2) as total_distance_km,
+        COALESCE(stats.total_activities, 0) + COALESCE(recent.activity_count, 0) as total_activities
+    FROM {{ ref('stg_gear_list') }} as list
+    LEFT JOIN {{ ref('stg_gear_stats') }} as stats
+        ON list.gear_id = stats.gear_id
+    LEFT JOIN usage_since_stats as recent
+        ON list.gear_id = recent.gear_id
+)
 
 SELECT
     -- Gear identification
@@ -7,36 +39,46 @@ SELECT
     list.gear_type,
     list.gear_name,
     list.status,
-    
+
     -- Dates
     list.start_date,
     list.end_date,
     stats.updated_at as stats_last_updated,
-    
+    local_usage.last_used_date,
+
     -- Usage metrics
-    stats.total_distance_km,
-    stats.total_activities,
+    totals.total_distance_km,
+    totals.total_activities,
     list.max_distance_km,
-    
+
+    -- Reconciliation: remote totals as of stats_reconciled_at
+    stats.reconciled_at as stats_reconciled_at,
+    stats.total_distance_km as reconciled_distance_km,
+    stats.total_activities as reconciled_activities,
+
     -- Derived metrics: How much life is left in the gear?
-    CASE 
-        WHEN list.max_distance_km IS NOT NULL THEN 
-            ROUND((stats.total_distance_km / list.max_distance_km) * 100, 1)
+    CASE
+        WHEN list.max_distance_km IS NOT NULL THEN
+            ROUND((totals.total_distance_km / list.max_distance_km) * 100, 1)
         ELSE NULL
     END as pct_of_max_distance_used,
-    
-    CASE 
+
+    CASE
         WHEN list.max_distance_km IS NOT NULL THEN
-            ROUND(list.max_distance_km - stats.total_distance_km, 2)
+            ROUND(list.max_distance_km - totals.total_distance_km, 2)
         ELSE NULL
     END as remaining_distance_km,
-    
+
     -- How long has this gear been in use?
      CAST(JULIANDAY('now') - JULIANDAY(list.start_date) AS INTEGER) as days_since_first_use,
-    
+
     -- Metadata
     CURRENT_TIMESTAMP as dbt_loaded_at
 
 FROM {{ ref('stg_gear_list') }} as list
-INNER JOIN {{ ref('stg_gear_stats') }} as stats
-    ON list.gear_id = stats.gear_id
\ No newline at end of file
+INNER JOIN gear_totals as totals
+    ON list.gear_id = totals.gear_id
+LEFT JOIN {{ ref('stg_gear_stats') }} as stats
+    ON list.gear_id = stats.gear_id
+LEFT JOIN {{ ref('gear_usage') }} as local_usage
+    ON list.gear_id = local_usage.gear_id
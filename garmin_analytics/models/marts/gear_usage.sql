@@ -0,0 +1,19 @@
+-- Marts model: Locally derived gear usage totals
+-- One row per gear item with distance, activity count and last use,
+-- computed from gear_activity_usage instead of one Garmin stats call per item
+
+SELECT
+    gear_id,
+
+    ROUND(SUM(distance_km), 2) as total_distance_km,
+    COUNT(DISTINCT activity_id) as total_activities,
+    ROUND(SUM(duration_minutes) / 60.0, 1) as total_duration_hours,
+
+    MIN(activity_date) as first_used_date,
+    MAX(activity_date) as last_used_date,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ ref('gear_activity_usage') }}
+GROUP BY gear_id
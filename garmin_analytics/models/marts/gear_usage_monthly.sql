@@ -0,0 +1,24 @@
+-- Marts model: Monthly gear mileage
+-- One row per gear item and month it was used in
+
+SELECT
+    usage.gear_id,
+    list.gear_name,
+    list.gear_type,
+
+    usage.year_month,
+    usage.year,
+    usage.month,
+
+    ROUND(SUM(usage.distance_km), 2) as total_distance_km,
+    COUNT(DISTINCT usage.activity_id) as activity_count,
+    ROUND(SUM(usage.duration_minutes) / 60.0, 1) as total_duration_hours,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ ref('gear_activity_usage') }} as usage
+LEFT JOIN {{ ref('stg_gear_list') }} as list
+    ON usage.gear_id = list.gear_id
+GROUP BY usage.gear_id, list.gear_name, list.gear_type, usage.year_month, usage.year, usage.month
+ORDER BY usage.year DESC, usage.month DESC, total_distance_km DESC
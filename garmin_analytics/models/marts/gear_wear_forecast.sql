@@ -0,0 +1,102 @@
+-- Marts model: Gear wear forecast
+-- One row per gear item with its recent weekly mileage and, for active gear
+-- with a maximum distance, the projected date it reaches that distance
+--
+-- The projection assumes the item keeps its average weekly mileage of the
+-- last 12 full weeks (the current week is still running and left out), or of
+-- the full weeks since its first use when that is more recent.
+-- Depends on today's date, so the workflow rebuilds it on every run.
+
+WITH weeks AS (
+    SELECT
+        DATE('now', '-6 days', 'weekday 1') as current_week_start
+),
+
+recent_mileage AS (
+    SELECT
+        mileage.gear_id,
+        ROUND(SUM(CASE
+            WHEN mileage.week_start >= DATE(weeks.current_week_start, '-28 days') THEN mileage.distance_km
+            ELSE 0
+        END), 2) as last_4_weeks_km,
+        ROUND(SUM(mileage.distance_km), 2) as last_12_weeks_km
+    FROM {{ ref('gear_mileage_weekly') }} as mileage
+    CROSS JOIN weeks
+    WHERE mileage.week_start >= DATE(weeks.current_week_start, '-84 days')
+      AND mileage.week_start < weeks.current_week_start
+    GROUP BY mileage.gear_id
+),
+
+forecast AS (
+    SELECT
+        overview.gear_id,
+        overview.gear_type,
+        overview.gear_name,
+        overview.status,
+        overview.start_date,
+        overview.last_used_date,
+        overview.total_distance_km,
+        overview.max_distance_km,
+        overview.pct_of_max_distance_used,
+        overview.remaining_distance_km,
+        COALESCE(recent.last_4_weeks_km, 0) as last_4_weeks_km,
+        COALESCE(recent.last_12_weeks_km, 0) as last_12_weeks_km,
+        -- Gear first used within the window is averaged over the weeks it existed
+        COALESCE(recent.last_12_weeks_km, 0) / MAX(1, MIN(12, COALESCE(
+            CAST((JULIANDAY(weeks.current_week_start) - JULIANDAY(overview.start_date)) / 7 AS INTEGER), 12
+        ))) as weekly_km
+    FROM {{ ref('gear_overview') }} as overview
+    CROSS JOIN weeks
+    LEFT JOIN recent_mileage as recent
+        ON overview.gear_id = recent.gear_id
+)
+
+SELECT
+    -- Gear identification
+    gear_id,
+    gear_type,
+    gear_name,
+    status,
+
+    -- Dates
+    start_date,
+    last_used_date,
+
+    -- Usage metrics (from gear_overview)
+    total_distance_km,
+    max_distance_km,
+    pct_of_max_distance_used,
+    remaining_distance_km,
+
+    -- Rolling mileage
+    last_4_weeks_km,
+    last_12_weeks_km,
+    ROUND(weekly_km, 1) as avg_weekly_km,
+
+    -- Forecast
+    CASE
+        WHEN status != 'active' THEN 'retired'
+        WHEN max_distance_km IS NULL THEN 'no_limit'
+        WHEN remaining_distance_km <= 0 THEN 'due'
+        WHEN weekly_km = 0 THEN 'idle'
+        ELSE 'projected'
+    END as forecast_status,
+
+    CASE
+        WHEN status = 'active' AND max_distance_km IS NOT NULL AND weekly_km > 0 THEN
+            ROUND(MAX(remaining_distance_km, 0) / weekly_km, 1)
+        ELSE NULL
+    END as weeks_remaining,
+
+    CASE
+        WHEN status != 'active' OR max_distance_km IS NULL THEN NULL
+        WHEN remaining_distance_km <= 0 THEN DATE('now')
+        WHEN weekly_km > 0 THEN
+            DATE('now', '+' || CAST(ROUND(remaining_distance_km / weekly_km * 7) AS INTEGER) || ' days')
+        ELSE NULL
+    END as projected_replacement_date,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM forecast
@@ -0,0 +1,74 @@
+-- Marts model: Multisport activities split into their legs, per activity category
+-- Purpose: Allocates each swim, bike and run leg of a multisport event to its
+-- category, so the KPI marts count triathlon distances per sport
+-- One row per leg; transitions are left out (their time stays with the parent only)
+--
+-- Incremental: a run only adds legs of newly fetched events, and re-emits legs
+-- whose category (activity_types seed) or metrics changed, e.g. after a replay.
+
+{{ config(
+    materialized='incremental',
+    unique_key='child_activity_id',
+    post_hook=[
+        "CREATE INDEX IF NOT EXISTS idx_multisport_splits_child ON multisport_splits (child_activity_id)",
+    ]
+) }}
+
+WITH legs AS (
+    SELECT * FROM {{ ref('stg_multisport_children') }}
+),
+
+parents AS (
+    SELECT activity_id, activity_name, start_date FROM {{ ref('stg_activities') }}
+),
+
+activity_types AS (
+    SELECT * FROM {{ ref('activity_types') }}
+),
+
+allocated_legs AS (
+    SELECT
+        -- IDs
+        l.child_activity_id,
+        l.parent_activity_id,
+        p.activity_name as parent_activity_name,
+
+        -- Activity categorization (activity_types seed)
+        l.activity_type_key,
+        COALESCE(t.activity_category, 'Other') as activity_category,
+
+        -- Time dimensions of the parent, so every leg counts in the month of the event
+        p.start_date,
+        STRFTIME('%Y-%m', p.start_date) as year_month,
+        CAST(STRFTIME('%Y', p.start_date) AS INTEGER) as year,
+        CAST(STRFTIME('%m', p.start_date) AS INTEGER) as month,
+
+        -- Metrics
+        l.distance_km,
+        l.duration_minutes,
+        l.total_calories
+
+    FROM legs l
+    JOIN parents p ON p.activity_id = l.parent_activity_id
+    LEFT JOIN activity_types t ON l.activity_type_key = t.activity_type_key
+    WHERE l.activity_type_key NOT LIKE 'transition%'
+)
+
+SELECT
+    *,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM allocated_legs
+{% if is_incremental() %}
+WHERE NOT EXISTS (
+    SELECT 1 FROM {{ this }} s
+    WHERE s.child_activity_id = allocated_legs.child_activity_id
+      AND s.activity_category = allocated_legs.activity_category
+      -- IS: legs without a distance (or calories) compare equal
+      AND s.distance_km IS allocated_legs.distance_km
+      AND s.duration_minutes IS allocated_legs.duration_minutes
+      AND s.total_calories IS allocated_legs.total_calories
+)
+{% endif %}
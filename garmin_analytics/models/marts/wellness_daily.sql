@@ -0,0 +1,70 @@
+-- Marts model: Daily wellness metrics next to the day's training
+-- One row per date with any wellness data (steps, body battery, resting HR,
+-- stress, sleep, HRV), joined to activity_daily_summary
+
+WITH wellness_dates AS (
+    SELECT wellness_date FROM {{ ref('stg_daily_steps') }}
+    UNION
+    SELECT wellness_date FROM {{ ref('stg_body_battery') }}
+    UNION
+    SELECT wellness_date FROM {{ ref('stg_daily_health') }}
+    UNION
+    SELECT wellness_date FROM {{ ref('stg_sleep') }}
+    UNION
+    SELECT wellness_date FROM {{ ref('stg_hrv') }}
+)
+
+SELECT
+    d.wellness_date,
+
+    -- Time-based fields for easy filtering
+    CAST(strftime('%Y', d.wellness_date) AS INTEGER) as year,
+    CAST(strftime('%m', d.wellness_date) AS INTEGER) as month,
+    CAST(strftime('%w', d.wellness_date) AS INTEGER) as day_of_week, -- 0=Sunday, 6=Saturday
+
+    -- Steps
+    steps.total_steps,
+    steps.step_goal,
+
+    -- Heart Rate & Stress
+    health.resting_heart_rate,
+    health.avg_stress_level,
+    health.max_stress_level,
+    health.high_stress_minutes,
+
+    -- Body Battery
+    battery.body_battery_high,
+    battery.body_battery_low,
+    battery.body_battery_charged,
+    battery.body_battery_drained,
+
+    -- Sleep (night ending on this date)
+    sleep.sleep_hours,
+    sleep.deep_sleep_minutes,
+    sleep.light_sleep_minutes,
+    sleep.rem_sleep_minutes,
+    sleep.awake_minutes,
+    sleep.sleep_score,
+
+    -- HRV
+    hrv.hrv_last_night_avg_ms,
+    hrv.hrv_weekly_avg_ms,
+    hrv.hrv_status,
+
+    -- Training that day (0 on rest days)
+    CASE WHEN activities.activity_date IS NOT NULL THEN 1 ELSE 0 END as is_training_day,
+    COALESCE(activities.total_duration_minutes, 0) as training_duration_minutes,
+    COALESCE(activities.total_distance_km, 0) as training_distance_km,
+    COALESCE(activities.total_calories, 0) as training_calories,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM wellness_dates d
+LEFT JOIN {{ ref('stg_daily_steps') }} as steps ON d.wellness_date = steps.wellness_date
+LEFT JOIN {{ ref('stg_daily_health') }} as health ON d.wellness_date = health.wellness_date
+LEFT JOIN {{ ref('stg_body_battery') }} as battery ON d.wellness_date = battery.wellness_date
+LEFT JOIN {{ ref('stg_sleep') }} as sleep ON d.wellness_date = sleep.wellness_date
+LEFT JOIN {{ ref('stg_hrv') }} as hrv ON d.wellness_date = hrv.wellness_date
+LEFT JOIN {{ ref('activity_daily_summary') }} as activities ON d.wellness_date = activities.activity_date
+ORDER BY d.wellness_date DESC
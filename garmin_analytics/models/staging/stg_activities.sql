@@ -10,13 +10,14 @@ SELECT
     
     -- Activity Info
     activityName as activity_name,
-    json_extract(activityType, '$.typeKey') as activity_type_key,  -- ✅ Extract from JSON
+    activityTypeKey as activity_type_key,  -- ✅ Flattened from activityType at ingest
     locationName as location_name,
     
     -- Timestamps (convert to proper dates)
     DATE(startTimeLocal) as start_date,
     TIME(startTimeLocal) as start_time_local,
     TIME(datetime(startTimeLocal, '+' || CAST(duration AS INTEGER) || ' seconds')) as end_time_local,
+    DATETIME(startTimeGMT) as start_time_gmt,
     
     -- Distances & Durations (convert to readable units)
     ROUND(distance / 1000, 2) as distance_km,
@@ -17,7 +17,7 @@ SELECT
     windDirectionCompassPoint as wind_direction,
 
     -- Weather condition
-    json_extract(weatherTypeDTO, '$.desc') as weather_condition,
+    weatherTypeDesc as weather_condition,  -- flattened from weatherTypeDTO at ingest
 
     -- Location (where weather was measured)
     ROUND(latitude, 6) as weather_latitude,
@@ -0,0 +1,15 @@
+-- Staging model: Daily body battery
+-- Source: bronze_body_battery table (extract_wellness.py, date-range endpoint)
+
+SELECT
+    calendarDate as wellness_date,  -- already YYYY-MM-DD; a plain column keeps the mart joins indexable
+
+    CAST(bodyBatteryHigh AS INTEGER) as body_battery_high,
+    CAST(bodyBatteryLow AS INTEGER) as body_battery_low,
+    CAST(charged AS INTEGER) as body_battery_charged,
+    CAST(drained AS INTEGER) as body_battery_drained,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ source('main', 'bronze_body_battery') }}
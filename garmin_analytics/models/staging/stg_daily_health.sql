@@ -0,0 +1,23 @@
+-- Staging model: Daily resting heart rate and stress
+-- Source: bronze_daily_health table (extract_wellness.py, daily summary endpoint)
+
+SELECT
+    calendarDate as wellness_date,  -- already YYYY-MM-DD; a plain column keeps the mart joins indexable
+
+    -- Heart Rate
+    CAST(restingHeartRate AS INTEGER) as resting_heart_rate,
+    CAST(minHeartRate AS INTEGER) as min_heart_rate,
+    CAST(maxHeartRate AS INTEGER) as max_heart_rate,
+
+    -- Stress (Garmin reports -1/-2 when there was not enough data)
+    CASE WHEN averageStressLevel >= 0 THEN CAST(averageStressLevel AS INTEGER) END as avg_stress_level,
+    CASE WHEN maxStressLevel >= 0 THEN CAST(maxStressLevel AS INTEGER) END as max_stress_level,
+    ROUND(restStressDuration / 60.0, 0) as rest_stress_minutes,
+    ROUND(lowStressDuration / 60.0, 0) as low_stress_minutes,
+    ROUND(mediumStressDuration / 60.0, 0) as medium_stress_minutes,
+    ROUND(highStressDuration / 60.0, 0) as high_stress_minutes,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ source('main', 'bronze_daily_health') }}
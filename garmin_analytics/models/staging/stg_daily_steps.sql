@@ -0,0 +1,14 @@
+-- Staging model: Daily step counts
+-- Source: bronze_daily_steps table (extract_wellness.py, date-range endpoint)
+
+SELECT
+    calendarDate as wellness_date,  -- already YYYY-MM-DD; a plain column keeps the mart joins indexable
+
+    CAST(totalSteps AS INTEGER) as total_steps,
+    CAST(stepGoal AS INTEGER) as step_goal,
+    ROUND(totalDistance / 1000, 2) as step_distance_km,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ source('main', 'bronze_daily_steps') }}
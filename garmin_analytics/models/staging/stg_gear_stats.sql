@@ -11,6 +11,9 @@ SELECT
     ROUND(totalDistance / 1000, 2) as total_distance_km,
 
     ROUND(totalActivities, 0) as total_activities,
+
+    -- When these totals were fetched (UTC); local usage started after this moment is added on top
+    DATETIME(reconciledAt) as reconciled_at,
     
     -- Metadata
     CURRENT_TIMESTAMP as dbt_loaded_at
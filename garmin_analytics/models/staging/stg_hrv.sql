@@ -0,0 +1,16 @@
+-- Staging model: Overnight heart rate variability
+-- Source: bronze_hrv table (extract_wellness.py)
+
+SELECT
+    calendarDate as wellness_date,  -- already YYYY-MM-DD; a plain column keeps the mart joins indexable
+
+    CAST(lastNightAvg AS INTEGER) as hrv_last_night_avg_ms,
+    CAST(lastNight5MinHigh AS INTEGER) as hrv_last_night_5min_high_ms,
+    CAST(weeklyAvg AS INTEGER) as hrv_weekly_avg_ms,
+    LOWER(status) as hrv_status,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ source('main', 'bronze_hrv') }}
+WHERE lastNightAvg IS NOT NULL  -- Only nights with an HRV reading
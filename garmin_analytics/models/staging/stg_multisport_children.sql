@@ -0,0 +1,24 @@
+-- Staging model: Legs of multisport activities (swim, bike, run, transitions)
+-- Source: bronze_multisport_children table (extract_multisport_splits.py)
+
+SELECT
+    -- IDs
+    activityId as child_activity_id,
+    parentActivityId as parent_activity_id,
+
+    -- Activity Info
+    activityName as activity_name,
+    activityTypeKey as activity_type_key,
+
+    -- Timestamps
+    DATE(startTimeLocal) as start_date,
+
+    -- Distances & Durations (same units as stg_activities)
+    ROUND(distance / 1000, 2) as distance_km,
+    ROUND(duration / 60, 2) as duration_minutes,
+    calories as total_calories,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ source('main', 'bronze_multisport_children') }}
@@ -0,0 +1,21 @@
+-- Staging model: Nightly sleep
+-- Source: bronze_sleep table (extract_wellness.py); the date is the day the night ended
+
+SELECT
+    calendarDate as wellness_date,  -- already YYYY-MM-DD; a plain column keeps the mart joins indexable
+
+    -- Durations (convert seconds to hours/minutes)
+    ROUND(sleepTimeSeconds / 3600.0, 2) as sleep_hours,
+    ROUND(deepSleepSeconds / 60.0, 0) as deep_sleep_minutes,
+    ROUND(lightSleepSeconds / 60.0, 0) as light_sleep_minutes,
+    ROUND(remSleepSeconds / 60.0, 0) as rem_sleep_minutes,
+    ROUND(awakeSleepSeconds / 60.0, 0) as awake_minutes,
+
+    CAST(sleepScore AS INTEGER) as sleep_score,
+    ROUND(avgSleepStress, 1) as avg_sleep_stress,
+
+    -- Metadata
+    CURRENT_TIMESTAMP as dbt_loaded_at
+
+FROM {{ source('main', 'bronze_sleep') }}
+WHERE sleepTimeSeconds > 0  -- Only nights with recorded sleep
@@ -0,0 +1,109 @@
+# migrate_bronze.py
+#
+# Brings bronze tables written by older extractor versions up to the columns
+# the staging models read, so `dbt run` works on an existing database before
+# the extractors have rewritten every table (local dev, CI on the committed
+# database). Idempotent; run before `dbt run`:
+#
+#   python migrate_bronze.py              # add and fill flattened columns
+#   python migrate_bronze.py --bootstrap  # also create missing bronze tables and
+#                                         # columns empty (CI without extractors)
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+
+# (table, column, SQL filling it from the nested JSON the extractors used to keep)
+FLATTENED_COLUMNS = [
+    ('bronze_activities', 'activityTypeKey', "json_extract(activityType, '$.typeKey')"),
+    ('bronze_activity_weather', 'weatherTypeDesc', "json_extract(weatherTypeDTO, '$.desc')"),
+]
+
+# Columns the staging models read from bronze tables that the committed database
+# may predate; --bootstrap creates what's missing, empty, so every model builds
+BOOTSTRAP_COLUMNS = {
+    'bronze_gear_stats': ['reconciledAt'],
+    'bronze_daily_steps': ['calendarDate', 'totalSteps', 'stepGoal', 'totalDistance'],
+    'bronze_body_battery': ['calendarDate', 'bodyBatteryHigh', 'bodyBatteryLow', 'charged', 'drained'],
+    'bronze_daily_health': [
+        'calendarDate', 'restingHeartRate', 'minHeartRate', 'maxHeartRate',
+        'averageStressLevel', 'maxStressLevel', 'restStressDuration',
+        'lowStressDuration', 'mediumStressDuration', 'highStressDuration',
+    ],
+    'bronze_sleep': [
+        'calendarDate', 'sleepTimeSeconds', 'deepSleepSeconds', 'lightSleepSeconds',
+        'remSleepSeconds', 'awakeSleepSeconds', 'sleepScore', 'avgSleepStress',
+    ],
+    'bronze_hrv': ['calendarDate', 'lastNightAvg', 'lastNight5MinHigh', 'weeklyAvg', 'status'],
+    'bronze_multisport_children': [
+        'parentActivityId', 'activityId', 'activityName', 'activityTypeKey',
+        'startTimeLocal', 'distance', 'duration', 'calories',
+    ],
+}
+
+
+def table_columns(conn, table):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+
+
+def add_flattened_columns(conn):
+    """Add and backfill the columns the extractors now flatten at ingest; returns the columns added"""
+    added = []
+    for table, column, expression in FLATTENED_COLUMNS:
+        columns = table_columns(conn, table)
+        if not columns or column in columns:
+            continue  # table not extracted yet, or already current
+        conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}" TEXT')
+        conn.execute(f'UPDATE "{table}" SET "{column}" = {expression}')
+        added.append(f"{table}.{column}")
+    conn.commit()
+    return added
+
+
+def bootstrap_tables(conn):
+    """Create missing bronze tables and columns empty; returns the tables and columns created"""
+    created = []
+    for table, required in BOOTSTRAP_COLUMNS.items():
+        columns = table_columns(conn, table)
+        if not columns:
+            # Untyped columns, like the tables pandas' to_sql would create
+            column_list = ', '.join(f'"{column}"' for column in required)
+            conn.execute(f'CREATE TABLE "{table}" ({column_list})')
+            created.append(table)
+            continue
+        for column in required:
+            if column not in columns:
+                conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}"')
+                created.append(f"{table}.{column}")
+    conn.commit()
+    return created
+
+
+def migrate(conn, bootstrap=False):
+    """Apply every migration; returns the changes made"""
+    changes = add_flattened_columns(conn)
+    if bootstrap:
+        changes += bootstrap_tables(conn)
+    return changes
+
+
+if __name__ == "__main__":
+    print(f"🔄 Migrating bronze tables at {datetime.now()}")
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        changes = migrate(conn, bootstrap='--bootstrap' in sys.argv)
+    except Exception as e:
+        print(f"❌ Error during bronze migration: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    if changes:
+        for change in changes:
+            print(f"  → {change}")
+        print(f"✅ Migrated {len(changes)} bronze table(s) and column(s)")
+    else:
+        print("✅ Bronze tables already current")
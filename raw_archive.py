@@ -0,0 +1,154 @@
+# raw_archive.py
+
+import gzip
+import io
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+
+ARCHIVE_DIR = 'data/raw'
+
+# zstd is used when the optional `zstandard` package is installed and asked for,
+# gzip otherwise (stdlib, always available)
+CODEC = os.getenv('GARMIN_ARCHIVE_CODEC', 'gzip')
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Extractors may fetch concurrently; appends to a partition must not interleave
+_append_lock = threading.Lock()
+
+
+def replay_requested():
+    """True when an extractor should rebuild bronze tables from the archive instead of the API"""
+    return '--replay' in sys.argv or os.getenv('GARMIN_REPLAY') == '1'
+
+
+def _request_key(args, kwargs):
+    """Stable key for one API call, used to match archived responses on replay"""
+    return json.dumps({'args': list(args), 'kwargs': kwargs}, sort_keys=True, default=str)
+
+
+def _partition_path(endpoint, day, codec):
+    extension = 'ndjson.zst' if codec == 'zstd' else 'ndjson.gz'
+    return os.path.join(ARCHIVE_DIR, endpoint, f"{day}.{extension}")
+
+
+def _open_for_append(path, codec):
+    if codec == 'zstd':
+        # Each run appends a new zstd frame; readers decode across frames
+        return io.TextIOWrapper(
+            zstandard.ZstdCompressor().stream_writer(open(path, 'ab'), closefd=True),
+            encoding='utf-8'
+        )
+    # Appending creates a new gzip member; gzip.open reads multi-member files transparently
+    return gzip.open(path, 'at', encoding='utf-8')
+
+
+def _open_for_read(path):
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True),
+            encoding='utf-8'
+        )
+    return gzip.open(path, 'rt', encoding='utf-8')
+
+
+def archive_response(endpoint, key, payload):
+    """Append one API response to today's compressed NDJSON partition for that endpoint"""
+    codec = 'zstd' if CODEC == 'zstd' and zstandard is not None else 'gzip'
+    fetched_at = datetime.now(timezone.utc)
+
+    path = _partition_path(endpoint, fetched_at.strftime('%Y-%m-%d'), codec)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    record = {
+        'endpoint': endpoint,
+        'key': key,
+        'fetched_at': fetched_at.isoformat(),
+        'payload': payload,
+    }
+    line = json.dumps(record, default=str) + '\n'
+    with _append_lock, _open_for_append(path, codec) as f:
+        f.write(line)
+
+
+def iter_archive(endpoint):
+    """Yield archived records for one endpoint, oldest partition first"""
+    endpoint_dir = os.path.join(ARCHIVE_DIR, endpoint)
+    if not os.path.isdir(endpoint_dir):
+        return
+
+    for filename in sorted(os.listdir(endpoint_dir)):
+        if not filename.endswith(('.ndjson.gz', '.ndjson.zst')):
+            continue
+        with _open_for_read(os.path.join(endpoint_dir, filename)) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class ArchivingApi:
+    """
+    Wraps a logged-in Garmin client and archives every `get_*` response.
+
+    Extractors use it exactly like the Garmin client; the raw payloads end up
+    under data/raw/<method>/<date>.ndjson.gz before they are flattened into bronze tables.
+    """
+
+    def __init__(self, api):
+        self._api = api
+
+    def __getattr__(self, name):
+        attr = getattr(self._api, name)
+        if not name.startswith('get_') or not callable(attr):
+            return attr
+
+        def archived_call(*args, **kwargs):
+            payload = attr(*args, **kwargs)
+            archive_response(name, _request_key(args, kwargs), payload)
+            return payload
+
+        return archived_call
+
+
+class ReplayApi:
+    """
+    Stand-in for the Garmin client that answers `get_*` calls from the raw archive.
+
+    The latest archived response for the same method and arguments wins, so
+    replaying rebuilds the bronze tables exactly as the last live run saw them.
+    Calls that were never archived raise, just like a failed API call would.
+    """
+
+    replaying = True
+
+    def __init__(self):
+        self._responses = {}
+
+    def _load(self, endpoint):
+        if endpoint not in self._responses:
+            responses = {}
+            for record in iter_archive(endpoint):
+                responses[record['key']] = record['payload']
+            self._responses[endpoint] = responses
+        return self._responses[endpoint]
+
+    def __getattr__(self, name):
+        if not name.startswith('get_'):
+            raise AttributeError(name)
+
+        def replayed_call(*args, **kwargs):
+            responses = self._load(name)
+            key = _request_key(args, kwargs)
+            if key not in responses:
+                raise LookupError(f"No archived response for {name}{key}")
+            return responses[key]
+
+        return replayed_call
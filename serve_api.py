@@ -0,0 +1,255 @@
+# serve_api.py
+#
+# Small read-only JSON API over the marts, so other tools don't have to
+# scrape the dashboard or copy garmin.db:
+#
+#   GET /                                    marts and their columns
+#   GET /marts/activity_details?year=2025&activity_category=Running
+#           &distance_km__gte=10&columns=start_date,activity_name,distance_km
+#           &limit=100&offset=0
+#
+# - Filters: <column>=<value> (repeat for IN), <column>__gte / __gt / __lte / __lt;
+#   all bound as SQL parameters
+# - columns=: projection; limit= (max MAX_LIMIT) and offset= page through a
+#   fixed order per mart, next_offset in the response points at the next page
+# - Responses are gzipped when the client accepts it
+# - ETag is derived from the database generation (see swap_database.py) and the
+#   request, so a client repeating a request with If-None-Match gets a 304
+#   without a query until the pipeline publishes new data
+#
+#   python serve_api.py [--host 127.0.0.1] [--port 8600]
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+DB_PATH = os.getenv('GARMIN_API_DB', 'data/garmin.db')
+
+# Exposed marts and the order pages are returned in
+MARTS = {
+    'activity_kpis_monthly': 'year DESC, month DESC, activity_category',
+    'activity_daily_summary': 'activity_date DESC',
+    'activity_details': 'start_date DESC, activity_id DESC',
+    'gear_overview': 'gear_type, gear_name',
+}
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 1024
+
+FILTER_OPERATORS = {'gte': '>=', 'gt': '>', 'lte': '<=', 'lt': '<'}
+
+
+class BadRequest(Exception):
+    pass
+
+
+def quote(column):
+    return f'"{column}"'
+
+
+def filter_value(value):
+    """Numbers as numbers, so they compare like the stored values (most mart columns have no type)"""
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+
+def database_generation():
+    """
+    Identity of the database currently in place.
+
+    publish swaps in a new file (new inode) or, on Windows, rewrites it in
+    place (new mtime), so this changes exactly when new data is published.
+    """
+    stat = os.stat(DB_PATH)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def open_database():
+    return sqlite3.connect(Path(DB_PATH).resolve().as_uri() + '?mode=ro', uri=True)
+
+
+def mart_columns(conn):
+    return {
+        mart: [row[1] for row in conn.execute(f'PRAGMA table_info("{mart}")')]
+        for mart in MARTS
+    }
+
+
+def build_query(mart, columns, params):
+    """
+    SELECT for one page of a mart from the request's query parameters.
+
+    Parameters:
+        mart (str): Key of MARTS
+        columns (list): Columns the mart has
+        params (list): (name, value) query parameters
+
+    Returns:
+        tuple: (sql, sql parameters, limit, offset)
+    """
+    projection = columns
+    limit, offset = DEFAULT_LIMIT, 0
+    equals = {}
+    conditions = []
+    values = []
+
+    for name, value in params:
+        if name == 'columns':
+            projection = [column for column in value.split(',') if column]
+            if not projection:
+                raise BadRequest("columns must name at least one column")
+            unknown = [column for column in projection if column not in columns]
+            if unknown:
+                raise BadRequest(f"Unknown column(s): {', '.join(unknown)}")
+        elif name in ('limit', 'offset'):
+            try:
+                number = int(value)
+            except ValueError:
+                raise BadRequest(f"{name} must be an integer")
+            if number < (1 if name == 'limit' else 0):
+                raise BadRequest(f"{name} must be at least {1 if name == 'limit' else 0}")
+            if name == 'limit':
+                limit = min(number, MAX_LIMIT)
+            else:
+                offset = number
+        else:
+            column, _, operator = name.partition('__')
+            if column not in columns:
+                raise BadRequest(f"Unknown filter column: {column}")
+            if not operator:
+                equals.setdefault(column, []).append(value)
+            elif operator in FILTER_OPERATORS:
+                conditions.append(f'{quote(column)} {FILTER_OPERATORS[operator]} ?')
+                values.append(filter_value(value))
+            else:
+                raise BadRequest(f"Unknown filter operator: {operator}")
+
+    for column, column_values in equals.items():
+        conditions.append(f'{quote(column)} IN ({",".join("?" * len(column_values))})')
+        values.extend(filter_value(value) for value in column_values)
+
+    sql = f'SELECT {", ".join(map(quote, projection))} FROM {quote(mart)}'
+    if conditions:
+        sql += ' WHERE ' + ' AND '.join(conditions)
+    # One extra row tells whether there is a next page
+    sql += f' ORDER BY {MARTS[mart]} LIMIT ? OFFSET ?'
+    values.extend([limit + 1, offset])
+
+    return sql, values, limit, offset
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'GarminMartsAPI/1.0'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = parse_qsl(url.query, keep_blank_values=True)
+
+        try:
+            generation = database_generation()
+        except FileNotFoundError:
+            return self.send_json(HTTPStatus.SERVICE_UNAVAILABLE, {'error': 'Database not available'})
+
+        # Same generation + same request = same body: answer from the client's cache
+        etag = 'W/"{}"'.format(hashlib.sha256(
+            repr((generation, url.path, sorted(params))).encode()
+        ).hexdigest()[:32])
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        conn = open_database()
+        try:
+            columns = mart_columns(conn)
+            path = url.path.rstrip('/')
+            if path == '':
+                return self.send_json(HTTPStatus.OK, {'marts': columns}, etag)
+
+            mart = path[len('/marts/'):] if path.startswith('/marts/') else None
+            if mart not in MARTS:
+                return self.send_json(HTTPStatus.NOT_FOUND, {'error': f"Unknown path: {url.path}"})
+            if not columns[mart]:
+                # dbt run hasn't created the mart yet
+                return self.send_json(HTTPStatus.SERVICE_UNAVAILABLE, {'error': f"Mart not available: {mart}"})
+
+            try:
+                sql, values, limit, offset = build_query(mart, columns[mart], params)
+            except BadRequest as e:
+                return self.send_json(HTTPStatus.BAD_REQUEST, {'error': str(e)})
+
+            try:
+                cursor = conn.execute(sql, values)
+                names = [description[0] for description in cursor.description]
+                rows = [dict(zip(names, row)) for row in cursor]
+            except sqlite3.OperationalError as e:
+                # e.g. the mart was dropped between reading its columns and the query
+                return self.send_json(HTTPStatus.SERVICE_UNAVAILABLE, {'error': f"Query failed: {e}"})
+        finally:
+            conn.close()
+
+        has_next_page = len(rows) > limit
+        self.send_json(HTTPStatus.OK, {
+            'mart': mart,
+            'columns': names,
+            'rows': rows[:limit],
+            'limit': limit,
+            'offset': offset,
+            'next_offset': offset + limit if has_next_page else None,
+        }, etag)
+
+    def send_json(self, status, payload, etag=None):
+        body = json.dumps(payload, separators=(',', ':')).encode()
+        gzip_body = len(body) >= GZIP_MIN_BYTES and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if gzip_body:
+            body = gzip.compress(body, compresslevel=6)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if gzip_body:
+            self.send_header('Content-Encoding', 'gzip')
+        if etag:
+            self.send_header('ETag', etag)
+            # Cache, but check back (cheap 304) before every reuse
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the Garmin marts")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    args = parser.parse_args()
+
+    if not os.path.exists(DB_PATH):
+        sys.exit(f"❌ Database not found: {DB_PATH}")
+
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    print(f"✅ Serving {', '.join(MARTS)} from {DB_PATH} on http://{args.host}:{args.port} ({datetime.now()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,102 @@
+# swap_database.py
+#
+# Blue/green builds of the Garmin database, so the dashboard never reads a
+# database that is being written (no lock waits, no half-built tables):
+#
+#   python swap_database.py prepare   # copy the live database into the build file
+#   ... run the extractors, dbt and the post-dbt steps with GARMIN_DB_PATH=<build file>
+#   python swap_database.py publish   # check the build and atomically rename it over the live file
+#
+# The live file is replaced in one rename. Connections still open on the old
+# file keep reading the previous generation until they reconnect; the dashboard
+# reconnects as soon as it sees the file was swapped (see dashboard/database.py).
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+LIVE_DB_PATH = 'data/garmin.db'
+BUILD_DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.build.db')
+
+# How long the backup fallback waits for readers to finish (ms)
+BUSY_TIMEOUT_MS = 30000
+
+
+def remove_database_files(path):
+    """Delete a database file together with any leftover journal files"""
+    for suffix in ('', '-journal', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def prepare_build(live_path=LIVE_DB_PATH, build_path=BUILD_DB_PATH):
+    """Start a new build from a consistent copy of the live database"""
+    remove_database_files(build_path)
+
+    build = sqlite3.connect(build_path)
+    try:
+        if os.path.exists(live_path):
+            # The backup API copies a consistent snapshot even while readers are connected
+            live = sqlite3.connect(Path(live_path).resolve().as_uri() + '?mode=ro', uri=True)
+            try:
+                live.backup(build)
+            finally:
+                live.close()
+        generation = build.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        build.close()
+
+    return generation
+
+
+def publish_build(live_path=LIVE_DB_PATH, build_path=BUILD_DB_PATH):
+    """Verify the build, stamp the next generation number and swap it into place"""
+    build = sqlite3.connect(build_path)
+    try:
+        check = build.execute("PRAGMA quick_check").fetchone()[0]
+        if check != 'ok':
+            raise RuntimeError(f"Build database failed integrity check: {check}")
+
+        generation = build.execute("PRAGMA user_version").fetchone()[0] + 1
+        build.execute(f"PRAGMA user_version = {generation}")
+        build.commit()
+    finally:
+        build.close()
+
+    # Make sure the new generation is on disk before it becomes visible
+    with open(build_path, 'rb+') as f:
+        os.fsync(f.fileno())
+
+    try:
+        os.replace(build_path, live_path)
+    except PermissionError:
+        # Windows refuses to rename over a file another process (e.g. the dashboard)
+        # has open. Copy the build into it with the backup API instead: a single
+        # write transaction, so readers wait briefly but never see a partial build.
+        print(f"  ⚠️ {live_path} is in use, copying the build into it instead", file=sys.stderr)
+        build = sqlite3.connect(build_path)
+        live = sqlite3.connect(live_path, timeout=BUSY_TIMEOUT_MS / 1000)
+        try:
+            build.backup(live)
+        finally:
+            live.close()
+            build.close()
+        remove_database_files(build_path)
+
+    return generation
+
+
+if __name__ == "__main__":
+    if os.path.abspath(BUILD_DB_PATH) == os.path.abspath(LIVE_DB_PATH):
+        sys.exit("❌ GARMIN_DB_PATH points at the live database; builds need a separate file")
+
+    if 'prepare' in sys.argv[1:]:
+        generation = prepare_build()
+        print(f"✅ Build database {BUILD_DB_PATH} prepared from generation {generation} at {datetime.now()}")
+    elif 'publish' in sys.argv[1:]:
+        generation = publish_build()
+        print(f"✅ Published generation {generation} to {LIVE_DB_PATH} at {datetime.now()}")
+    else:
+        sys.exit("Usage: python swap_database.py prepare|publish")
@@ -0,0 +1,161 @@
+# update_personal_records.py
+#
+# Maintains personal records from newly ingested activities only:
+#   - fastest average speed (pace) per activity category and distance bucket
+#   - longest distance per activity category
+#   - biggest elevation gain in a single day (all activities)
+#
+# personal_records holds the current record per key, personal_records_history
+# every time a record was set. Activities already considered are remembered in
+# personal_records_processed, so each run only looks at new ones.
+# Run after `dbt run` (reads activity_details).
+
+import os
+import sqlite3
+from datetime import datetime
+
+DB_PATH = os.getenv('GARMIN_DB_PATH', 'data/garmin.db')
+
+# Distance buckets too short (or empty) to be meaningful best efforts
+EXCLUDED_DISTANCE_CATEGORIES = ('No distance recorded', 'Under 1K')
+
+
+def create_record_tables(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS personal_records (
+            record_key TEXT PRIMARY KEY,
+            record_type TEXT,
+            activity_category TEXT,
+            distance_category TEXT,
+            value REAL,
+            unit TEXT,
+            activity_id INTEGER,
+            activity_name TEXT,
+            record_date TEXT,
+            previous_value REAL,
+            updated_at TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS personal_records_history (
+            record_key TEXT,
+            record_type TEXT,
+            activity_category TEXT,
+            distance_category TEXT,
+            value REAL,
+            unit TEXT,
+            activity_id INTEGER,
+            activity_name TEXT,
+            record_date TEXT,
+            detected_at TEXT
+        )
+    """)
+    # The dashboard shows the history of one record at a time, newest first
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_personal_records_history_key
+        ON personal_records_history (record_key, record_date)
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS personal_records_processed (
+            activity_id INTEGER PRIMARY KEY
+        )
+    """)
+
+
+def load_new_activities(conn):
+    """Activities from activity_details that no earlier run has considered, oldest first"""
+    return conn.execute("""
+        SELECT activity_id, activity_name, activity_category, distance_category,
+               start_date, distance_km, avg_speed_kmh
+        FROM activity_details
+        WHERE activity_id NOT IN (SELECT activity_id FROM personal_records_processed)
+        ORDER BY start_date, activity_id
+    """).fetchall()
+
+
+def candidate_records(conn, new_activities):
+    """Every record a new activity (or the day it belongs to) could set"""
+    candidates = []
+
+    for activity_id, name, category, distance_category, start_date, distance_km, avg_speed_kmh in new_activities:
+        if distance_km:
+            candidates.append((
+                f"longest_distance|{category}", 'longest_distance', category, None,
+                distance_km, 'km', activity_id, name, start_date
+            ))
+        if avg_speed_kmh and distance_category not in EXCLUDED_DISTANCE_CATEGORIES:
+            candidates.append((
+                f"fastest_speed|{category}|{distance_category}", 'fastest_speed', category, distance_category,
+                avg_speed_kmh, 'km/h', activity_id, name, start_date
+            ))
+
+    # A day's elevation depends on every activity that day, not only the new ones.
+    # activity_details has a row per activity and gear item: count each activity once
+    new_dates = sorted({activity[4] for activity in new_activities})
+    if new_dates:
+        placeholders = ','.join('?' * len(new_dates))
+        for start_date, elevation, activity_id, name in conn.execute(f"""
+            SELECT start_date, SUM(elevation_gain_m), MAX(activity_id), GROUP_CONCAT(activity_name, ' + ')
+            FROM (
+                SELECT DISTINCT activity_id, start_date, elevation_gain_m, activity_name
+                FROM activity_details
+                WHERE start_date IN ({placeholders})
+            )
+            GROUP BY start_date
+            HAVING SUM(elevation_gain_m) > 0
+        """, new_dates):
+            candidates.append((
+                "biggest_elevation_day", 'biggest_elevation_day', 'All', None,
+                elevation, 'm', activity_id, name, start_date
+            ))
+
+    return candidates
+
+
+def update_personal_records(conn):
+    """Apply new activities to the records; returns (activities processed, records set)"""
+    create_record_tables(conn)
+
+    new_activities = load_new_activities(conn)
+    current = {
+        key: value for key, value in conn.execute("SELECT record_key, value FROM personal_records")
+    }
+
+    detected_at = datetime.now().isoformat(timespec='seconds')
+    records_set = 0
+
+    for candidate in candidate_records(conn, new_activities):
+        key, value = candidate[0], candidate[4]
+        if key in current and value <= current[key]:
+            continue
+
+        previous_value = current.get(key)
+        current[key] = value
+        records_set += 1
+
+        conn.execute(
+            "INSERT OR REPLACE INTO personal_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            candidate + (previous_value, detected_at)
+        )
+        conn.execute(
+            "INSERT INTO personal_records_history VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            candidate + (detected_at,)
+        )
+
+    conn.executemany(
+        "INSERT OR IGNORE INTO personal_records_processed (activity_id) VALUES (?)",
+        [(activity[0],) for activity in new_activities]
+    )
+    conn.commit()
+
+    return len(new_activities), records_set
+
+
+if __name__ == "__main__":
+    print(f"🔄 Updating personal records at {datetime.now()}")
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        processed, records_set = update_personal_records(conn)
+    finally:
+        conn.close()
+    print(f"✅ Personal records: {processed} new activities, {records_set} records set")